@@ -0,0 +1,374 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Max, Min, Sum
+from frappe.utils import (
+	add_days,
+	add_months,
+	add_to_date,
+	cstr,
+	flt,
+	get_first_day,
+	get_last_day,
+	getdate,
+	now,
+)
+
+from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
+	get_accounting_dimensions,
+)
+
+BALANCE_FIELDS = ["debit", "credit", "debit_in_account_currency", "credit_in_account_currency"]
+
+GROUP_BY_FIELDS = [
+	"account",
+	"party_type",
+	"party",
+	"cost_center",
+	"project",
+	"finance_book",
+	"is_opening",
+	"is_period_closing_voucher_entry",
+	"account_currency",
+]
+
+# time up to which GL Entries are included in the monthly balances
+PROCESSED_ON_KEY = "account_monthly_balance_processed_on"
+
+# GL Entries modified this long before the previous run are checked again, for the transactions
+# that were not committed yet when it ran
+PROCESSED_ON_OVERLAP_HOURS = 1
+
+
+class AccountMonthlyBalance(Document):
+	pass
+
+
+def update_monthly_balances(gl_entries, sign=1):
+	"""Add the debit and credit of the GL Entries to the balances of their months, or take them off
+	with `sign` -1. Called in the transaction posting or cancelling the entries.
+
+	The changes are appended as new rows, which are merged when the month is rebuilt."""
+	group_by = get_group_by_fields()
+	balances = {}
+
+	for gle in gl_entries:
+		if gle.get("is_cancelled"):
+			continue
+
+		row = {"company": gle.get("company"), "period_start_date": get_first_day(gle.get("posting_date"))}
+		for fieldname in group_by:
+			if fieldname == "is_period_closing_voucher_entry":
+				row[fieldname] = 1 if gle.get("voucher_type") == "Period Closing Voucher" else 0
+			else:
+				row[fieldname] = gle.get(fieldname)
+
+		balance = balances.setdefault(tuple(cstr(value) for value in row.values()), row)
+		for fieldname in BALANCE_FIELDS:
+			balance[fieldname] = flt(balance.get(fieldname)) + sign * flt(gle.get(fieldname))
+
+	insert_monthly_balances(list(balances.values()), group_by)
+
+
+def remove_voucher_from_monthly_balances(voucher_type, voucher_no):
+	"Take the GL Entries of the voucher off the monthly balances, before they are cancelled or deleted"
+	gl_entries = frappe.get_all(
+		"GL Entry",
+		filters={"voucher_type": voucher_type, "voucher_no": voucher_no, "is_cancelled": 0},
+		fields=[
+			"company",
+			"posting_date",
+			"voucher_type",
+			*[
+				fieldname
+				for fieldname in get_group_by_fields()
+				if fieldname != "is_period_closing_voucher_entry"
+			],
+			*BALANCE_FIELDS,
+		],
+	)
+	update_monthly_balances(gl_entries, sign=-1)
+
+
+def update_account_monthly_balances():
+	"""Scheduled hourly, rebuilds the months with GL Entries posted or cancelled since the previous
+	run, merging the rows added on posting. The balances of all the months are built on the first
+	run."""
+	processed_on = now()
+
+	last_processed_on = frappe.db.get_global(PROCESSED_ON_KEY)
+	if last_processed_on:
+		for company, period_start_date in get_months_to_rebuild(last_processed_on):
+			rebuild_account_monthly_balance(company, period_start_date)
+	else:
+		rebuild_account_monthly_balances()
+
+	frappe.db.set_global(PROCESSED_ON_KEY, processed_on)
+
+
+def get_months_to_rebuild(last_processed_on):
+	"Months of the GL Entries posted or cancelled since `last_processed_on`, by company"
+	gle = frappe.qb.DocType("GL Entry")
+
+	query = (
+		frappe.qb.from_(gle)
+		.select(gle.company, gle.posting_date)
+		.distinct()
+		.where(gle.modified > add_to_date(last_processed_on, hours=-PROCESSED_ON_OVERLAP_HOURS))
+	)
+
+	return sorted({(company_name, get_first_day(date)) for company_name, date in query.run()})
+
+
+def rebuild_account_monthly_balances(company=None):
+	for company_name, months in get_months(company).items():
+		for period_start_date in months:
+			rebuild_account_monthly_balance(company_name, period_start_date)
+
+
+def rebuild_account_monthly_balance(company, period_start_date):
+	"""Replace the rows of the month by the balances of its GL Entries.
+
+	Only the rows read along with the GL Entries are deleted, rows added by entries posted in the
+	meantime are kept as the entries are not part of the rebuilt balances either."""
+	period_start_date = getdate(period_start_date)
+	saved_rows = frappe.get_all(
+		"Account Monthly Balance",
+		filters={"company": company, "period_start_date": period_start_date},
+		pluck="name",
+	)
+
+	group_by = get_group_by_fields()
+	rows = get_gl_balances(company, period_start_date, get_last_day(period_start_date), group_by)
+
+	if saved_rows:
+		frappe.db.delete("Account Monthly Balance", {"name": ("in", saved_rows)})
+
+	for row in rows:
+		row.update({"company": company, "period_start_date": period_start_date})
+
+	insert_monthly_balances(rows, group_by)
+
+
+def insert_monthly_balances(rows, group_by):
+	if not rows:
+		return
+
+	timestamp = now()
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"company",
+		"period_start_date",
+		*group_by,
+		*BALANCE_FIELDS,
+	]
+
+	values = [
+		(
+			frappe.generate_hash(length=10),
+			timestamp,
+			timestamp,
+			frappe.session.user,
+			frappe.session.user,
+			row.get("company"),
+			row.get("period_start_date"),
+			*[row.get(fieldname) for fieldname in group_by],
+			*[flt(row.get(fieldname)) for fieldname in BALANCE_FIELDS],
+		)
+		for row in rows
+	]
+
+	frappe.db.bulk_insert("Account Monthly Balance", fields=fields, values=values)
+
+
+def get_months(company=None):
+	"""First days of the months with GL Entries or monthly balances, by company"""
+	months = {}
+
+	for doctype, date_field in (
+		("GL Entry", "posting_date"),
+		("Account Monthly Balance", "period_start_date"),
+	):
+		table = frappe.qb.DocType(doctype)
+		query = (
+			frappe.qb.from_(table)
+			.select(table.company, Min(table[date_field]), Max(table[date_field]))
+			.groupby(table.company)
+		)
+		if company:
+			query = query.where(table.company == company)
+
+		for company_name, from_date, to_date in query.run():
+			month = get_first_day(from_date)
+			while month <= getdate(to_date):
+				months.setdefault(company_name, set()).add(month)
+				month = add_months(month, 1)
+
+	return {company_name: sorted(company_months) for company_name, company_months in months.items()}
+
+
+def get_group_by_fields():
+	return GROUP_BY_FIELDS + get_accounting_dimensions()
+
+
+def get_gl_balances(company, from_date, to_date, group_by, filters=None):
+	"Debit and credit of the GL Entries of the company posted between the dates, by `group_by`"
+	gle = frappe.qb.DocType("GL Entry")
+
+	columns = []
+	for fieldname in group_by:
+		if fieldname == "is_period_closing_voucher_entry":
+			columns.append(
+				Case().when(gle.voucher_type == "Period Closing Voucher", 1).else_(0).as_(fieldname)
+			)
+		else:
+			columns.append(gle[fieldname])
+
+	query = (
+		frappe.qb.from_(gle)
+		.select(*columns, *[Sum(gle[fieldname]).as_(fieldname) for fieldname in BALANCE_FIELDS])
+		.where((gle.company == company) & (gle.is_cancelled == 0))
+		.groupby(*columns)
+	)
+	if from_date:
+		query = query.where(gle.posting_date >= from_date)
+	if to_date:
+		query = query.where(gle.posting_date <= to_date)
+
+	for fieldname, value in (filters or {}).items():
+		if fieldname == "is_period_closing_voucher_entry":
+			field = Case().when(gle.voucher_type == "Period Closing Voucher", 1).else_(0)
+		else:
+			field = gle[fieldname]
+		query = query.where(get_filter_condition(field, value))
+
+	return query.run(as_dict=True)
+
+
+def get_filter_condition(field, value):
+	"Condition for a value or a list of values of the field, None in the list matches unset values"
+	if not isinstance(value, list | tuple | set):
+		return field == value
+
+	values = [d for d in value if d is not None]
+	condition = field.isin(values) if values else None
+	if len(values) != len(value):
+		condition = field.isnull() if condition is None else (condition | field.isnull())
+
+	return condition
+
+
+def get_saved_balances(company, to_date, group_by, filters=None, from_date=None):
+	"Debit and credit of the monthly balances of the company, by `group_by`"
+	amb = frappe.qb.DocType("Account Monthly Balance")
+
+	query = (
+		frappe.qb.from_(amb)
+		.select(
+			*[amb[fieldname] for fieldname in group_by],
+			*[Sum(amb[fieldname]).as_(fieldname) for fieldname in BALANCE_FIELDS],
+		)
+		.where((amb.company == company) & (amb.period_start_date <= to_date))
+		.groupby(*[amb[fieldname] for fieldname in group_by])
+	)
+	if from_date:
+		query = query.where(amb.period_start_date >= from_date)
+
+	for fieldname, value in (filters or {}).items():
+		query = query.where(get_filter_condition(amb[fieldname], value))
+
+	return query.run(as_dict=True)
+
+
+def get_account_balances(company, to_date, group_by=("account",), filters=None, from_date=None):
+	"""Debit and credit of the GL Entries of the company posted before `to_date`, and on or after
+	`from_date` if given, for the openings of reports.
+
+	Returns a row per combination of the `group_by` fields, with the totals of `BALANCE_FIELDS`.
+	`filters` are values or lists of values of the fields of Account Monthly Balance. Whole months
+	are read from the monthly balances, the days of the months of `from_date` and `to_date` are
+	read from GL Entry. Everything is read from GL Entry until the balances are built.
+	"""
+	to_date = getdate(to_date)
+	from_date = getdate(from_date) if from_date else None
+	group_by = list(group_by)
+
+	balances = {}
+
+	def add_rows(rows):
+		for row in rows:
+			key = tuple(cstr(row.get(fieldname)) for fieldname in group_by)
+			balance = balances.setdefault(
+				key, frappe._dict({fieldname: row.get(fieldname) for fieldname in group_by})
+			)
+			for fieldname in BALANCE_FIELDS:
+				balance[fieldname] = flt(balance.get(fieldname)) + flt(row.get(fieldname))
+
+	if frappe.db.get_global(PROCESSED_ON_KEY):
+		month_start = get_first_day(to_date)
+		periods = [(max(from_date, month_start) if from_date else month_start, add_days(to_date, -1))]
+
+		saved_from_date = get_first_day(from_date) if from_date else None
+		if from_date and from_date != saved_from_date:
+			periods.append((from_date, min(get_last_day(from_date), add_days(month_start, -1))))
+			saved_from_date = add_months(saved_from_date, 1)
+
+		if not saved_from_date or saved_from_date < month_start:
+			add_rows(
+				get_saved_balances(
+					company, add_days(month_start, -1), group_by, filters, from_date=saved_from_date
+				)
+			)
+	else:
+		periods = [(from_date, add_days(to_date, -1))]
+
+	for period_from_date, period_to_date in periods:
+		if period_from_date and period_from_date > period_to_date:
+			continue
+
+		add_rows(get_gl_balances(company, period_from_date, period_to_date, group_by, filters))
+
+	return list(balances.values())
+
+
+def reconcile_account_monthly_balances(company=None, from_date=None, repair=False):
+	"""Compare the monthly balances with the GL Entries, month by month from `from_date`.
+
+	Returns the months that differ as (company, period start date), these are rebuilt if `repair`.
+	"""
+	group_by = get_group_by_fields()
+	precision = frappe.get_precision("GL Entry", "debit") or 2
+	mismatches = []
+
+	def get_balance_map(rows):
+		balance_map = {}
+		for row in rows:
+			amounts = tuple(flt(row.get(fieldname), precision) for fieldname in BALANCE_FIELDS)
+			if any(amounts):
+				balance_map[tuple(cstr(row.get(fieldname)) for fieldname in group_by)] = amounts
+
+		return balance_map
+
+	from_date = get_first_day(from_date) if from_date else None
+
+	for company_name, months in get_months(company).items():
+		for month in months:
+			if from_date and month < from_date:
+				continue
+
+			expected = get_balance_map(get_gl_balances(company_name, month, get_last_day(month), group_by))
+			saved = get_balance_map(get_saved_balances(company_name, month, group_by, from_date=month))
+
+			if expected != saved:
+				mismatches.append((company_name, month))
+				if repair:
+					rebuild_account_monthly_balance(company_name, month)
+
+	return mismatches
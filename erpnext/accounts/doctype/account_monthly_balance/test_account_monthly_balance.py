@@ -0,0 +1,95 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, add_months, flt, get_first_day, getdate, today
+
+from erpnext.accounts.doctype.account_monthly_balance.account_monthly_balance import (
+	get_account_balances,
+	get_gl_balances,
+	reconcile_account_monthly_balances,
+	update_account_monthly_balances,
+)
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
+
+
+class TestAccountMonthlyBalance(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_account_balances_match_gl_entries(self):
+		"Openings read from the monthly balances match the GL Entries, before and after an update"
+		company = "_Test Company"
+		account = "_Test Bank - _TC"
+		to_date = add_days(get_first_day(today()), 10)
+
+		make_journal_entry(account, "Sales - _TC", 100, posting_date=add_months(to_date, -2), submit=True)
+		make_journal_entry(account, "Sales - _TC", 50, posting_date=add_months(to_date, -1), submit=True)
+		update_account_monthly_balances()
+
+		jv = make_journal_entry(account, "Sales - _TC", 30, posting_date=add_months(to_date, -1), submit=True)
+		make_journal_entry(account, "Sales - _TC", 20, posting_date=add_days(to_date, -2), submit=True)
+		self.assert_balance(company, account, to_date)
+
+		# monthly balances are updated as the entries are posted
+		self.assertFalse(reconcile_account_monthly_balances(company, add_months(to_date, -2)))
+
+		update_account_monthly_balances()
+		self.assert_balance(company, account, to_date)
+
+		# cancelled entries are removed from the month they were posted in
+		jv.cancel()
+		self.assert_balance(company, account, to_date)
+		self.assertFalse(reconcile_account_monthly_balances(company, add_months(to_date, -2)))
+
+		update_account_monthly_balances()
+		self.assertFalse(reconcile_account_monthly_balances(company, add_months(to_date, -2)))
+
+		# balances between two dates in the middle of months
+		from_date = add_days(add_months(to_date, -2), 5)
+		rows = get_account_balances(company, to_date, filters={"account": account}, from_date=from_date)
+		gl_rows = get_gl_balances(
+			company, from_date, add_days(to_date, -1), ["account"], {"account": account}
+		)
+		self.assertEqual(
+			sum(row.debit - row.credit for row in rows), sum(row.debit - row.credit for row in gl_rows)
+		)
+
+	def test_trial_balance_opening_from_monthly_balances(self):
+		"Trial Balance openings read from the monthly balances match the ones read from GL Entry"
+		from erpnext.accounts.report.trial_balance.trial_balance import (
+			get_opening_balance,
+			get_opening_balance_from_monthly_balances,
+		)
+
+		make_journal_entry(
+			"_Test Bank - _TC", "Sales - _TC", 100, posting_date=add_months(today(), -1), submit=True
+		)
+		update_account_monthly_balances()
+
+		filters = frappe._dict(
+			company="_Test Company",
+			from_date=add_days(get_first_day(today()), 3),
+			year_start_date=getdate(add_months(today(), -12)),
+		)
+		for report_type in ("Balance Sheet", "Profit and Loss"):
+			self.assertEqual(
+				self.get_opening(get_opening_balance_from_monthly_balances(filters, report_type, [])),
+				self.get_opening(get_opening_balance("GL Entry", filters, report_type, [])),
+			)
+
+	def get_opening(self, rows):
+		opening = {}
+		for row in rows:
+			opening[row.account] = flt(opening.get(row.account)) + flt(row.debit) - flt(row.credit)
+
+		return {account: flt(balance, 2) for account, balance in opening.items() if flt(balance, 2)}
+
+	def assert_balance(self, company, account, to_date):
+		rows = get_account_balances(company, to_date, filters={"account": account})
+		gl_rows = get_gl_balances(company, None, add_days(to_date, -1), ["account"], {"account": account})
+
+		self.assertEqual(
+			sum(row.debit - row.credit for row in rows), sum(row.debit - row.credit for row in gl_rows)
+		)
@@ -3,9 +3,11 @@
 
 
 import unittest
+from unittest.mock import patch
 
 import frappe
 from frappe.model.naming import parse_naming_series
+from frappe.tests.utils import change_settings
 
 from erpnext.accounts.doctype.gl_entry.gl_entry import rename_gle_sle_docs
 from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
@@ -79,3 +81,60 @@ class TestGLEntry(unittest.TestCase):
 			"SELECT current from tabSeries where name = %s", naming_series
 		)[0][0]
 		self.assertEqual(old_naming_series_current_value + 2, new_naming_series_current_value)
+
+	@change_settings("Accounts Settings", {"insert_ledger_entries_individually": 0})
+	def test_ledger_entries_inserted_in_bulk(self):
+		"Ledger entries inserted together match the ones inserted individually"
+		from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+		with change_settings("Accounts Settings", {"insert_ledger_entries_individually": 1}):
+			individually = create_sales_invoice(qty=3, rate=150)
+
+		in_bulk = create_sales_invoice(qty=3, rate=150)
+
+		for doctype, fields in (
+			("GL Entry", ["account", "debit", "credit", "fiscal_year", "account_currency", "to_rename"]),
+			("Payment Ledger Entry", ["account", "amount", "against_voucher_no", "delinked"]),
+		):
+			entries = {}
+			for invoice in (individually, in_bulk):
+				entries[invoice.name] = frappe.get_all(
+					doctype,
+					filters={"voucher_no": invoice.name, "docstatus": 1},
+					fields=fields,
+					order_by="account",
+				)
+				for row in entries[invoice.name]:
+					if row.get("against_voucher_no") == invoice.name:
+						row.against_voucher_no = None
+
+			self.assertTrue(entries[in_bulk.name])
+			self.assertEqual(entries[in_bulk.name], entries[individually.name])
+
+		self.assertEqual(
+			frappe.db.get_value("Sales Invoice", in_bulk.name, "outstanding_amount"),
+			frappe.db.get_value("Sales Invoice", individually.name, "outstanding_amount"),
+		)
+
+	def test_ledger_entries_in_bulk_validations(self):
+		from erpnext.accounts.general_ledger import (
+			insert_ledger_entries_in_bulk,
+			validate_account_details,
+			validate_links,
+		)
+
+		gle = frappe._dict(
+			account="_Test Bank - _TC",
+			cost_center="_Test Missing Cost Center - _TC",
+			party_type="Customer",
+			party="_Test Customer",
+		)
+		self.assertRaises(frappe.LinkValidationError, validate_links, [gle])
+
+		# account of a payment ledger entry must be of its account type
+		ple = frappe._dict(account="_Test Bank - _TC", account_type="Receivable", company="_Test Company")
+		self.assertRaises(frappe.ValidationError, validate_account_details, [], [ple])
+
+		# hooks for all doctypes need the document events of the ledger entries
+		with patch.object(frappe, "get_hooks", return_value={"*": {"on_submit": "app.on_submit"}}):
+			self.assertFalse(insert_ledger_entries_in_bulk())
@@ -9,10 +9,17 @@ from frappe import _
 from frappe.core.page.background_jobs.background_jobs import get_info
 from frappe.model.document import Document
 from frappe.model.mapper import map_child_doc, map_doc
-from frappe.utils import cint, flt, get_time, getdate, nowdate, nowtime
+from frappe.utils import cint, flt, get_time, getdate, now, nowdate, nowtime
 from frappe.utils.background_jobs import enqueue
 from frappe.utils.scheduler import is_scheduler_inactive
 
+# POS Invoices of a customer are split into merge logs of these many invoices at most,
+# so that the consolidated invoices stay of a size that can be validated and submitted
+MAX_INVOICES_PER_MERGE_LOG = 1000
+
+# merge logs of a closing entry are created by these many jobs in parallel
+MERGE_LOG_JOBS = 4
+
 
 class POSInvoiceMergeLog(Document):
 	def validate(self):
@@ -87,10 +94,10 @@ class POSInvoiceMergeLog(Document):
 					frappe.throw(msg)
 
 	def on_submit(self):
-		pos_invoice_docs = [frappe.get_cached_doc("POS Invoice", d.pos_invoice) for d in self.pos_invoices]
+		pos_invoices = self.get_pos_invoices()
 
-		returns = [d for d in pos_invoice_docs if d.get("is_return") == 1]
-		sales = [d for d in pos_invoice_docs if d.get("is_return") == 0]
+		returns = [d for d in pos_invoices if d.get("is_return") == 1]
+		sales = [d for d in pos_invoices if d.get("is_return") == 0]
 
 		sales_invoice, credit_note = "", ""
 		if returns:
@@ -101,7 +108,17 @@ class POSInvoiceMergeLog(Document):
 
 		self.save()  # save consolidated_sales_invoice & consolidated_credit_note ref in merge log
 
-		self.update_pos_invoices(pos_invoice_docs, sales_invoice, credit_note)
+		self.set_consolidated_invoice(pos_invoices, sales_invoice, credit_note)
+
+	def get_pos_invoices(self):
+		"Values of the POS Invoices, in the order of the table"
+		names = [d.pos_invoice for d in self.pos_invoices]
+		pos_invoices = {
+			d.name: d
+			for d in frappe.get_all("POS Invoice", filters={"name": ("in", names)}, fields=["*"])
+		}
+
+		return [pos_invoices[name] for name in names if name in pos_invoices]
 
 	def on_cancel(self):
 		pos_invoice_docs = [frappe.get_cached_doc("POS Invoice", d.pos_invoice) for d in self.pos_invoices]
@@ -145,7 +162,14 @@ class POSInvoiceMergeLog(Document):
 		return credit_note.name
 
 	def merge_pos_invoice_into(self, invoice, data):
+		"""Merge the POS Invoices into `invoice`.
+
+		Rows of all the invoices are read with one query per table and merged in a single pass, an
+		item, tax or payment row is added to the matching row of an earlier invoice if there is one.
+		"""
 		items, payments, taxes = [], [], []
+		merged_items, merged_payments, merged_taxes = {}, {}, {}
+		header, loyalty_redemption = {}, {}
 
 		loyalty_amount_sum, loyalty_points_sum = 0, 0
 
@@ -154,69 +178,73 @@ class POSInvoiceMergeLog(Document):
 
 		loyalty_amount_sum, loyalty_points_sum, idx = 0, 0, 1
 
+		names = [doc.name for doc in data]
+		item_rows = get_child_rows("POS Invoice Item", names)
+		tax_rows = get_child_rows("Sales Taxes and Charges", names)
+		payment_rows = get_child_rows("Sales Invoice Payment", names)
+
 		for doc in data:
-			map_doc(doc, invoice, table_map={"doctype": invoice.doctype})
+			# values of the later invoices take precedence, as if mapped one after the other
+			header.update({key: value for key, value in doc.items() if value not in (None, "")})
 
 			if doc.redeem_loyalty_points:
-				invoice.loyalty_redemption_account = doc.loyalty_redemption_account
-				invoice.loyalty_redemption_cost_center = doc.loyalty_redemption_cost_center
+				loyalty_redemption = {
+					"loyalty_redemption_account": doc.loyalty_redemption_account,
+					"loyalty_redemption_cost_center": doc.loyalty_redemption_cost_center,
+				}
 				loyalty_points_sum += doc.loyalty_points
 				loyalty_amount_sum += doc.loyalty_amount
 
-			for item in doc.get("items"):
-				found = False
-				for i in items:
-					if (
-						i.item_code == item.item_code
-						and not i.serial_no
-						and not i.batch_no
-						and i.uom == item.uom
-						and i.net_rate == item.net_rate
-						and i.warehouse == item.warehouse
-					):
-						found = True
-						i.qty = i.qty + item.qty
-						i.amount = i.amount + item.net_amount
-						i.net_amount = i.amount
-						i.base_amount = i.base_amount + item.base_net_amount
-						i.base_net_amount = i.base_amount
-
-				if not found:
+			for item in item_rows.get(doc.name, []):
+				key = (item.item_code, item.uom, item.net_rate, item.warehouse)
+				i = merged_items.get(key)
+				if i:
+					i.qty = i.qty + item.qty
+					i.amount = i.amount + item.net_amount
+					i.net_amount = i.amount
+					i.base_amount = i.base_amount + item.base_net_amount
+					i.base_net_amount = i.base_amount
+				else:
 					item.rate = item.net_rate
 					item.amount = item.net_amount
 					item.base_amount = item.base_net_amount
 					item.price_list_rate = 0
-					si_item = map_child_doc(item, invoice, {"doctype": "Sales Invoice Item"})
+					si_item = map_child_doc(
+						frappe.get_doc({**item, "doctype": "POS Invoice Item"}),
+						invoice,
+						{"doctype": "Sales Invoice Item"},
+					)
 					items.append(si_item)
 
-			for tax in doc.get("taxes"):
-				found = False
-				for t in taxes:
-					if t.account_head == tax.account_head and t.cost_center == tax.cost_center:
-						t.tax_amount = flt(t.tax_amount) + flt(tax.tax_amount_after_discount_amount)
-						t.base_tax_amount = flt(t.base_tax_amount) + flt(
-							tax.base_tax_amount_after_discount_amount
-						)
-						update_item_wise_tax_detail(t, tax)
-						found = True
-				if not found:
+					# rows with serial or batch numbers are kept as they are
+					if not si_item.serial_no and not si_item.batch_no:
+						merged_items[key] = si_item
+
+			for tax in tax_rows.get(doc.name, []):
+				t = merged_taxes.get((tax.account_head, tax.cost_center))
+				if t:
+					t.tax_amount = flt(t.tax_amount) + flt(tax.tax_amount_after_discount_amount)
+					t.base_tax_amount = flt(t.base_tax_amount) + flt(
+						tax.base_tax_amount_after_discount_amount
+					)
+					update_item_wise_tax_detail(t, tax)
+				else:
 					tax.charge_type = "Actual"
 					tax.idx = idx
 					idx += 1
 					tax.included_in_print_rate = 0
 					tax.tax_amount = tax.tax_amount_after_discount_amount
 					tax.base_tax_amount = tax.base_tax_amount_after_discount_amount
-					tax.item_wise_tax_detail = tax.item_wise_tax_detail
+					merged_taxes[(tax.account_head, tax.cost_center)] = tax
 					taxes.append(tax)
 
-			for payment in doc.get("payments"):
-				found = False
-				for pay in payments:
-					if pay.account == payment.account and pay.mode_of_payment == payment.mode_of_payment:
-						pay.amount = flt(pay.amount) + flt(payment.amount)
-						pay.base_amount = flt(pay.base_amount) + flt(payment.base_amount)
-						found = True
-				if not found:
+			for payment in payment_rows.get(doc.name, []):
+				pay = merged_payments.get((payment.account, payment.mode_of_payment))
+				if pay:
+					pay.amount = flt(pay.amount) + flt(payment.amount)
+					pay.base_amount = flt(pay.base_amount) + flt(payment.base_amount)
+				else:
+					merged_payments[(payment.account, payment.mode_of_payment)] = payment
 					payments.append(payment)
 
 			rounding_adjustment += doc.rounding_adjustment
@@ -224,6 +252,13 @@ class POSInvoiceMergeLog(Document):
 			base_rounding_adjustment += doc.base_rounding_adjustment
 			base_rounded_total += doc.base_rounded_total
 
+		map_doc(
+			frappe.get_doc({**header, "doctype": "POS Invoice"}),
+			invoice,
+			table_map={"doctype": invoice.doctype},
+		)
+		invoice.update(loyalty_redemption)
+
 		if loyalty_points_sum:
 			invoice.redeem_loyalty_points = 1
 			invoice.loyalty_points = loyalty_points_sum
@@ -258,6 +293,27 @@ class POSInvoiceMergeLog(Document):
 
 		return sales_invoice
 
+	def set_consolidated_invoice(self, pos_invoices, sales_invoice="", credit_note=""):
+		"Link the POS Invoices to the consolidated invoices and set them as Consolidated, together"
+		pos_invoice = frappe.qb.DocType("POS Invoice")
+
+		for is_return, consolidated_invoice in ((0, sales_invoice), (1, credit_note)):
+			names = [d.name for d in pos_invoices if cint(d.is_return) == is_return]
+			if not names:
+				continue
+
+			(
+				frappe.qb.update(pos_invoice)
+				.set(pos_invoice.consolidated_invoice, consolidated_invoice)
+				.set(pos_invoice.status, "Consolidated")
+				.set(pos_invoice.modified, now())
+				.set(pos_invoice.modified_by, frappe.session.user)
+				.where(pos_invoice.name.isin(names))
+			).run()
+
+			for name in names:
+				frappe.clear_document_cache("POS Invoice", name)
+
 	def update_pos_invoices(self, invoice_docs, sales_invoice="", credit_note=""):
 		for doc in invoice_docs:
 			doc.load_from_db()
@@ -280,6 +336,24 @@ class POSInvoiceMergeLog(Document):
 			si.cancel()
 
 
+def get_child_rows(doctype, pos_invoices):
+	"Rows of the child table of the POS Invoices, by invoice in the order of the table"
+	rows = {}
+	for row in frappe.get_all(
+		doctype,
+		filters={"parent": ("in", pos_invoices), "parenttype": "POS Invoice"},
+		fields=["*"],
+		order_by="idx",
+	):
+		parent = row.parent
+		for fieldname in ("name", "parent", "parentfield", "parenttype"):
+			row.pop(fieldname, None)
+
+		rows.setdefault(parent, []).append(row)
+
+	return rows
+
+
 def update_item_wise_tax_detail(consolidate_tax_row, tax_row):
 	consolidated_tax_detail = json.loads(consolidate_tax_row.item_wise_tax_detail)
 	tax_row_detail = json.loads(tax_row.item_wise_tax_detail)
@@ -337,6 +411,10 @@ def consolidate_pos_invoices(pos_invoices=None, closing_entry=None):
 	if frappe.flags.in_test and not invoices:
 		invoices = get_all_unconsolidated_invoices()
 
+	if closing_entry:
+		# invoices consolidated by the jobs that completed before a failure are not merged again
+		invoices = get_unconsolidated_invoices(invoices)
+
 	invoice_by_customer = get_invoice_customer_map(invoices)
 
 	if len(invoices) >= 10 and closing_entry:
@@ -346,6 +424,45 @@ def consolidate_pos_invoices(pos_invoices=None, closing_entry=None):
 		create_merge_logs(invoice_by_customer, closing_entry)
 
 
+def get_unconsolidated_invoices(invoices):
+	consolidated = frappe.get_all(
+		"POS Invoice",
+		filters={"name": ("in", [d.pos_invoice for d in invoices]), "status": "Consolidated"},
+		pluck="name",
+	)
+	if not consolidated:
+		return invoices
+
+	consolidated = set(consolidated)
+	return [d for d in invoices if d.pos_invoice not in consolidated]
+
+
+def get_customer_groups(invoice_by_customer, groups=MERGE_LOG_JOBS):
+	"Split the customers into groups with about as many invoices each, a group is merged by one job"
+	customer_groups = [{} for i in range(groups)]
+	invoice_count = [0] * groups
+
+	for customer, invoices in sorted(invoice_by_customer.items(), key=lambda d: len(d[1]), reverse=True):
+		group = invoice_count.index(min(invoice_count))
+		customer_groups[group][customer] = invoices
+		invoice_count[group] += len(invoices)
+
+	return [d for d in customer_groups if d]
+
+
+def get_merge_log_batches(invoices):
+	"Invoices of a customer in batches of `MAX_INVOICES_PER_MERGE_LOG`, each one merged by a merge log"
+	if len(invoices) <= MAX_INVOICES_PER_MERGE_LOG:
+		return [invoices]
+
+	# sales are merged first, so that returns are merged after the invoices they are made against
+	invoices = sorted(invoices, key=lambda d: cint(d.is_return))
+	return [
+		invoices[i : i + MAX_INVOICES_PER_MERGE_LOG]
+		for i in range(0, len(invoices), MAX_INVOICES_PER_MERGE_LOG)
+	]
+
+
 def unconsolidate_pos_invoices(closing_entry):
 	merge_logs = frappe.get_all(
 		"POS Invoice Merge Log", filters={"pos_closing_entry": closing_entry.name}, pluck="name"
@@ -414,24 +531,23 @@ def create_merge_logs(invoice_by_customer, closing_entry=None):
 	try:
 		for customer, invoices in invoice_by_customer.items():
 			for _invoices in split_invoices(invoices):
-				merge_log = frappe.new_doc("POS Invoice Merge Log")
-				merge_log.posting_date = (
-					getdate(closing_entry.get("posting_date")) if closing_entry else nowdate()
-				)
-				merge_log.posting_time = (
-					get_time(closing_entry.get("posting_time")) if closing_entry else nowtime()
-				)
-				merge_log.customer = customer
-				merge_log.pos_closing_entry = closing_entry.get("name") if closing_entry else None
+				for batch in get_merge_log_batches(_invoices):
+					merge_log = frappe.new_doc("POS Invoice Merge Log")
+					merge_log.posting_date = (
+						getdate(closing_entry.get("posting_date")) if closing_entry else nowdate()
+					)
+					merge_log.posting_time = (
+						get_time(closing_entry.get("posting_time")) if closing_entry else nowtime()
+					)
+					merge_log.customer = customer
+					merge_log.pos_closing_entry = closing_entry.get("name") if closing_entry else None
 
-				merge_log.set("pos_invoices", _invoices)
-				merge_log.save(ignore_permissions=True)
-				merge_log.submit()
+					merge_log.set("pos_invoices", batch)
+					merge_log.save(ignore_permissions=True)
+					merge_log.submit()
 
 		if closing_entry:
-			closing_entry.set_status(update=True, status="Submitted")
-			closing_entry.db_set("error_message", "")
-			closing_entry.update_opening_entry()
+			complete_closing_entry(closing_entry)
 
 	except Exception as e:
 		frappe.db.rollback()
@@ -450,6 +566,30 @@ def create_merge_logs(invoice_by_customer, closing_entry=None):
 		frappe.publish_realtime("closing_process_complete", user=frappe.session.user)
 
 
+def complete_closing_entry(closing_entry):
+	"""Submit the closing entry once all of its invoices are consolidated.
+
+	Customers of a closing entry are merged by parallel jobs, the last job to complete submits it.
+	"""
+	if not frappe.flags.in_test:
+		# merge logs of the other jobs are to be seen by the last job
+		frappe.db.commit()
+
+	status = frappe.db.get_value("POS Closing Entry", closing_entry.name, "status", for_update=True)
+	if status == "Submitted":
+		return
+
+	pending = get_unconsolidated_invoices(
+		[frappe._dict(pos_invoice=d.pos_invoice) for d in closing_entry.get("pos_transactions")]
+	)
+	if pending:
+		return
+
+	closing_entry.set_status(update=True, status="Submitted")
+	closing_entry.db_set("error_message", "")
+	closing_entry.update_opening_entry()
+
+
 def cancel_merge_logs(merge_logs, closing_entry=None):
 	try:
 		for log in merge_logs:
@@ -484,15 +624,25 @@ def enqueue_job(job, **kwargs):
 
 	job_name = closing_entry.get("name")
 	if not job_already_enqueued(job_name):
-		enqueue(
-			job,
-			**kwargs,
-			queue="long",
-			timeout=10000,
-			event="processing_merge_logs",
-			job_name=job_name,
-			now=frappe.conf.developer_mode or frappe.flags.in_test,
-		)
+		if job == create_merge_logs:
+			# customers are merged in parallel, every job has the closing entry as its name
+			jobs = [
+				dict(kwargs, invoice_by_customer=invoice_by_customer)
+				for invoice_by_customer in get_customer_groups(kwargs.get("invoice_by_customer"))
+			]
+		else:
+			jobs = [kwargs]
+
+		for job_kwargs in jobs:
+			enqueue(
+				job,
+				**job_kwargs,
+				queue="long",
+				timeout=10000,
+				event="processing_merge_logs",
+				job_name=job_name,
+				now=frappe.conf.developer_mode or frappe.flags.in_test,
+			)
 
 		if job == create_merge_logs:
 			msg = _("POS Invoices will be consolidated in a background process")
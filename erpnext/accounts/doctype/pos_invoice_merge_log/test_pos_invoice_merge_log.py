@@ -3,6 +3,7 @@
 
 import json
 import unittest
+from unittest.mock import patch
 
 import frappe
 from frappe.tests.utils import change_settings
@@ -10,6 +11,7 @@ from frappe.tests.utils import change_settings
 from erpnext.accounts.doctype.pos_closing_entry.test_pos_closing_entry import init_user_and_profile
 from erpnext.accounts.doctype.pos_invoice.pos_invoice import make_sales_return
 from erpnext.accounts.doctype.pos_invoice.test_pos_invoice import create_pos_invoice
+from erpnext.accounts.doctype.pos_invoice_merge_log import pos_invoice_merge_log
 from erpnext.accounts.doctype.pos_invoice_merge_log.pos_invoice_merge_log import (
 	consolidate_pos_invoices,
 )
@@ -441,3 +443,41 @@ class TestPOSInvoiceMergeLog(unittest.TestCase):
 			frappe.set_user("Administrator")
 			frappe.db.sql("delete from `tabPOS Profile`")
 			frappe.db.sql("delete from `tabPOS Invoice`")
+
+	def test_consolidation_split_into_merge_logs(self):
+		"Invoices of a customer above the size of a merge log are consolidated into several invoices"
+		frappe.db.sql("delete from `tabPOS Invoice`")
+
+		try:
+			init_user_and_profile()
+
+			pos_invoices = []
+			for rate in (100, 200, 300):
+				pos_inv = create_pos_invoice(rate=rate, do_not_submit=1)
+				pos_inv.append(
+					"payments", {"mode_of_payment": "Cash", "account": "Cash - _TC", "amount": rate}
+				)
+				pos_inv.submit()
+				pos_invoices.append(pos_inv)
+
+			with patch.object(pos_invoice_merge_log, "MAX_INVOICES_PER_MERGE_LOG", 2):
+				consolidate_pos_invoices()
+
+			for pos_inv in pos_invoices:
+				pos_inv.load_from_db()
+				self.assertEqual(pos_inv.status, "Consolidated")
+
+			self.assertEqual(pos_invoices[0].consolidated_invoice, pos_invoices[1].consolidated_invoice)
+			self.assertNotEqual(pos_invoices[0].consolidated_invoice, pos_invoices[2].consolidated_invoice)
+
+			consolidated_invoice = frappe.get_doc("Sales Invoice", pos_invoices[0].consolidated_invoice)
+			self.assertEqual(len(consolidated_invoice.items), 2)
+			self.assertEqual(consolidated_invoice.payments[0].amount, 300)
+			self.assertEqual(
+				consolidated_invoice.grand_total, pos_invoices[0].grand_total + pos_invoices[1].grand_total
+			)
+
+		finally:
+			frappe.set_user("Administrator")
+			frappe.db.sql("delete from `tabPOS Profile`")
+			frappe.db.sql("delete from `tabPOS Invoice`")
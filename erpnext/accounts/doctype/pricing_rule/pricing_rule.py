@@ -207,6 +207,16 @@ class PricingRule(Document):
 		if self.mixed_conditions and self.is_recursive:
 			frappe.throw(_("Recursive Discounts with Mixed condition is not supported by the system"))
 
+	def on_update(self):
+		from erpnext.accounts.doctype.pricing_rule.utils import clear_pricing_rule_index
+
+		clear_pricing_rule_index()
+
+	def on_trash(self):
+		from erpnext.accounts.doctype.pricing_rule.utils import clear_pricing_rule_index
+
+		clear_pricing_rule_index()
+
 
 # --------------------------------------------------------------------------------
 
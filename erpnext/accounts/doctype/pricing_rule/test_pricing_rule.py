@@ -3,10 +3,12 @@
 
 
 import unittest
+from unittest.mock import patch
 
 import frappe
 from frappe.tests.utils import FrappeTestCase, change_settings
 
+from erpnext.accounts.doctype.pricing_rule.utils import clear_pricing_rule_index
 from erpnext.accounts.doctype.purchase_invoice.test_purchase_invoice import make_purchase_invoice
 from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
 from erpnext.controllers.sales_and_purchase_return import make_return_doc
@@ -99,6 +101,8 @@ class TestPricingRule(FrappeTestCase):
 		frappe.db.sql("update `tabPricing Rule` set priority=NULL where campaign='_Test Campaign'")
 		from erpnext.accounts.doctype.pricing_rule.utils import MultiplePricingRuleConflict
 
+		clear_pricing_rule_index()
+
 		self.assertRaises(MultiplePricingRuleConflict, get_item_details, args)
 
 		args.item_code = "_Test Item 2"
@@ -1169,6 +1173,62 @@ class TestPricingRule(FrappeTestCase):
 		debit_note.delete()
 		pi.cancel()
 
+	def test_pricing_rule_index(self):
+		from erpnext.accounts.doctype.pricing_rule.utils import _get_pricing_rules, get_pricing_rule_index
+
+		item_code_rule = make_pricing_rule(
+			selling=1, discount_percentage=10, title="_Test Pricing Rule Index 1"
+		)
+		item_group_rule = make_pricing_rule(
+			selling=1,
+			priority=2,
+			discount_percentage=20,
+			apply_on="Item Group",
+			item_group="_Test Item Group",
+			title="_Test Pricing Rule Index 2",
+		)
+		make_pricing_rule(buying=1, discount_percentage=30, title="_Test Pricing Rule Index 3")
+		disabled_rule = make_pricing_rule(
+			selling=1, discount_percentage=40, title="_Test Pricing Rule Index 4"
+		)
+		disabled_rule.db_set("disable", 1)
+
+		args = frappe._dict(
+			{
+				"item_code": "_Test Item",
+				"item_group": "_Test Item Group",
+				"company": "_Test Company",
+				"price_list": "_Test Price List",
+				"transaction_type": "selling",
+				"doctype": "Sales Invoice",
+				"transaction_date": frappe.utils.nowdate(),
+			}
+		)
+
+		self.assertTrue(get_pricing_rule_index()["transaction_types"]["selling"])
+
+		# buying and disabled rules are not applied
+		for apply_on, rule in (("Item Code", item_code_rule), ("Item Group", item_group_rule)):
+			self.assertEqual(
+				[d.name for d in _get_pricing_rules(apply_on, frappe._dict(args), {})], [rule.name]
+			)
+
+		# selling rules do not apply to buying transactions
+		buying_args = frappe._dict(args, transaction_type="buying", doctype="Purchase Invoice")
+		self.assertFalse(_get_pricing_rules("Item Group", buying_args, {}))
+
+		# the index is read once per request
+		with patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+			get_pricing_rule_index()
+			self.assertEqual(sql.call_count, 0)
+
+		# rules removed without going through the controller are not served from the index in the
+		# next request
+		for doctype in ["Pricing Rule", "Pricing Rule Item Code", "Pricing Rule Item Group"]:
+			frappe.db.sql(f"delete from `tab{doctype}`")
+		frappe.flags.pricing_rule_index = None
+		self.assertFalse(_get_pricing_rules("Item Code", frappe._dict(args), {}))
+
 
 test_dependencies = ["Campaign"]
 
@@ -1245,6 +1305,8 @@ def delete_existing_pricing_rules():
 	]:
 		frappe.db.sql(f"delete from `tab{doctype}`")
 
+	clear_pricing_rule_index()
+
 
 def make_item_price(item, price_list_name, item_price):
 	frappe.get_doc(
@@ -10,7 +10,7 @@ import math
 
 import frappe
 from frappe import _, bold
-from frappe.utils import cint, flt, fmt_money, get_link_to_form, getdate, today
+from frappe.utils import cint, cstr, flt, fmt_money, get_link_to_form, getdate, today
 
 from erpnext.setup.doctype.item_group.item_group import get_child_item_groups
 from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
@@ -30,12 +30,27 @@ class MultiplePricingRuleConflict(frappe.ValidationError):
 
 apply_on_table = {"Item Code": "items", "Item Group": "item_groups", "Brand": "brands", "Batch No": "apply_rule_on_batch"}
 
+PRICING_RULE_INDEX_KEY = "pricing_rule_index"
+
+SELLING_DOCTYPES = [
+	"Quotation",
+	"Quotation Item",
+	"Sales Order",
+	"Sales Order Item",
+	"Delivery Note",
+	"Delivery Note Item",
+	"Sales Invoice",
+	"Sales Invoice Item",
+	"POS Invoice",
+	"POS Invoice Item",
+]
+
 
 def get_pricing_rules(args, doc=None, returnAll=False):
 	pricing_rules = []
 	values = {}
 
-	if not frappe.db.exists("Pricing Rule", {"disable": 0, args.transaction_type: 1}):
+	if not get_pricing_rule_index()["transaction_types"].get(args.transaction_type):
 		return []
 
 	for apply_on in ["Item Code", "Item Group", "Brand", "Batch No"]:
@@ -129,85 +144,201 @@ def filter_pricing_rule_based_on_condition(pricing_rules, doc=None, args = None)
 
 
 def _get_pricing_rules(apply_on, args, values):
+	"""Get candidate pricing rules for the `apply_on` value of the item, from the cached index."""
 	apply_on_field = frappe.scrub(apply_on)
 
 	if not args.get(apply_on_field):
 		return []
 
-	child_doc = "`tabPricing Rule {0}`".format(apply_on)
-
-	conditions = item_variant_condition = item_conditions = ""
-	values[apply_on_field] = args.get(apply_on_field)
-	if apply_on_field in ["item_code", "brand", "batch_no"]:
-		item_conditions = "{child_doc}.{apply_on_field}= %({apply_on_field})s".format(
-			child_doc=child_doc, apply_on_field=apply_on_field
-		)
-
-		if apply_on_field == "item_code":
-			if args.get("uom", None):
-				item_conditions += (
-					" and ({child_doc}.uom='{item_uom}' or IFNULL({child_doc}.uom, '')='')".format(
-						child_doc=child_doc, item_uom=args.get("uom")
-					)
-				)
-			if "variant_of" not in args:
-				args.variant_of = frappe.get_cached_value("Item", args.item_code, "variant_of")
-
-			if args.variant_of:
-				item_variant_condition = f" or {child_doc}.item_code=%(variant_of)s "
-				values["variant_of"] = args.variant_of
-	elif apply_on_field == "item_group":
-		item_conditions = _get_tree_conditions(args, "Item Group", child_doc, False)
-		if args.get("uom", None):
-			item_conditions += (
-				" and ({child_doc}.uom='{item_uom}' or IFNULL({child_doc}.uom, '')='')".format(
-					child_doc=child_doc, item_uom=args.get("uom")
-				)
-			)
-	conditions += get_other_conditions(conditions, values, args)
-	warehouse_conditions = _get_tree_conditions(args, "Warehouse", "`tabPricing Rule`")
-	if warehouse_conditions:
-		warehouse_conditions = f" and {warehouse_conditions}"
+	if "variant_of" not in args and apply_on_field == "item_code":
+		args.variant_of = frappe.get_cached_value("Item", args.item_code, "variant_of")
 
 	if not args.price_list:
 		args.price_list = None
 
-	conditions += " and ifnull(`tabPricing Rule`.for_price_list, '') in (%(price_list)s, '')"
-	values["price_list"] = args.get("price_list")
-
-	pricing_rules = (
-		frappe.db.sql(
-			"""select `tabPricing Rule`.*,
-			{child_doc}.{apply_on_field}, {child_doc}.uom
-		from `tabPricing Rule`, {child_doc}
-		where ({item_conditions} or (`tabPricing Rule`.apply_rule_on_other is not null
-			and `tabPricing Rule`.{apply_on_other_field}=%({apply_on_field})s) {item_variant_condition})
-			and {child_doc}.parent = `tabPricing Rule`.name
-			and `tabPricing Rule`.disable = 0 and
-			`tabPricing Rule`.{transaction_type} = 1 {warehouse_cond} {conditions}
-		order by `tabPricing Rule`.priority desc,
-			`tabPricing Rule`.name desc""".format(
-				child_doc=child_doc,
-				apply_on_field=apply_on_field,
-				item_conditions=item_conditions,
-				item_variant_condition=item_variant_condition,
-				transaction_type=args.transaction_type,
-				warehouse_cond=warehouse_conditions,
-				apply_on_other_field=f"other_{apply_on_field}",
-				conditions=conditions,
-			),
-			values,
-			as_dict=1,
-		)
-		or []
-	)
+	index = get_pricing_rule_index()
+	rules = index["rules"]
+	value = args.get(apply_on_field)
+
+	if apply_on_field == "item_group":
+		matching_values = _get_tree_values(args, "Item Group")
+	else:
+		matching_values = [value]
+
+	if apply_on_field == "item_code" and args.variant_of:
+		matching_values.append(args.variant_of)
+
+	apply_on_rows = index["apply_on"].get(apply_on_field, {})
+	candidates = {}
+	for matching_value in matching_values:
+		for row in apply_on_rows.get(matching_value, []):
+			candidates[row.name] = row
+
+	# rules applied based on other field, matches every row of the rule
+	for rule_name in index["other"].get(apply_on_field, {}).get(value, []):
+		for row in index["rows"][apply_on_field].get(rule_name, []):
+			candidates[row.name] = row
+
+	conditions = _get_rule_conditions(args)
+
+	pricing_rules = []
+	for row in candidates.values():
+		rule = rules[row.parent]
+		if not _is_matching_row(rule, row, apply_on_field, args, value, matching_values):
+			continue
+
+		if not all(condition(rule) for condition in conditions):
+			continue
+
+		pricing_rule = frappe._dict(rule)
+		pricing_rule.update({apply_on_field: row.get(apply_on_field), "uom": row.uom})
+		pricing_rules.append(pricing_rule)
+
+	pricing_rules.sort(key=lambda d: (cstr(d.priority), d.name), reverse=True)
+
 	for rule in pricing_rules:
 		if rule[apply_on_field] != args[apply_on_field]:
-			rule['apply_on_rule'] = True
+			rule["apply_on_rule"] = True
 
 	return pricing_rules
 
 
+def _is_matching_row(rule, row, apply_on_field, args, value, matching_values):
+	"""Whether the child row (or the apply rule on other field) of the rule matches the item in `args`"""
+	uom_matches = not args.get("uom") or cstr(row.uom) in ("", args.get("uom"))
+	row_value = row.get(apply_on_field)
+
+	if apply_on_field == "item_group":
+		if row_value in matching_values and uom_matches:
+			return True
+	elif row_value == value and (apply_on_field != "item_code" or uom_matches):
+		return True
+
+	if rule.apply_rule_on_other is not None and rule.get(f"other_{apply_on_field}") == value:
+		return True
+
+	return apply_on_field == "item_code" and args.variant_of and row_value == args.variant_of
+
+
+def _get_rule_conditions(args):
+	"""Rule level conditions a pricing rule must pass for the transaction in `args`"""
+
+	def in_values(field, values):
+		return lambda rule: cstr(rule.get(field)) in values
+
+	conditions = [
+		lambda rule: cint(rule.get(args.transaction_type)),
+		in_values("for_price_list", (args.get("price_list"), "")),
+	]
+
+	for field in ["company", "customer", "supplier", "modality", "campaign", "sales_partner"]:
+		conditions.append(in_values(field, (args.get(field), "") if args.get(field) else ("",)))
+
+	for parenttype in ["Warehouse", "Customer Group", "Territory", "Supplier Group"]:
+		parent_groups = _get_tree_values(args, parenttype)
+		if parent_groups:
+			conditions.append(in_values(frappe.scrub(parenttype), set([*parent_groups, ""])))
+
+	if args.get("transaction_date"):
+		transaction_date = getdate(args.get("transaction_date"))
+		conditions.append(
+			lambda rule: getdate(rule.valid_from or "2000-01-01")
+			<= transaction_date
+			<= getdate(rule.valid_upto or "2500-12-31")
+		)
+
+	if args.get("doctype") in SELLING_DOCTYPES:
+		conditions.append(lambda rule: cint(rule.selling) == 1)
+	else:
+		conditions.append(lambda rule: cint(rule.buying) == 1)
+
+	return conditions
+
+
+def get_pricing_rule_index():
+	"""Enabled pricing rules indexed by their apply on values, cached for the site and memoized for
+	the request.
+
+	Cleared whenever a Pricing Rule or Promotional Scheme is updated or deleted. Rules changed
+	without going through the controller (direct sql, rollbacks) are caught by the stamp check on
+	the next request.
+
+	:Data Structure:
+
+	{
+	        "rules": {pricing_rule: {...}},
+	        "rows": {apply_on_field: {pricing_rule: [child rows]}},
+	        "apply_on": {apply_on_field: {value: [child rows]}},
+	        "other": {apply_on_field: {other_value: [pricing_rule, ...]}},
+	        "transaction_types": {"selling": True, "buying": False},
+	        "stamp": (count, last_modified),
+	}
+	"""
+	if frappe.flags.pricing_rule_index:
+		return frappe.flags.pricing_rule_index
+
+	stamp = get_pricing_rule_stamp()
+	index = frappe.cache().get_value(PRICING_RULE_INDEX_KEY)
+
+	if not index or index.get("stamp") != stamp:
+		index = build_pricing_rule_index()
+		index["stamp"] = stamp
+		frappe.cache().set_value(PRICING_RULE_INDEX_KEY, index)
+
+	frappe.flags.pricing_rule_index = index
+	return index
+
+
+def get_pricing_rule_stamp():
+	count, last_modified = frappe.db.sql("select count(*), max(modified) from `tabPricing Rule`")[0]
+	return (cint(count), str(last_modified))
+
+
+def build_pricing_rule_index():
+	rules = {d.name: d for d in frappe.db.sql("select * from `tabPricing Rule` where disable = 0", as_dict=1)}
+
+	index = {
+		"rules": rules,
+		"rows": {},
+		"apply_on": {},
+		"other": {},
+		"transaction_types": {
+			transaction_type: any(cint(rule.get(transaction_type)) for rule in rules.values())
+			for transaction_type in ("selling", "buying")
+		},
+	}
+
+	for apply_on in ["Item Code", "Item Group", "Brand", "Batch No"]:
+		child_doctype = f"Pricing Rule {apply_on}"
+		if not frappe.db.table_exists(child_doctype):
+			continue
+
+		apply_on_field = frappe.scrub(apply_on)
+		rows = index["rows"].setdefault(apply_on_field, {})
+		apply_on_rows = index["apply_on"].setdefault(apply_on_field, {})
+		other_rules = index["other"].setdefault(apply_on_field, {})
+
+		for row in frappe.db.sql(
+			f"select name, parent, {apply_on_field}, uom from `tab{child_doctype}`", as_dict=1
+		):
+			if row.parent not in rules:
+				continue
+
+			rows.setdefault(row.parent, []).append(row)
+			apply_on_rows.setdefault(row.get(apply_on_field), []).append(row)
+
+		for rule in rules.values():
+			if rule.apply_rule_on_other is not None and rule.get(f"other_{apply_on_field}"):
+				other_rules.setdefault(rule.get(f"other_{apply_on_field}"), []).append(rule.name)
+
+	return index
+
+
+def clear_pricing_rule_index():
+	frappe.flags.pricing_rule_index = None
+	frappe.cache().delete_value(PRICING_RULE_INDEX_KEY)
+
+
 def apply_multiple_pricing_rules(pricing_rules):
 	apply_multiple_rule = [
 		d.apply_multiple_pricing_rules for d in pricing_rules if d.apply_multiple_pricing_rules
@@ -219,6 +350,50 @@ def apply_multiple_pricing_rules(pricing_rules):
 	return True
 
 
+def _get_tree_values(args, parenttype):
+	"""Value of `parenttype` field in args along with all its parents"""
+	field = frappe.scrub(parenttype)
+	if not args.get(field):
+		return []
+
+	if not frappe.flags.tree_values:
+		frappe.flags.tree_values = {}
+
+	key = (parenttype, args.get(field))
+	if key not in frappe.flags.tree_values:
+		frappe.flags.tree_values[key] = _get_parent_groups(args, parenttype, field)
+
+	return list(frappe.flags.tree_values[key])
+
+
+def _get_parent_groups(args, parenttype, field):
+	try:
+		lft, rgt = frappe.db.get_value(parenttype, args.get(field), ["lft", "rgt"])
+	except TypeError:
+		frappe.throw(_("Invalid {0}").format(args.get(field)))
+
+	parent_groups = frappe.db.sql_list(
+		"""select name from `tab{}`
+		where lft<={} and rgt>={}""".format(parenttype, "%s", "%s"),
+		(lft, rgt),
+	)
+
+	if parenttype in ["Customer Group", "Item Group", "Territory"]:
+		parent_field = f"parent_{frappe.scrub(parenttype)}"
+		root_name = frappe.db.get_list(
+			parenttype,
+			{"is_group": 1, parent_field: ("is", "not set")},
+			"name",
+			as_list=1,
+			ignore_permissions=True,
+		)
+
+		if root_name and root_name[0][0]:
+			parent_groups.append(root_name[0][0])
+
+	return parent_groups
+
+
 def _get_tree_conditions(args, parenttype, table, allow_blank=True):
 	field = frappe.scrub(parenttype)
 	condition = ""
@@ -229,29 +404,7 @@ def _get_tree_conditions(args, parenttype, table, allow_blank=True):
 		if key in frappe.flags.tree_conditions:
 			return frappe.flags.tree_conditions[key]
 
-		try:
-			lft, rgt = frappe.db.get_value(parenttype, args.get(field), ["lft", "rgt"])
-		except TypeError:
-			frappe.throw(_("Invalid {0}").format(args.get(field)))
-
-		parent_groups = frappe.db.sql_list(
-			"""select name from `tab{}`
-			where lft<={} and rgt>={}""".format(parenttype, "%s", "%s"),
-			(lft, rgt),
-		)
-
-		if parenttype in ["Customer Group", "Item Group", "Territory"]:
-			parent_field = f"parent_{frappe.scrub(parenttype)}"
-			root_name = frappe.db.get_list(
-				parenttype,
-				{"is_group": 1, parent_field: ("is", "not set")},
-				"name",
-				as_list=1,
-				ignore_permissions=True,
-			)
-
-			if root_name and root_name[0][0]:
-				parent_groups.append(root_name[0][0])
+		parent_groups = _get_tree_values(args, parenttype)
 
 		if parent_groups:
 			if allow_blank:
@@ -282,18 +435,7 @@ def get_other_conditions(conditions, values, args):
 			and ifnull(`tabPricing Rule`.valid_upto, '2500-12-31')"""
 		values["transaction_date"] = args.get("transaction_date")
 
-	if args.get("doctype") in [
-		"Quotation",
-		"Quotation Item",
-		"Sales Order",
-		"Sales Order Item",
-		"Delivery Note",
-		"Delivery Note Item",
-		"Sales Invoice",
-		"Sales Invoice Item",
-		"POS Invoice",
-		"POS Invoice Item",
-	]:
+	if args.get("doctype") in SELLING_DOCTYPES:
 		conditions += """ and ifnull(`tabPricing Rule`.selling, 0) = 1"""
 	else:
 		conditions += """ and ifnull(`tabPricing Rule`.buying, 0) = 1"""
@@ -24,6 +24,9 @@ from erpnext.accounts.report.accounts_receivable_summary.accounts_receivable_sum
 from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
 	execute as get_outstanding,
 )
+from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
+	execute_by_party as get_outstanding_by_party,
+)
 from erpnext.accounts.report.general_ledger.general_ledger import execute as get_soa
 
 from fxnmrnth.fxnmrnth.doctype.statement_of_account.statement_of_account import create_statement
@@ -64,7 +67,18 @@ def get_report_pdf(doc, consolidated=True, customer=None):
 
 	i=0
 	numberOfCustomers = len(doc.customers)
-	for entry in doc.customers:
+
+	# Bulk Run: read the ledger once, party by party, instead of once per customer.
+	# Statements are built in the order parties are read, so only one party is held at a time
+	customers = doc.customers
+	outstanding_by_customer = None
+	if not customer and numberOfCustomers > 1:
+		customers = get_customers_in_party_order(doc.customers)
+		outstanding_by_customer = get_outstanding_by_party(get_outstanding_filters(doc))
+		next_party = next(outstanding_by_customer, None)
+		current_party = None
+
+	for entry in customers:
 		i += 1
 		if customer:
 			#Single Statement
@@ -179,19 +193,14 @@ def get_report_pdf(doc, consolidated=True, customer=None):
 			if ageing:
 				ageing[0]["ageing_based_on"] = doc.ageing_based_on
 	
-		outstanding_filters = frappe._dict({
-			'company': doc.company,
-			'report_date': doc.to_date,
-			'ageing_based_on': doc.ageing_based_on,
-			'range1': 30,
-			'range2': 60,
-			'range3': 90,
-			'range4': 120,
-			'party_type': "Customer",
-			'party': [entry.customer],
-			'in_party_currency': 1
-		})
-		outstanding = get_outstanding(outstanding_filters)[1]
+		if outstanding_by_customer is not None:
+			if next_party and next_party[0] == entry.customer:
+				current_party = next_party
+				next_party = next(outstanding_by_customer, None)
+
+			outstanding = current_party[1] if current_party and current_party[0] == entry.customer else []
+		else:
+			outstanding = get_outstanding(get_outstanding_filters(doc, entry.customer))[1]
 
 		outstandingDocs = []
 		
@@ -224,6 +233,11 @@ def get_report_pdf(doc, consolidated=True, customer=None):
 		)
 		statement_dict[entry.customer] = html
 
+	if outstanding_by_customer is not None:
+		statement_dict = {
+			d.customer: statement_dict[d.customer] for d in doc.customers if d.customer in statement_dict
+		}
+
 	if not bool(statement_dict):
 		return False
 	elif consolidated:
@@ -241,6 +255,37 @@ def get_report_pdf(doc, consolidated=True, customer=None):
 		return statement_dict
 
 
+def get_customers_in_party_order(customers):
+	"""Sort customer rows in the order the ledger is read party-wise"""
+	party_order = {
+		name: idx
+		for idx, name in enumerate(
+			frappe.get_all(
+				"Customer",
+				filters={"name": ("in", [d.customer for d in customers])},
+				order_by="name",
+				pluck="name",
+			)
+		)
+	}
+	return sorted(customers, key=lambda d: party_order.get(d.customer, -1))
+
+
+def get_outstanding_filters(doc, customer=None):
+	return frappe._dict({
+		'company': doc.company,
+		'report_date': doc.to_date,
+		'ageing_based_on': doc.ageing_based_on,
+		'range1': 30,
+		'range2': 60,
+		'range3': 90,
+		'range4': 120,
+		'party_type': "Customer",
+		'party': [customer] if customer else [d.customer for d in doc.customers],
+		'in_party_currency': 1
+	})
+
+
 def get_statement_dict(doc, get_statement_dict=False):
 	statement_dict = {}
 	ageing = ""
@@ -6,6 +6,8 @@ import frappe
 from frappe import _
 from frappe.model.document import Document
 
+from erpnext.accounts.doctype.pricing_rule.utils import clear_pricing_rule_index
+
 pricing_rule_fields = [
 	"apply_on",
 	"mixed_conditions",
@@ -120,6 +122,7 @@ class PromotionalScheme(Document):
 			or {}
 		)
 		self.update_pricing_rules(pricing_rules)
+		clear_pricing_rule_index()
 
 	def validate_mixed_with_recursion(self):
 		if self.mixed_conditions:
@@ -156,6 +159,8 @@ class PromotionalScheme(Document):
 		for rule in frappe.get_all("Pricing Rule", {"promotional_scheme": self.name}):
 			frappe.delete_doc("Pricing Rule", rule.name)
 
+		clear_pricing_rule_index()
+
 
 def raise_for_transaction_exists(name):
 	msg = f"""You can't change the {frappe.bold(_('Applicable For'))}
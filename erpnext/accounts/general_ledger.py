@@ -3,6 +3,7 @@
 
 
 import copy
+from collections import defaultdict
 
 import frappe
 from frappe import _
@@ -10,6 +11,10 @@ from frappe.model.meta import get_field_precision
 from frappe.utils import cint, flt, formatdate, getdate, now
 
 import erpnext
+from erpnext.accounts.doctype.account_monthly_balance.account_monthly_balance import (
+	remove_voucher_from_monthly_balances,
+	update_monthly_balances,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 )
@@ -18,7 +23,16 @@ from erpnext.accounts.doctype.accounting_dimension_filter.accounting_dimension_f
 )
 from erpnext.accounts.doctype.accounting_period.accounting_period import ClosedAccountingPeriod
 from erpnext.accounts.doctype.budget.budget import validate_expense_against_budget
-from erpnext.accounts.utils import create_payment_ledger_entry
+from erpnext.accounts.doctype.gl_entry.gl_entry import (
+	update_outstanding_amt,
+	validate_balance_type,
+	validate_frozen_account,
+)
+from erpnext.accounts.utils import (
+	create_payment_ledger_entry,
+	get_payment_ledger_entries,
+	update_voucher_outstanding,
+)
 from erpnext.exceptions import InvalidAccountDimensionError, MandatoryAccountDimensionError
 
 
@@ -36,7 +50,10 @@ def make_gl_entries(
 			validate_accounting_period(gl_map)
 			validate_disabled_accounts(gl_map)
 			gl_map = process_gl_map(gl_map, merge_entries)
-			if gl_map and len(gl_map) > 1:
+			if gl_map and len(gl_map) > 1 and insert_ledger_entries_in_bulk():
+				gl_entries = save_entries_in_bulk(gl_map, adv_adj, update_outstanding, from_repost)
+				update_monthly_balances(gl_entries)
+			elif gl_map and len(gl_map) > 1:
 				create_payment_ledger_entry(
 					gl_map,
 					cancel=0,
@@ -44,7 +61,8 @@ def make_gl_entries(
 					update_outstanding=update_outstanding,
 					from_repost=from_repost,
 				)
-				save_entries(gl_map, adv_adj, update_outstanding, from_repost)
+				gl_entries = save_entries(gl_map, adv_adj, update_outstanding, from_repost)
+				update_monthly_balances(gl_entries)
 			# Post GL Map process there may no be any GL Entries
 			elif gl_map:
 				frappe.throw(
@@ -353,22 +371,29 @@ def update_net_values(entry):
 
 
 def save_entries(gl_map, adv_adj, update_outstanding, from_repost=False):
+	validate_gl_map(gl_map, adv_adj, from_repost)
+
+	dimension_filter_map = get_dimension_filter_map()
+	gl_entries = []
+	for entry in gl_map:
+		validate_allowed_dimensions(entry, dimension_filter_map)
+		gl_entries.append(make_entry(entry, adv_adj, update_outstanding, from_repost))
+
+	return gl_entries
+
+
+def validate_gl_map(gl_map, adv_adj, from_repost=False):
 	if not from_repost:
 		validate_cwip_accounts(gl_map)
 
 	process_debit_credit_difference(gl_map)
 
-	dimension_filter_map = get_dimension_filter_map()
 	if gl_map:
 		check_freezing_date(gl_map[0]["posting_date"], adv_adj)
 		is_opening = any(d.get("is_opening") == "Yes" for d in gl_map)
 		if gl_map[0]["voucher_type"] != "Period Closing Voucher":
 			validate_against_pcv(is_opening, gl_map[0]["posting_date"], gl_map[0]["company"])
 
-	for entry in gl_map:
-		validate_allowed_dimensions(entry, dimension_filter_map)
-		make_entry(entry, adv_adj, update_outstanding, from_repost)
-
 
 def make_entry(args, adv_adj, update_outstanding, from_repost=False):
 	gle = frappe.new_doc("GL Entry")
@@ -383,6 +408,201 @@ def make_entry(args, adv_adj, update_outstanding, from_repost=False):
 	if not from_repost and gle.voucher_type != "Period Closing Voucher":
 		validate_expense_against_budget(args)
 
+	return gle
+
+
+def insert_ledger_entries_in_bulk():
+	"""GL and Payment Ledger Entries are inserted in bulk, unless their document events are needed
+	by a hook, including the ones for all doctypes, a server script or the setting in Accounts
+	Settings."""
+	from frappe.core.doctype.server_script.server_script_utils import get_server_script_map
+
+	if cint(frappe.db.get_single_value("Accounts Settings", "insert_ledger_entries_individually")):
+		return False
+
+	doc_events = frappe.get_hooks("doc_events")
+	server_script_map = get_server_script_map()
+
+	return not any(
+		doc_events.get(doctype) or server_script_map.get(doctype)
+		for doctype in ("*", "GL Entry", "Payment Ledger Entry")
+	)
+
+
+def save_entries_in_bulk(gl_map, adv_adj, update_outstanding, from_repost=False):
+	"""Insert the GL and Payment Ledger Entries of the map with multi-row inserts.
+
+	The validations of `GLEntry` and `PaymentLedgerEntry` are run once for the whole map, the
+	balances and outstanding amounts are checked once per account and voucher after the insert.
+	"""
+	ple_map = get_payment_ledger_entries(gl_map)
+
+	validate_gl_map(gl_map, adv_adj, from_repost)
+
+	dimension_filter_map = get_dimension_filter_map()
+	gl_entries = []
+	for entry in gl_map:
+		validate_allowed_dimensions(entry, dimension_filter_map)
+
+		gle = frappe.new_doc("GL Entry")
+		gle.update(entry)
+		gle.flags.from_repost = from_repost
+		gle.autoname()
+		gle.validate()
+		gl_entries.append(gle)
+
+	validate_links(gl_entries)
+
+	payment_ledger_entries = []
+	for entry in ple_map:
+		ple = frappe.get_doc(entry)
+		ple.name = frappe.generate_hash(length=10)
+		payment_ledger_entries.append(ple)
+
+	# payment ledger entries are validated on every insert, gl entries only outside reposts
+	is_pcv = gl_map[0].voucher_type == "Period Closing Voucher"
+	validate_account_details([] if from_repost or is_pcv else gl_entries, payment_ledger_entries)
+	if not from_repost and not is_pcv:
+		for gle in gl_entries:
+			gle.validate_dimensions_for_pl_and_bs()
+
+	insert_ledger_entries(payment_ledger_entries)
+	insert_ledger_entries(gl_entries)
+
+	if not from_repost:
+		# accounts of the payment ledger entries are also in the gl entries
+		entries = payment_ledger_entries if is_pcv else gl_entries
+		for account in {d.account for d in entries}:
+			validate_frozen_account(account, adv_adj)
+			validate_balance_type(account, adv_adj)
+
+	update_outstanding_in_bulk(gl_entries, payment_ledger_entries, update_outstanding, from_repost)
+
+	if not from_repost and not is_pcv and frappe.get_all("Budget", limit=1):
+		for entry in gl_map:
+			validate_expense_against_budget(entry)
+
+	return gl_entries
+
+
+def validate_links(gl_entries):
+	"Accounts, cost centers and parties must exist, as the links of a ledger entry are checked on submit"
+	links = defaultdict(set)
+	for gle in gl_entries:
+		links["Account"].add(gle.account)
+		if gle.cost_center:
+			links["Cost Center"].add(gle.cost_center)
+		if gle.party_type and gle.party:
+			links[gle.party_type].add(gle.party)
+
+	for doctype, names in links.items():
+		missing = names - set(frappe.get_all(doctype, filters={"name": ("in", list(names))}, pluck="name"))
+		if missing:
+			frappe.throw(
+				_("Could not find {0}: {1}").format(_(doctype), ", ".join(sorted(missing))),
+				frappe.LinkValidationError,
+			)
+
+
+def validate_account_details(gl_entries, payment_ledger_entries=None):
+	"""Accounts must be ledgers of the company and active, as per `GLEntry.validate_account_details`.
+	Accounts of payment ledger entries must also be of their account type, as per
+	`PaymentLedgerEntry.validate_account`"""
+	payment_ledger_entries = payment_ledger_entries or []
+	account_names = {d.account for d in gl_entries} | {d.account for d in payment_ledger_entries}
+	if not account_names:
+		return
+
+	accounts = {
+		d.name: d
+		for d in frappe.get_all(
+			"Account",
+			filters={"name": ("in", list(account_names))},
+			fields=["name", "is_group", "docstatus", "company", "account_type"],
+		)
+	}
+
+	for gle in gl_entries:
+		account = accounts.get(gle.account) or frappe._dict()
+		if account.is_group == 1:
+			frappe.throw(
+				_(
+					"""{0} {1}: Account {2} is a Group Account and group accounts cannot be used in transactions"""
+				).format(gle.voucher_type, gle.voucher_no, gle.account)
+			)
+
+		if account.docstatus == 2:
+			frappe.throw(
+				_("{0} {1}: Account {2} is inactive").format(gle.voucher_type, gle.voucher_no, gle.account)
+			)
+
+		if account.company != gle.company:
+			frappe.throw(
+				_("{0} {1}: Account {2} does not belong to Company {3}").format(
+					gle.voucher_type, gle.voucher_no, gle.account, gle.company
+				)
+			)
+
+	for ple in payment_ledger_entries:
+		account = accounts.get(ple.account) or frappe._dict()
+		if account.account_type != ple.account_type or account.company != ple.company:
+			frappe.throw(_("{0} account is not of type {1}").format(ple.account, ple.account_type))
+
+
+def insert_ledger_entries(entries):
+	"Insert submitted ledger entries of a doctype with multi-row inserts, without their document events"
+	if not entries:
+		return
+
+	timestamp = now()
+	values = []
+	for doc in entries:
+		doc.docstatus = 1
+		doc.creation = doc.modified = timestamp
+		doc.owner = doc.modified_by = frappe.session.user
+		values.append(doc.get_valid_dict(convert_dates_to_str=True))
+
+	fields = list(values[0])
+	frappe.db.bulk_insert(
+		entries[0].doctype, fields=fields, values=[tuple(d.get(field) for field in fields) for d in values]
+	)
+
+
+def update_outstanding_in_bulk(gl_entries, payment_ledger_entries, update_outstanding, from_repost=False):
+	"Update outstanding amounts once per voucher, as the ledger entries do in their `on_update`"
+	if update_outstanding != "Yes" or frappe.flags.is_reverse_depr_entry:
+		return
+
+	against_voucher_types = ["Journal Entry", "Sales Invoice", "Purchase Invoice", "Fees"]
+
+	vouchers = {
+		(ple.against_voucher_type, ple.against_voucher_no, ple.account, ple.party_type, ple.party)
+		for ple in payment_ledger_entries
+		if ple.against_voucher_type in against_voucher_types
+	}
+	for voucher in vouchers:
+		update_voucher_outstanding(*voucher)
+
+	if from_repost or gl_entries[0].voucher_type == "Period Closing Voucher":
+		return
+
+	if (
+		gl_entries[0].voucher_type == "Journal Entry"
+		and frappe.get_cached_value("Journal Entry", gl_entries[0].voucher_no, "voucher_type")
+		== "Exchange Gain Or Loss"
+	):
+		return
+
+	vouchers = {
+		(gle.account, gle.party_type, gle.party, gle.against_voucher_type, gle.against_voucher)
+		for gle in gl_entries
+		if gle.against_voucher_type in against_voucher_types
+		and gle.against_voucher
+		and frappe.get_cached_value("Account", gle.account, "account_type") not in ["Receivable", "Payable"]
+	}
+	for voucher in vouchers:
+		update_outstanding_amt(*voucher)
+
 
 def validate_cwip_accounts(gl_map):
 	"""Validate that CWIP account are not used in Journal Entry"""
@@ -597,6 +817,7 @@ def make_reverse_gl_entries(
 		is_opening = any(d.get("is_opening") == "Yes" for d in gl_entries)
 		validate_against_pcv(is_opening, gl_entries[0]["posting_date"], gl_entries[0]["company"])
 		if not partial_cancel:
+			remove_voucher_from_monthly_balances(gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"])
 			set_as_cancel(gl_entries[0]["voucher_type"], gl_entries[0]["voucher_no"])
 
 		for entry in gl_entries:
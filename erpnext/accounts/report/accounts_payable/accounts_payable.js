@@ -167,6 +167,11 @@ frappe.query_reports["Accounts Payable"] = {
 			label: __("Handle Employee Advances"),
 			fieldtype: "Check",
 		},
+		{
+			fieldname: "process_party_wise",
+			label: __("Process Party-wise (Low Memory)"),
+			fieldtype: "Check",
+		},
 	],
 
 	formatter: function (value, row, column, data, default_formatter) {
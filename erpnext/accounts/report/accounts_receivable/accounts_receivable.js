@@ -194,6 +194,11 @@ frappe.query_reports["Accounts Receivable"] = {
 			label: __("Group by Voucher"),
 			fieldtype: "Check",
 		},
+		{
+			fieldname: "process_party_wise",
+			label: __("Process Party-wise (Low Memory)"),
+			fieldtype: "Check",
+		},
 	],
 
 	formatter: function (value, row, column, data, default_formatter) {
@@ -3,11 +3,12 @@
 
 
 from collections import OrderedDict
+from itertools import groupby
 
 import frappe
 from frappe import _, qb, query_builder, scrub
 from frappe.query_builder import Criterion
-from frappe.query_builder.functions import Date, Substring, Sum
+from frappe.query_builder.functions import Count, Date, Substring, Sum
 from frappe.utils import cint, cstr, flt, getdate, nowdate
 
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
@@ -30,7 +31,10 @@ from erpnext.accounts.utils import get_currency_precision
 #  8. Invoice details like Sales Persons, Delivery Notes are also fetched comma separated
 #  9. Report amounts are in party currency if in_party_currency is selected, otherwise company currency
 # 10. This report is based on Payment Ledger Entries
+# 11. With "Process Party-wise" the ledger is read party by party in chunks, to bound memory on large ledgers
 
+# max Payment Ledger Entries fetched at a time in party-wise mode, a bigger party is fetched on its own
+PLE_CHUNK_SIZE = 50000
 
 
 def execute(filters=None):
@@ -41,6 +45,15 @@ def execute(filters=None):
 	return ReceivablePayableReport(filters).run(args)
 
 
+def execute_by_party(filters=None, args=None):
+	"""Yield `(party, rows)` of the report one party at a time"""
+	args = args or {
+		"account_type": "Receivable",
+		"naming_by": ["Selling Settings", "cust_master_name"],
+	}
+	yield from ReceivablePayableReport(filters).run_by_party(args)
+
+
 class ReceivablePayableReport:
 	def __init__(self, filters=None):
 		self.filters = frappe._dict(filters or {})
@@ -62,6 +75,14 @@ class ReceivablePayableReport:
 		self.get_chart_data()
 		return self.columns, self.data, None, self.chart, None, self.skip_total_row
 
+	def run_by_party(self, args):
+		self.filters.update(args)
+		self.set_defaults()
+		self.party_naming_by = frappe.db.get_value(
+			args.get("naming_by")[0], None, args.get("naming_by")[1]
+		)
+		yield from self.get_data_by_party()
+
 	def set_defaults(self):
 		if not self.filters.get("company"):
 			self.filters.company = frappe.db.get_single_value("Global Defaults", "default_company")
@@ -88,6 +109,10 @@ class ReceivablePayableReport:
 				self.skip_total_row = 1
 
 	def get_data(self):
+		if self.filters.get("process_party_wise"):
+			self.get_data_party_wise()
+			return
+
 		self.get_ple_entries()
 		self.get_sales_invoices_or_customers_based_on_sales_person()
 		self.voucher_balance = OrderedDict()
@@ -115,6 +140,78 @@ class ReceivablePayableReport:
 
 		self.build_data()
 
+	def get_data_party_wise(self):
+		data = []
+		for _party, rows in self.get_data_by_party():
+			data.extend(rows)
+
+		if self.filters.get("group_by_party") and data:
+			data.append(self.total_row_map.get("Total", {}))
+
+		self.data = data
+
+	def get_data_by_party(self):
+		"""Yield `(party, rows)`, building voucher balances for one party at a time.
+
+		Payment Ledger Entries are fetched ordered by party, in chunks of whole parties of about
+		`PLE_CHUNK_SIZE` entries. Invoice and delivery note details are fetched per chunk.
+		"""
+		self.get_sales_invoices_or_customers_based_on_sales_person()
+		self.get_future_payments()
+		self.get_return_entries()
+		self.get_exchange_rate_revaluations()
+		self.prepare_ple_conditions()
+
+		for parties in self.get_party_chunks():
+			ple_entries = self.get_ple_query(parties).run(as_dict=True)
+
+			self.invoices = set()
+			self.party_details = {}
+			for ple in ple_entries:
+				self.get_invoices(ple)
+
+			self.build_delivery_note_map()
+			self.get_invoice_details(voucher_nos={ple.voucher_no for ple in ple_entries})
+
+			for party, party_ple_entries in groupby(ple_entries, key=lambda ple: ple.party):
+				self.ple_entries = list(party_ple_entries)
+				self.voucher_balance = OrderedDict()
+				self.init_voucher_balance()
+
+				self.data = []
+				self.previous_party = ""
+				for ple in self.ple_entries:
+					self.update_voucher_balance(ple)
+
+				self.build_data(party_wise=True)
+				if self.filters.get("group_by_party"):
+					self.total_row_map.pop(party, None)
+
+				yield party, self.data
+
+		self.ple_entries = []
+		self.voucher_balance = OrderedDict()
+
+	def get_party_chunks(self):
+		ple = self.ple
+		parties = (
+			self.apply_ple_conditions(qb.from_(ple).select(ple.party, Count(ple.name).as_("entries")))
+			.groupby(ple.party)
+			.orderby(ple.party)
+		).run(as_dict=True)
+
+		chunk, chunk_entries = [], 0
+		for d in parties:
+			if chunk and chunk_entries + d.entries > PLE_CHUNK_SIZE:
+				yield chunk
+				chunk, chunk_entries = [], 0
+
+			chunk.append(d.party)
+			chunk_entries += d.entries
+
+		if chunk:
+			yield chunk
+
 	def build_voucher_dict(self, ple):
 		return frappe._dict(
 			voucher_type=ple.voucher_type,
@@ -292,7 +389,7 @@ class ReceivablePayableReport:
 			self.data.append({})
 			self.update_sub_total_row(sub_total_row, "Total")
 
-	def build_data(self):
+	def build_data(self, party_wise=False):
 		# set outstanding for all the accumulated balances
 		# as we can use this to filter out invoices without outstanding
 		for _key, row in self.voucher_balance.items():
@@ -342,7 +439,7 @@ class ReceivablePayableReport:
 
 		if self.filters.get("group_by_party"):
 			self.append_subtotal_row(self.previous_party)
-			if self.data:
+			if self.data and not party_wise:
 				self.data.append(self.total_row_map.get("Total", {}))
 
 	def append_row(self, row):
@@ -412,16 +509,19 @@ class ReceivablePayableReport:
 			for d in dn_against_si:
 				self.delivery_notes.setdefault(d.against_sales_invoice, set()).add(d.parent)
 
-	def get_invoice_details(self):
+	def get_invoice_details(self, voucher_nos=None):
 		self.invoice_details = frappe._dict()
+		values = {"report_date": self.filters.report_date, "voucher_nos": tuple(voucher_nos or [""])}
+		condition = " and name in %(voucher_nos)s" if voucher_nos is not None else ""
+
 		if self.account_type == "Receivable":
 			si_list = frappe.db.sql(
-				"""
+				f"""
 				select name, due_date, po_no
 				from `tabSales Invoice`
-				where posting_date <= %s
+				where posting_date <= %(report_date)s {condition}
 			""",
-				self.filters.report_date,
+				values,
 				as_dict=1,
 			)
 			for d in si_list:
@@ -430,11 +530,12 @@ class ReceivablePayableReport:
 			# Get Sales Team
 			if self.filters.show_sales_person:
 				sales_team = frappe.db.sql(
-					"""
+					f"""
 					select parent, sales_person
 					from `tabSales Team`
-					where parenttype = 'Sales Invoice'
+					where parenttype = 'Sales Invoice' {condition.replace("name", "parent")}
 				""",
+					values,
 					as_dict=1,
 				)
 				for d in sales_team:
@@ -444,24 +545,24 @@ class ReceivablePayableReport:
 
 		if self.account_type == "Payable":
 			for pi in frappe.db.sql(
-				"""
+				f"""
 				select name, due_date, bill_no, bill_date
 				from `tabPurchase Invoice`
-				where posting_date <= %s
+				where posting_date <= %(report_date)s {condition}
 			""",
-				self.filters.report_date,
+				values,
 				as_dict=1,
 			):
 				self.invoice_details.setdefault(pi.name, pi)
 
 		# Invoices booked via Journal Entries
 		journal_entries = frappe.db.sql(
-			"""
+			f"""
 			select name, due_date, bill_no, bill_date
 			from `tabJournal Entry`
-			where posting_date <= %s
+			where posting_date <= %(report_date)s {condition}
 		""",
-			self.filters.report_date,
+			values,
 			as_dict=1,
 		)
 
@@ -775,7 +876,10 @@ class ReceivablePayableReport:
 
 	def get_ple_entries(self):
 		# get all the GL entries filtered by the given filters
+		self.prepare_ple_conditions()
+		self.ple_entries = self.get_ple_query().run(as_dict=True)
 
+	def prepare_ple_conditions(self):
 		self.prepare_conditions()
 
 		if self.filters.show_future_payments:
@@ -789,10 +893,17 @@ class ReceivablePayableReport:
 		else:
 			self.qb_selection_filter.append(self.ple.posting_date.lte(self.filters.report_date))
 
+	def apply_ple_conditions(self, query):
+		return (
+			query.where(self.ple.delinked == 0)
+			.where(Criterion.all(self.qb_selection_filter))
+			.where(Criterion.any(self.or_filters))
+		)
+
+	def get_ple_query(self, parties=None):
 		ple = qb.DocType("Payment Ledger Entry")
-		query = (
-			qb.from_(ple)
-			.select(
+		query = self.apply_ple_conditions(
+			qb.from_(ple).select(
 				ple.name,
 				ple.account,
 				ple.voucher_type,
@@ -808,9 +919,6 @@ class ReceivablePayableReport:
 				ple.amount,
 				ple.amount_in_account_currency,
 			)
-			.where(ple.delinked == 0)
-			.where(Criterion.all(self.qb_selection_filter))
-			.where(Criterion.any(self.or_filters))
 		)
 
 		if self.filters.get("show_remarks"):
@@ -821,12 +929,15 @@ class ReceivablePayableReport:
 			else:
 				query = query.select(ple.remarks)
 
-		if self.filters.get("group_by_party"):
+		if parties is not None:
+			query = query.where(ple.party.isin(parties))
+
+		if parties is not None or self.filters.get("group_by_party"):
 			query = query.orderby(self.ple.party, self.ple.posting_date)
 		else:
 			query = query.orderby(self.ple.posting_date, self.ple.party)
 
-		self.ple_entries = query.run(as_dict=True)
+		return query
 
 	def get_sales_invoices_or_customers_based_on_sales_person(self):
 		if self.filters.get("sales_person"):
@@ -5,7 +5,10 @@ from frappe.utils import add_days, flt, getdate, today
 
 from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
 from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
-from erpnext.accounts.report.accounts_receivable.accounts_receivable import execute
+from erpnext.accounts.report.accounts_receivable.accounts_receivable import (
+	execute,
+	execute_by_party,
+)
 from erpnext.accounts.test.accounts_mixin import AccountsTestMixin
 from erpnext.selling.doctype.sales_order.test_sales_order import make_sales_order
 
@@ -1023,3 +1026,48 @@ class TestAccountsReceivable(AccountsTestMixin, FrappeTestCase):
 		self.assertEqual(len(report[1]), 1)
 		row = report[1][0]
 		self.assertEqual(expected_data_after_payment, [row.voucher_no, row.cost_center, row.outstanding])
+
+	def test_process_party_wise(self):
+		self.customer1 = self.customer
+		self.create_customer("_Test Customer 2")
+		self.customer2 = self.customer
+
+		si1 = self.create_sales_invoice(no_payment_schedule=True, do_not_submit=True)
+		si1.customer = self.customer1
+		si1.save().submit()
+		self.create_payment_entry(si1.name)
+
+		si2 = self.create_sales_invoice(no_payment_schedule=True, do_not_submit=True)
+		si2.customer = self.customer2
+		si2.items[0].rate = 85
+		si2.save().submit()
+
+		filters = {
+			"company": self.company,
+			"report_date": today(),
+			"range1": 30,
+			"range2": 60,
+			"range3": 90,
+			"range4": 120,
+			"group_by_party": True,
+		}
+
+		def get_rows(report):
+			return [[x.get("party"), x.get("voucher_no"), x.get("outstanding")] for x in report]
+
+		expected = execute(filters)[1]
+		party_wise = execute({**filters, "process_party_wise": True})[1]
+		self.assertEqual(
+			sorted(get_rows(expected)[:-1], key=str), sorted(get_rows(party_wise)[:-1], key=str)
+		)
+		# grand total stays the last row
+		self.assertEqual(get_rows(expected)[-1], get_rows(party_wise)[-1])
+
+		del filters["group_by_party"]
+		outstanding_by_party = dict(execute_by_party(filters))
+		self.assertEqual(
+			[[x.voucher_no, x.outstanding] for x in outstanding_by_party[self.customer1]], [[si1.name, 60]]
+		)
+		self.assertEqual(
+			[[x.voucher_no, x.outstanding] for x in outstanding_by_party[self.customer2]], [[si2.name, 85]]
+		)
@@ -3,9 +3,16 @@
 
 import frappe
 from frappe.tests.utils import FrappeTestCase
-from frappe.utils import today
+from frappe.utils import add_months, today
 
 from erpnext.accounts.report.balance_sheet.balance_sheet import execute
+from erpnext.accounts.report.financial_statements import (
+	calculate_values,
+	filter_accounts,
+	get_accounts,
+	get_period_list,
+	set_gl_entries_by_account,
+)
 
 
 class TestBalanceSheet(FrappeTestCase):
@@ -47,3 +54,54 @@ class TestBalanceSheet(FrappeTestCase):
 				self.assertEqual(account_dict.total, 1000)
 			if account_dict.get("account") == "Current Assets - _TC6":
 				self.assertEqual(account_dict.total, 550)
+
+	def test_gl_entries_summed_by_period(self):
+		from erpnext.accounts.doctype.sales_invoice.test_sales_invoice import create_sales_invoice
+
+		create_sales_invoice(qty=5, rate=110)
+		create_sales_invoice(qty=2, rate=100, posting_date="2013-02-15", set_posting_time=1)
+
+		company = "_Test Company"
+		filters = frappe._dict(company=company)
+		period_list = get_period_list(
+			None,
+			None,
+			add_months(today(), -3),
+			today(),
+			"Date Range",
+			"Monthly",
+			company=company,
+			ignore_fiscal_year=True,
+		)
+		root = frappe.db.get_value(
+			"Account",
+			{"company": company, "root_type": "Asset", "parent_account": ("is", "not set")},
+			["lft", "rgt"],
+			as_dict=True,
+		)
+
+		values = []
+		for summed_period_list in (None, period_list):
+			accounts, accounts_by_name, _parent_children_map = filter_accounts(get_accounts(company, "Asset"))
+			gl_entries_by_account = {}
+			set_gl_entries_by_account(
+				company,
+				None,
+				period_list[-1].to_date,
+				root.lft,
+				root.rgt,
+				filters,
+				gl_entries_by_account,
+				root_type="Asset",
+				period_list=summed_period_list,
+			)
+			calculate_values(accounts_by_name, gl_entries_by_account, period_list, True, False)
+			values.append(
+				{
+					d.name: [round(d.get(period.key, 0.0), 2) for period in period_list]
+					+ [round(d.get("opening_balance", 0.0), 2)]
+					for d in accounts
+				}
+			)
+
+		self.assertEqual(values[0], values[1])
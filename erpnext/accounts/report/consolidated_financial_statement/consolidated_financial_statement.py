@@ -7,6 +7,7 @@ from collections import defaultdict
 import frappe
 from frappe import _
 from frappe.query_builder import Criterion
+from frappe.query_builder.functions import Min, Sum
 from frappe.utils import cint, flt, getdate
 
 import erpnext
@@ -26,6 +27,7 @@ from erpnext.accounts.report.cash_flow.cash_flow import get_report_summary as ge
 from erpnext.accounts.report.financial_statements import (
 	filter_out_zero_value_rows,
 	get_fiscal_year_data,
+	get_period_bucket,
 	sort_accounts,
 )
 from erpnext.accounts.report.profit_and_loss_statement.profit_and_loss_statement import (
@@ -339,6 +341,11 @@ def get_data(companies, root_type, balance_must_be, fiscal_year, filters=None, i
 
 	filters.end_date = end_date
 
+	# entries before this date are added to the opening balance in calculate_values
+	opening_date = (
+		fiscal_year.year_start_date if filters.filter_based_on == "Fiscal Year" else filters.period_start_date
+	)
+
 	gl_entries_by_account = {}
 	for root in frappe.db.sql(
 		"""select lft, rgt from tabAccount
@@ -357,6 +364,7 @@ def get_data(companies, root_type, balance_must_be, fiscal_year, filters=None, i
 			accounts,
 			ignore_closing_entries=False,
 			root_type=root_type,
+			opening_date=opening_date,
 		)
 
 	calculate_values(accounts_by_name, gl_entries_by_account, companies, filters, fiscal_year)
@@ -596,8 +604,13 @@ def set_gl_entries_by_account(
 	accounts,
 	ignore_closing_entries=False,
 	root_type=None,
+	opening_date=None,
 ):
-	"""Returns a dict like { "account": [gl entries], ... }"""
+	"""Returns a dict like { "account": [gl entries], ... }
+
+	The GL Entries are summed up per account and company in the database, separately before and
+	after `opening_date`.
+	"""
 
 	company_lft, company_rgt = frappe.get_cached_value("Company", filters.get("company"), ["lft", "rgt"])
 
@@ -623,15 +636,14 @@ def set_gl_entries_by_account(
 			.inner_join(account)
 			.on(account.name == gle.account)
 			.select(
-				gle.posting_date,
+				Min(gle.posting_date).as_("posting_date"),
 				gle.account,
-				gle.debit,
-				gle.credit,
-				gle.is_opening,
+				Sum(gle.debit).as_("debit"),
+				Sum(gle.credit).as_("credit"),
 				gle.company,
 				gle.fiscal_year,
-				gle.debit_in_account_currency,
-				gle.credit_in_account_currency,
+				Sum(gle.debit_in_account_currency).as_("debit_in_account_currency"),
+				Sum(gle.credit_in_account_currency).as_("credit_in_account_currency"),
 				gle.account_currency,
 				account.account_name,
 				account.account_number,
@@ -643,9 +655,20 @@ def set_gl_entries_by_account(
 				& (account.lft >= root_lft)
 				& (account.rgt <= root_rgt)
 			)
-			.orderby(gle.account, gle.posting_date)
+			.groupby(
+				gle.account,
+				gle.company,
+				gle.fiscal_year,
+				gle.account_currency,
+				account.account_name,
+				account.account_number,
+			)
+			.orderby(gle.account)
 		)
 
+		if opening_date:
+			query = query.groupby(get_period_bucket(gle.posting_date, [getdate(opening_date)]))
+
 		if root_type:
 			query = query.where(account.root_type == root_type)
 		additional_conditions = get_additional_conditions(from_date, ignore_closing_entries, filters, d)
@@ -8,6 +8,8 @@ import re
 
 import frappe
 from frappe import _
+from frappe.query_builder import Case
+from frappe.query_builder.functions import Min, Sum
 from frappe.utils import add_days, add_months, cint, cstr, flt, formatdate, get_first_day, getdate
 
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
@@ -187,6 +189,7 @@ def get_data(
 			gl_entries_by_account,
 			ignore_closing_entries=ignore_closing_entries,
 			root_type=root_type,
+			period_list=period_list,
 		)
 
 	calculate_values(
@@ -414,8 +417,13 @@ def set_gl_entries_by_account(
 	ignore_closing_entries=False,
 	ignore_opening_entries=False,
 	root_type=None,
+	period_list=None,
 ):
-	"""Returns a dict like { "account": [gl entries], ... }"""
+	"""Returns a dict like { "account": [gl entries], ... }
+
+	If `period_list` is passed, the GL Entries are summed up per account and period in the
+	database, see `get_period_boundaries`.
+	"""
 	gl_entries = []
 
 	account_filters = {
@@ -476,6 +484,7 @@ def set_gl_entries_by_account(
 			filters,
 			ignore_closing_entries,
 			ignore_opening_entries=ignore_opening_entries,
+			period_list=period_list,
 		)
 
 		if filters and filters.get("presentation_currency"):
@@ -496,11 +505,26 @@ def get_accounting_entries(
 	ignore_closing_entries,
 	period_closing_voucher=None,
 	ignore_opening_entries=False,
+	period_list=None,
 ):
 	gl_entry = frappe.qb.DocType(doctype)
-	query = (
-		frappe.qb.from_(gl_entry)
-		.select(
+	query = frappe.qb.from_(gl_entry).where(gl_entry.company == filters.company)
+
+	if doctype == "GL Entry" and period_list:
+		# one row per account and period instead of every entry
+		period = get_period_bucket(gl_entry.posting_date, get_period_boundaries(period_list))
+		query = query.select(
+			gl_entry.account,
+			Sum(gl_entry.debit).as_("debit"),
+			Sum(gl_entry.credit).as_("credit"),
+			Sum(gl_entry.debit_in_account_currency).as_("debit_in_account_currency"),
+			Sum(gl_entry.credit_in_account_currency).as_("credit_in_account_currency"),
+			gl_entry.account_currency,
+			Min(gl_entry.posting_date).as_("posting_date"),
+			gl_entry.fiscal_year,
+		).groupby(gl_entry.account, gl_entry.account_currency, gl_entry.fiscal_year, period)
+	else:
+		query = query.select(
 			gl_entry.account,
 			gl_entry.debit,
 			gl_entry.credit,
@@ -508,11 +532,11 @@ def get_accounting_entries(
 			gl_entry.credit_in_account_currency,
 			gl_entry.account_currency,
 		)
-		.where(gl_entry.company == filters.company)
-	)
+
+		if doctype == "GL Entry":
+			query = query.select(gl_entry.posting_date, gl_entry.is_opening, gl_entry.fiscal_year)
 
 	if doctype == "GL Entry":
-		query = query.select(gl_entry.posting_date, gl_entry.is_opening, gl_entry.fiscal_year)
 		query = query.where(gl_entry.is_cancelled == 0)
 		query = query.where(gl_entry.posting_date <= to_date)
 
@@ -530,6 +554,29 @@ def get_accounting_entries(
 	return entries
 
 
+def get_period_boundaries(period_list):
+	"""Dates at which the periods of the report start and end.
+
+	Entries posted between two consecutive boundaries fall in the same periods and before or after
+	the start of the fiscal year alike, so their sum can be used in place of the entries.
+	"""
+	boundaries = {getdate(period_list[0].year_start_date)}
+	for period in period_list:
+		boundaries.add(getdate(period.from_date))
+		boundaries.add(getdate(add_days(period.to_date, 1)))
+
+	return sorted(boundaries)
+
+
+def get_period_bucket(posting_date, boundaries):
+	"Index of the range between the `boundaries` the posting date falls in"
+	bucket = Case()
+	for idx, boundary in enumerate(boundaries):
+		bucket = bucket.when(posting_date < boundary, idx)
+
+	return bucket.else_(len(boundaries))
+
+
 def apply_additional_conditions(doctype, query, from_date, ignore_closing_entries, filters):
 	gl_entry = frappe.qb.DocType(doctype)
 	accounting_dimensions = get_accounting_dimensions(as_list=False)
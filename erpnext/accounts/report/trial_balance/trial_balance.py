@@ -8,6 +8,10 @@ from frappe.query_builder.functions import Sum
 from frappe.utils import add_days, cstr, flt, formatdate, getdate
 
 import erpnext
+from erpnext.accounts.doctype.account_monthly_balance.account_monthly_balance import (
+	get_account_balances,
+	get_gl_balances,
+)
 from erpnext.accounts.doctype.accounting_dimension.accounting_dimension import (
 	get_accounting_dimensions,
 	get_dimension_with_children,
@@ -170,11 +174,11 @@ def get_rootwise_opening_balances(filters, report_type):
 		# Report getting generate from the mid of a fiscal year
 		if getdate(last_period_closing_voucher[0].posting_date) < getdate(add_days(filters.from_date, -1)):
 			start_date = add_days(last_period_closing_voucher[0].posting_date, 1)
-			gle += get_opening_balance(
-				"GL Entry", filters, report_type, accounting_dimensions, start_date=start_date
+			gle += get_opening_balance_from_monthly_balances(
+				filters, report_type, accounting_dimensions, start_date=start_date
 			)
 	else:
-		gle = get_opening_balance("GL Entry", filters, report_type, accounting_dimensions)
+		gle = get_opening_balance_from_monthly_balances(filters, report_type, accounting_dimensions)
 
 	opening = frappe._dict()
 	for d in gle:
@@ -304,6 +308,71 @@ def get_opening_balance(
 	return gle
 
 
+def get_opening_balance_from_monthly_balances(filters, report_type, accounting_dimensions, start_date=None):
+	"""Opening balances of the GL Entries, as per `get_opening_balance`, with whole months read from
+	Account Monthly Balance"""
+	accounts = frappe.get_all(
+		"Account", filters={"company": filters.company, "report_type": report_type}, pluck="name"
+	)
+	if not accounts:
+		return []
+
+	balance_filters = {"account": accounts}
+
+	if not flt(filters.with_period_closing_entry):
+		balance_filters["is_period_closing_voucher_entry"] = 0
+
+	if filters.cost_center:
+		lft, rgt = frappe.db.get_value("Cost Center", filters.cost_center, ["lft", "rgt"])
+		balance_filters["cost_center"] = frappe.get_all(
+			"Cost Center", filters={"lft": (">=", lft), "rgt": ("<=", rgt)}, pluck="name"
+		)
+
+	if filters.project:
+		balance_filters["project"] = filters.project
+
+	finance_books = [cstr(filters.finance_book), "", None]
+	if filters.get("include_default_book_entries"):
+		company_fb = frappe.get_cached_value("Company", filters.company, "default_finance_book")
+
+		if filters.finance_book and company_fb and cstr(filters.finance_book) != cstr(company_fb):
+			frappe.throw(_("To use a different finance book, please uncheck 'Include Default FB Entries'"))
+
+		finance_books.append(cstr(company_fb))
+	balance_filters["finance_book"] = finance_books
+
+	for dimension in accounting_dimensions:
+		if filters.get(dimension.fieldname):
+			if frappe.get_cached_value("DocType", dimension.document_type, "is_tree"):
+				filters[dimension.fieldname] = get_dimension_with_children(
+					dimension.document_type, filters.get(dimension.fieldname)
+				)
+			balance_filters[dimension.fieldname] = filters[dimension.fieldname]
+
+	from_date = getdate(start_date) if start_date else None
+	if not filters.show_unclosed_fy_pl_balances and report_type == "Profit and Loss":
+		from_date = max(from_date, filters.year_start_date) if from_date else filters.year_start_date
+
+	if start_date:
+		balance_filters["is_opening"] = "No"
+
+	group_by = ["account", "account_currency"]
+	gle = get_account_balances(
+		filters.company, filters.from_date, group_by, balance_filters, from_date=from_date
+	)
+
+	if not start_date:
+		# opening entries are part of the opening whatever their posting date
+		gle += get_gl_balances(
+			filters.company, filters.from_date, None, group_by, {**balance_filters, "is_opening": "Yes"}
+		)
+
+	if filters and filters.get("presentation_currency"):
+		convert_to_presentation_currency(gle, get_currency(filters))
+
+	return gle
+
+
 def calculate_values(accounts, gl_entries_by_account, opening_balances, show_net_values):
 	init = {
 		"opening_debit": 0.0,
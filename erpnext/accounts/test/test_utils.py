@@ -3,11 +3,21 @@ import unittest
 import frappe
 from frappe.test_runner import make_test_objects
 
+from erpnext.accounts.doctype.journal_entry.test_journal_entry import make_journal_entry
 from erpnext.accounts.doctype.payment_entry.payment_entry import get_payment_entry
+from erpnext.accounts.doctype.period_closing_voucher.test_period_closing_voucher import (
+	create_account,
+	create_company,
+	create_cost_center,
+)
 from erpnext.accounts.doctype.purchase_invoice.test_purchase_invoice import make_purchase_invoice
 from erpnext.accounts.party import get_party_shipping_address
 from erpnext.accounts.utils import (
+	get_balance_on,
+	get_balances_on,
+	get_fiscal_year,
 	get_future_stock_vouchers,
+	get_last_period_closing_voucher,
 	get_voucherwise_gl_entries,
 	sort_stock_vouchers_by_posting_date,
 )
@@ -34,6 +44,97 @@ class TestUtils(unittest.TestCase):
 		address = get_party_shipping_address("Customer", "_Test Customer 2")
 		self.assertEqual(address, "_Test Shipping Address 2 Title-Shipping")
 
+	def test_batched_balances(self):
+		company = "_Test Company"
+		accounts = [
+			"Debtors - _TC",
+			"Cash - _TC",
+			"Current Assets - _TC",
+			"Application of Funds (Assets) - _TC",
+		]
+
+		for in_account_currency in (True, False):
+			balances = get_balances_on(accounts, company=company, in_account_currency=in_account_currency)
+			for account in accounts:
+				self.assertAlmostEqual(
+					balances[account],
+					get_balance_on(account, company=company, in_account_currency=in_account_currency),
+					msg=account,
+				)
+
+		customers = ["_Test Customer", "_Test Customer 1"]
+		balances = get_balances_on(party_type="Customer", parties=customers, company=company)
+		for customer in customers:
+			self.assertAlmostEqual(
+				balances[customer], get_balance_on(party_type="Customer", party=customer, company=company)
+			)
+
+	def test_batched_balances_after_period_closing(self):
+		frappe.db.sql("delete from `tabGL Entry` where company='Test PCV Company'")
+		frappe.db.sql("delete from `tabPeriod Closing Voucher` where company='Test PCV Company'")
+
+		company = create_company()
+		cost_center = create_cost_center("Test Cost Center 1")
+
+		for posting_date, amount, debit_account, credit_account in (
+			("2021-03-15", 400, "Cash - TPC", "Sales - TPC"),
+			("2021-03-15", 600, "Cost of Goods Sold - TPC", "Cash - TPC"),
+			("2021-04-15", 300, "Cash - TPC", "Sales - TPC"),
+		):
+			jv = make_journal_entry(
+				posting_date=posting_date,
+				amount=amount,
+				account1=debit_account,
+				account2=credit_account,
+				cost_center=cost_center,
+				save=False,
+			)
+			jv.company = company
+			jv.save()
+			jv.submit()
+
+		pcv = frappe.get_doc(
+			{
+				"doctype": "Period Closing Voucher",
+				"transaction_date": "2021-03-31",
+				"posting_date": "2021-03-31",
+				"company": company,
+				"fiscal_year": get_fiscal_year("2021-03-31", company=company)[0],
+				"cost_center": cost_center,
+				"closing_account_head": create_account(),
+				"remarks": "test",
+			}
+		)
+		pcv.insert()
+		pcv.submit()
+
+		date = "2021-06-30"
+		self.assertEqual(get_last_period_closing_voucher(company, date).name, pcv.name)
+
+		accounts = [
+			"Cash - TPC",
+			"Sales - TPC",
+			"Cost of Goods Sold - TPC",
+			pcv.closing_account_head,
+			"Current Assets - TPC",
+			"Application of Funds (Assets) - TPC",
+		]
+		for in_account_currency in (True, False):
+			balances = get_balances_on(
+				accounts, date=date, company=company, in_account_currency=in_account_currency
+			)
+			for account in accounts:
+				self.assertAlmostEqual(
+					balances[account],
+					get_balance_on(
+						account, date=date, company=company, in_account_currency=in_account_currency
+					),
+					msg=account,
+				)
+
+		self.assertAlmostEqual(balances["Cash - TPC"], 100)
+		self.assertAlmostEqual(balances["Sales - TPC"], -300)
+
 	def test_get_voucher_wise_gl_entry(self):
 		pr = make_purchase_receipt(
 			item_code="_Test Item",
@@ -222,10 +222,13 @@ def get_balance_on(
 	else:
 		report_type = ""
 
+	# conditions that also apply on Account Closing Balance
+	closing_balance_cond = []
+
 	if cost_center and report_type == "Profit and Loss":
 		cc = frappe.get_doc("Cost Center", cost_center)
 		if cc.is_group:
-			cond.append(
+			closing_balance_cond.append(
 				f""" exists (
 				select 1 from `tabCost Center` cc where cc.name = gle.cost_center
 				and cc.lft >= {cc.lft} and cc.rgt <= {cc.rgt}
@@ -233,7 +236,7 @@ def get_balance_on(
 			)
 
 		else:
-			cond.append(f"""gle.cost_center = {frappe.db.escape(cost_center, percent=False)} """)
+			closing_balance_cond.append(f"""gle.cost_center = {frappe.db.escape(cost_center, percent=False)} """)
 
 	if account:
 		if not (frappe.flags.ignore_account_permission or ignore_account_permission):
@@ -241,7 +244,7 @@ def get_balance_on(
 
 		# different filter for group and ledger - improved performance
 		if acc.is_group:
-			cond.append(
+			closing_balance_cond.append(
 				f"""exists (
 				select name from `tabAccount` ac where ac.name = gle.account
 				and ac.lft >= {acc.lft} and ac.rgt <= {acc.rgt}
@@ -253,7 +256,7 @@ def get_balance_on(
 			if acc.account_currency == frappe.get_cached_value("Company", acc.company, "default_currency"):
 				in_account_currency = False
 		else:
-			cond.append(f"""gle.account = {frappe.db.escape(account, percent=False)} """)
+			closing_balance_cond.append(f"""gle.account = {frappe.db.escape(account, percent=False)} """)
 
 	if party_type and party:
 		cond.append(
@@ -261,13 +264,34 @@ def get_balance_on(
 		)
 
 	if company:
-		cond.append("""gle.company = %s """ % (frappe.db.escape(company, percent=False)))
+		closing_balance_cond.append("""gle.company = %s """ % (frappe.db.escape(company, percent=False)))
+
+	cond += closing_balance_cond
 
 	if account or (party_type and party):
 		if in_account_currency:
 			select_field = "sum(debit_in_account_currency) - sum(credit_in_account_currency)"
 		else:
 			select_field = "sum(debit) - sum(credit)"
+
+		# start from the last closing balance snapshot, Account Closing Balance doesn't have party
+		closing_balance = 0.0
+		if account and not (party_type and party) and not start_date:
+			last_period_closing_voucher = get_last_period_closing_voucher(acc.company, date)
+			if last_period_closing_voucher:
+				closing_balance = frappe.db.sql(
+					"""
+					SELECT {}
+					FROM `tabAccount Closing Balance` gle
+					WHERE period_closing_voucher = {} and {}""".format(
+						select_field,
+						frappe.db.escape(last_period_closing_voucher.name),
+						" and ".join(closing_balance_cond),
+					)
+				)[0][0]
+				posting_date = frappe.db.escape(cstr(last_period_closing_voucher.posting_date))
+				cond.append(f"posting_date > {posting_date} and is_opening = 'No'")
+
 		bal = frappe.db.sql(
 			"""
 			SELECT {}
@@ -276,7 +300,178 @@ def get_balance_on(
 		)[0][0]
 
 		# if bal is None, return 0
-		return flt(bal)
+		return flt(bal) + flt(closing_balance)
+
+
+def get_last_period_closing_voucher(company, date):
+	"""Last Period Closing Voucher on or before `date` whose closing balances are available."""
+	if frappe.db.get_single_value("Accounts Settings", "ignore_account_closing_balance"):
+		return
+
+	period_closing_voucher = frappe.qb.DocType("Period Closing Voucher")
+
+	last_period_closing_voucher = (
+		frappe.qb.from_(period_closing_voucher)
+		.select(period_closing_voucher.name, period_closing_voucher.posting_date)
+		.where(
+			(period_closing_voucher.docstatus == 1)
+			& (period_closing_voucher.company == company)
+			& (period_closing_voucher.posting_date <= date)
+		)
+		.orderby(period_closing_voucher.posting_date, order=Order.desc)
+		.limit(1)
+	).run(as_dict=True)
+
+	if not last_period_closing_voucher:
+		return
+
+	# closing balances are created in background for large closings
+	if frappe.db.exists(
+		"Account Closing Balance", {"period_closing_voucher": last_period_closing_voucher[0].name}
+	):
+		return last_period_closing_voucher[0]
+
+
+def get_balances_on(
+	accounts=None,
+	date=None,
+	party_type=None,
+	parties=None,
+	company=None,
+	in_account_currency=True,
+):
+	"""Batched version of `get_balance_on`.
+
+	Returns balances keyed by party when `parties` are passed, else keyed by account.
+	Group accounts are rolled up from their ledger accounts."""
+	if not date:
+		date = nowdate()
+
+	if parties:
+		return get_party_balances_on(party_type, parties, company, date, accounts, in_account_currency)
+
+	if not accounts:
+		return {}
+
+	account = frappe.qb.DocType("Account")
+	requested_accounts = (
+		frappe.qb.from_(account)
+		.select(account.name, account.lft, account.rgt, account.is_group, account.account_currency)
+		.where((account.name.isin(accounts)) & (account.company == company))
+	).run(as_dict=True)
+
+	if not requested_accounts:
+		return {}
+
+	ledger_accounts = (
+		frappe.qb.from_(account)
+		.select(account.name, account.lft)
+		.where(
+			(account.company == company)
+			& (account.is_group == 0)
+			& Criterion.any(
+				[
+					account.lft.between(d.lft, d.rgt) if d.is_group else account.name == d.name
+					for d in requested_accounts
+				]
+			)
+		)
+	).run(as_dict=True)
+
+	ledger_balances = {}
+
+	def add_balances(doctype, conditions):
+		table = frappe.qb.DocType(doctype)
+		query = (
+			frappe.qb.from_(table)
+			.select(
+				table.account,
+				(Sum(table.debit) - Sum(table.credit)).as_("balance"),
+				(Sum(table.debit_in_account_currency) - Sum(table.credit_in_account_currency)).as_(
+					"balance_in_account_currency"
+				),
+			)
+			.where(table.company == company)
+			.where(table.account.isin([d.name for d in ledger_accounts]))
+			.groupby(table.account)
+		)
+
+		for condition in conditions(table):
+			query = query.where(condition)
+
+		for d in query.run(as_dict=True):
+			balances = ledger_balances.setdefault(d.account, [0.0, 0.0])
+			balances[0] += flt(d.balance)
+			balances[1] += flt(d.balance_in_account_currency)
+
+	if ledger_accounts:
+		last_period_closing_voucher = get_last_period_closing_voucher(company, date)
+		if last_period_closing_voucher:
+			add_balances(
+				"Account Closing Balance",
+				lambda table: [table.period_closing_voucher == last_period_closing_voucher.name],
+			)
+			add_balances(
+				"GL Entry",
+				lambda table: [
+					table.is_cancelled == 0,
+					table.posting_date.between(add_days(last_period_closing_voucher.posting_date, 1), date),
+					table.is_opening == "No",
+				],
+			)
+		else:
+			add_balances("GL Entry", lambda table: [table.is_cancelled == 0, table.posting_date <= date])
+
+	company_currency = frappe.get_cached_value("Company", company, "default_currency")
+	ledger_lft = {d.name: d.lft for d in ledger_accounts}
+
+	balances = {}
+	for d in requested_accounts:
+		# same as get_balance_on, group accounts in company currency are always in company currency
+		idx = 1 if in_account_currency and not (d.is_group and d.account_currency == company_currency) else 0
+		if d.is_group:
+			balances[d.name] = sum(
+				balance[idx]
+				for ledger, balance in ledger_balances.items()
+				if d.lft <= ledger_lft[ledger] <= d.rgt
+			)
+		else:
+			balances[d.name] = ledger_balances.get(d.name, [0.0, 0.0])[idx]
+
+	return balances
+
+
+def get_party_balances_on(party_type, parties, company, date, accounts=None, in_account_currency=True):
+	gl_entry = frappe.qb.DocType("GL Entry")
+
+	if in_account_currency:
+		balance = Sum(gl_entry.debit_in_account_currency) - Sum(gl_entry.credit_in_account_currency)
+	else:
+		balance = Sum(gl_entry.debit) - Sum(gl_entry.credit)
+
+	query = (
+		frappe.qb.from_(gl_entry)
+		.select(gl_entry.party, balance.as_("balance"))
+		.where(
+			(gl_entry.party_type == party_type)
+			& (gl_entry.party.isin(parties))
+			& (gl_entry.is_cancelled == 0)
+			& (gl_entry.posting_date <= date)
+		)
+		.groupby(gl_entry.party)
+	)
+
+	if company:
+		query = query.where(gl_entry.company == company)
+
+	if accounts:
+		query = query.where(gl_entry.account.isin(accounts))
+
+	balances = dict.fromkeys(parties, 0.0)
+	for d in query.run(as_dict=True):
+		balances[d.party] = flt(d.balance)
+
+	return balances
 
 
 def get_count_on(account, fieldname, date):
@@ -1193,11 +1388,24 @@ def get_account_balances(accounts, company):
 
 	company_currency = frappe.get_cached_value("Company", company, "default_currency")
 
+	frappe.has_permission("Account", "read", throw=True)
+
+	account_names = [account["value"] for account in accounts]
+	balances = get_balances_on(account_names, company=company, in_account_currency=False)
+	balances_in_account_currency = get_balances_on(
+		[
+			account["value"]
+			for account in accounts
+			if account["account_currency"] and account["account_currency"] != company_currency
+		],
+		company=company,
+	)
+
 	for account in accounts:
 		account["company_currency"] = company_currency
-		account["balance"] = flt(get_balance_on(account["value"], in_account_currency=False, company=company))
-		if account["account_currency"] and account["account_currency"] != company_currency:
-			account["balance_in_account_currency"] = flt(get_balance_on(account["value"], company=company))
+		account["balance"] = flt(balances.get(account["value"]))
+		if account["value"] in balances_in_account_currency:
+			account["balance_in_account_currency"] = flt(balances_in_account_currency[account["value"]])
 
 	return accounts
 
@@ -1405,6 +1613,12 @@ def _delete_pl_entries(voucher_type, voucher_no):
 
 
 def _delete_gl_entries(voucher_type, voucher_no):
+	from erpnext.accounts.doctype.account_monthly_balance.account_monthly_balance import (
+		remove_voucher_from_monthly_balances,
+	)
+
+	remove_voucher_from_monthly_balances(voucher_type, voucher_no)
+
 	gle = qb.DocType("GL Entry")
 	qb.from_(gle).delete().where((gle.voucher_type == voucher_type) & (gle.voucher_no == voucher_no)).run()
 
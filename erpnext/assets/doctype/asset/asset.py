@@ -28,9 +28,12 @@ from erpnext.accounts.general_ledger import make_reverse_gl_entries
 from erpnext.accounts.utils import get_fiscal_year
 from erpnext.assets.doctype.asset.depreciation import (
 	get_depreciation_accounts,
+	get_depreciation_amount_in_je,
 	get_disposal_account_and_cost_center,
+	is_consolidated_depreciation_entry,
 	is_first_day_of_the_month,
 	is_last_day_of_the_month,
+	make_reverse_depreciation_entry,
 )
 from erpnext.assets.doctype.asset_category.asset_category import get_asset_category_account
 from erpnext.controllers.accounts_controller import AccountsController
@@ -876,7 +879,21 @@ class Asset(AccountsController):
 	def delete_depreciation_entries(self):
 		if self.calculate_depreciation:
 			for d in self.get("schedules"):
-				if d.journal_entry:
+				if not d.journal_entry:
+					continue
+
+				if is_consolidated_depreciation_entry(d.journal_entry):
+					# only the depreciation of this asset is reversed, on the date it was posted
+					reverse_journal_entry = make_reverse_depreciation_entry(d.journal_entry, self.name)
+					frappe.flags.is_reverse_depr_entry = True
+					reverse_journal_entry.submit()
+					frappe.flags.is_reverse_depr_entry = False
+					d.db_set("journal_entry", None)
+
+					fb_row = self.get("finance_books")[(cint(d.finance_book_id) or 1) - 1]
+					fb_row.value_after_depreciation += get_depreciation_amount_in_je(reverse_journal_entry)
+					fb_row.db_update()
+				else:
 					frappe.get_doc("Journal Entry", d.journal_entry).cancel()
 		else:
 			depr_entries = self.get_manual_depreciation_entries()
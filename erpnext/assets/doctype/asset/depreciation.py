@@ -4,15 +4,17 @@
 
 import frappe
 from frappe import _
-from frappe.query_builder import Order
+from frappe.query_builder import Case, Order
 from frappe.query_builder.functions import Max, Min
 from frappe.utils import (
 	add_months,
 	cint,
+	create_batch,
 	flt,
 	get_first_day,
 	get_last_day,
 	getdate,
+	now,
 	nowdate,
 	today,
 )
@@ -36,6 +38,20 @@ def post_depreciation_entries(date=None):
 	if not date:
 		date = today()
 
+	if cint(frappe.db.get_single_value("Accounts Settings", "post_depreciation_entries_in_bulk")):
+		# companies are posted in parallel, in a job each
+		for company in frappe.get_all("Company", pluck="name"):
+			frappe.enqueue(
+				post_depreciation_entries_in_bulk,
+				queue="long",
+				timeout=10000,
+				job_name=f"post_depreciation_entries_in_bulk::{company}",
+				company=company,
+				date=date,
+				now=frappe.flags.in_test,
+			)
+		return
+
 	failed_asset_names = []
 	error_log_names = []
 
@@ -117,6 +133,316 @@ def get_depreciable_assets(date):
 	return res
 
 
+def post_depreciation_entries_in_bulk(company, date):
+	"""Post the depreciation of the assets of the company due up to the date, with a journal entry per
+	asset category, cost center, finance book and schedule date.
+
+	The due schedule rows are read with one query, and the schedules, finance books and statuses of
+	the assets are updated in bulk. Each asset keeps its own debit and credit lines, referencing it, in
+	the accounts of the journal entry. If the journal entry fails, the depreciation of its assets is
+	posted one asset at a time, with `make_depreciation_entry`."""
+	accounting_dimensions = get_checks_for_pl_and_bs_accounts()
+	depreciation_cost_center, depreciation_series = frappe.get_cached_value(
+		"Company", company, ["depreciation_cost_center", "series_for_depreciation_entry"]
+	)
+
+	schedules_by_entry = {}
+	for row in get_due_depreciation_schedules(company, date, accounting_dimensions):
+		cost_center = row.cost_center or depreciation_cost_center
+		schedules_by_entry.setdefault(
+			(row.asset_category, cost_center, row.finance_book, row.schedule_date), []
+		).append(row)
+
+	credit_and_debit_accounts = {}
+	assets_posted_individually = set()
+	failed_asset_names = set()
+	error_log_names = []
+
+	for (asset_category, cost_center, _finance_book, _schedule_date), schedules in sorted(
+		schedules_by_entry.items(), key=lambda entry: entry[0][3]
+	):
+		# all the due depreciation of the assets posted one at a time has been posted with them
+		schedules = [row for row in schedules if row.asset not in assets_posted_individually]
+		if not schedules:
+			continue
+
+		try:
+			if asset_category not in credit_and_debit_accounts:
+				credit_and_debit_accounts[
+					asset_category
+				] = get_credit_and_debit_accounts_for_asset_category_and_company(asset_category, company)
+
+			make_depreciation_entry_for_assets(
+				company,
+				schedules,
+				cost_center,
+				depreciation_series,
+				credit_and_debit_accounts[asset_category],
+				accounting_dimensions,
+			)
+			frappe.db.commit()
+		except Exception:
+			frappe.db.rollback()
+
+			for asset_name in sorted({row.asset for row in schedules}):
+				assets_posted_individually.add(asset_name)
+				try:
+					make_depreciation_entry(
+						asset_name,
+						date,
+						credit_and_debit_accounts=credit_and_debit_accounts.get(asset_category),
+						depreciation_cost_center_and_depreciation_series=(
+							depreciation_cost_center,
+							depreciation_series,
+						),
+						accounting_dimensions=accounting_dimensions,
+					)
+					frappe.db.commit()
+				except Exception as e:
+					frappe.db.rollback()
+					failed_asset_names.add(asset_name)
+					error_log = frappe.log_error(e)
+					error_log_names.append(error_log.name)
+
+	if failed_asset_names:
+		set_depr_entry_posting_status_for_failed_assets(sorted(failed_asset_names))
+		notify_depr_entry_posting_error(sorted(failed_asset_names), error_log_names)
+
+	frappe.db.commit()
+
+
+def get_due_depreciation_schedules(company, date, accounting_dimensions):
+	a = frappe.qb.DocType("Asset")
+	ds = frappe.qb.DocType("Depreciation Schedule")
+	afb = frappe.qb.DocType("Asset Finance Book")
+
+	dimension_fields = {dimension["fieldname"] for dimension in accounting_dimensions}
+
+	# rows without a finance book id belong to the first finance book, as in
+	# `_make_journal_entry_for_depreciation`
+	finance_book_id = Case().when(ds.finance_book_id > 0, ds.finance_book_id).else_(1)
+
+	query = (
+		frappe.qb.from_(ds)
+		.join(a)
+		.on(a.name == ds.parent)
+		.join(afb)
+		.on((afb.parent == a.name) & (afb.idx == finance_book_id))
+		.select(
+			ds.name,
+			ds.parent.as_("asset"),
+			ds.schedule_date,
+			ds.finance_book,
+			ds.depreciation_amount,
+			afb.name.as_("asset_finance_book"),
+			a.asset_category,
+			a.cost_center,
+			*[a[fieldname] for fieldname in dimension_fields],
+		)
+		.where(ds.parenttype == "Asset")
+		.where(a.company == company)
+		.where(a.calculate_depreciation == 1)
+		.where(a.docstatus == 1)
+		.where(a.status.isin(["Submitted", "Partially Depreciated"]))
+		.where(ds.journal_entry.isnull())
+		.where(ds.schedule_date <= date)
+		.orderby(ds.schedule_date)
+		.orderby(ds.parent)
+	)
+
+	acc_frozen_upto = get_acc_frozen_upto()
+	if acc_frozen_upto:
+		query = query.where(ds.schedule_date > acc_frozen_upto)
+
+	return query.run(as_dict=True)
+
+
+def make_depreciation_entry_for_assets(
+	company,
+	schedules,
+	cost_center,
+	depreciation_series,
+	credit_and_debit_accounts,
+	accounting_dimensions,
+):
+	"Post one journal entry for the schedule rows, all of the same date and finance book"
+	credit_account, debit_account = credit_and_debit_accounts
+	precision = frappe.get_precision("Journal Entry Account", "debit_in_account_currency")
+
+	je = frappe.new_doc("Journal Entry")
+	je.voucher_type = "Depreciation Entry"
+	je.naming_series = depreciation_series
+	je.posting_date = schedules[0].schedule_date
+	je.company = company
+	je.finance_book = schedules[0].finance_book
+
+	total_amount = 0
+	for row in schedules:
+		amount = flt(row.depreciation_amount, precision)
+		total_amount += amount
+
+		je.append(
+			"accounts",
+			{
+				"account": credit_account,
+				"credit_in_account_currency": amount,
+				"reference_type": "Asset",
+				"reference_name": row.asset,
+				"cost_center": cost_center,
+				**get_depreciation_dimensions(row, accounting_dimensions, "mandatory_for_bs"),
+			},
+		)
+		je.append(
+			"accounts",
+			{
+				"account": debit_account,
+				"debit_in_account_currency": amount,
+				"reference_type": "Asset",
+				"reference_name": row.asset,
+				"cost_center": cost_center,
+				**get_depreciation_dimensions(row, accounting_dimensions, "mandatory_for_pl"),
+			},
+		)
+
+	je.remark = f"Depreciation Entry against {len(schedules)} assets worth {flt(total_amount, precision)}"
+
+	je.flags.ignore_permissions = True
+	je.flags.planned_depr_entry = True
+	je.save()
+
+	ds = frappe.qb.DocType("Depreciation Schedule")
+	for names in create_batch([row.name for row in schedules], 1000):
+		frappe.qb.update(ds).set(ds.journal_entry, je.name).where(ds.name.isin(names)).run()
+
+	if not je.meta.get_workflow():
+		je.submit()
+		update_value_after_depreciation(schedules)
+
+	set_status_of_depreciated_assets(list({row.asset for row in schedules}))
+
+
+def get_depreciation_dimensions(asset, accounting_dimensions, mandatory_for):
+	"Accounting dimensions of a depreciation line of the asset, as in `_make_journal_entry_for_depreciation`"
+	dimensions = {}
+	for dimension in accounting_dimensions:
+		if asset.get(dimension["fieldname"]) or dimension.get(mandatory_for):
+			dimensions[dimension["fieldname"]] = asset.get(dimension["fieldname"]) or dimension.get(
+				"default_dimension"
+			)
+
+	return dimensions
+
+
+def update_value_after_depreciation(schedules):
+	"Deduct the depreciation of the schedule rows from the values of their asset finance books"
+	depreciation_amounts = {}
+	for row in schedules:
+		depreciation_amounts.setdefault(row.asset_finance_book, 0)
+		depreciation_amounts[row.asset_finance_book] += flt(row.depreciation_amount)
+
+	afb = frappe.qb.DocType("Asset Finance Book")
+	for names in create_batch(list(depreciation_amounts), 1000):
+		depreciation_amount = Case()
+		for name in names:
+			depreciation_amount = depreciation_amount.when(afb.name == name, depreciation_amounts[name])
+
+		(
+			frappe.qb.update(afb)
+			.set(afb.value_after_depreciation, afb.value_after_depreciation - depreciation_amount)
+			.where(afb.name.isin(names))
+		).run()
+
+
+def set_status_of_depreciated_assets(asset_names):
+	"Set the status of the assets from the values of their default finance books, as `Asset.get_status`"
+	a = frappe.qb.DocType("Asset")
+	afb = frappe.qb.DocType("Asset Finance Book")
+
+	finance_books = {}
+	for names in create_batch(asset_names, 1000):
+		for row in (
+			frappe.qb.from_(afb)
+			.join(a)
+			.on(afb.parent == a.name)
+			.select(
+				a.name.as_("asset"),
+				a.company,
+				a.default_finance_book,
+				a.gross_purchase_amount,
+				a.is_fully_depreciated,
+				afb.finance_book,
+				afb.value_after_depreciation,
+				afb.expected_value_after_useful_life,
+			)
+			.where(a.name.isin(names))
+			.orderby(afb.idx)
+		).run(as_dict=True):
+			finance_books.setdefault(row.asset, []).append(row)
+
+	asset_names_by_status = {}
+	for asset_name, rows in finance_books.items():
+		default_finance_book = rows[0].default_finance_book or erpnext.get_default_finance_book(
+			rows[0].company
+		)
+		row = next(
+			(d for d in rows if default_finance_book and d.finance_book == default_finance_book), rows[0]
+		)
+
+		status = "Submitted"
+		if flt(row.value_after_depreciation) <= flt(row.expected_value_after_useful_life) or cint(
+			row.is_fully_depreciated
+		):
+			status = "Fully Depreciated"
+		elif flt(row.value_after_depreciation) < flt(row.gross_purchase_amount):
+			status = "Partially Depreciated"
+
+		asset_names_by_status.setdefault(status, []).append(asset_name)
+
+	for status, status_asset_names in asset_names_by_status.items():
+		for names in create_batch(status_asset_names, 1000):
+			(
+				frappe.qb.update(a)
+				.set(a.status, status)
+				.set(a.depr_entry_posting_status, "Successful")
+				.set(a.modified, now())
+				.where(a.name.isin(names))
+			).run()
+
+
+def is_consolidated_depreciation_entry(journal_entry):
+	"Whether the depreciation entry was posted for more than one asset"
+	return (
+		len(
+			frappe.get_all(
+				"Journal Entry Account",
+				filters={"parent": journal_entry, "reference_type": "Asset"},
+				pluck="reference_name",
+				distinct=True,
+			)
+		)
+		> 1
+	)
+
+
+def make_reverse_depreciation_entry(journal_entry, asset_name):
+	"""Reverse journal entry of the depreciation entry, of only the lines of the asset if it was
+	posted for more than one asset"""
+	reverse_journal_entry = make_reverse_journal_entry(journal_entry)
+
+	if is_consolidated_depreciation_entry(journal_entry):
+		accounts = [
+			d
+			for d in reverse_journal_entry.accounts
+			if d.reference_type == "Asset" and d.reference_name == asset_name
+		]
+		for idx, d in enumerate(accounts, 1):
+			d.idx = idx
+
+		reverse_journal_entry.set("accounts", accounts)
+
+	return reverse_journal_entry
+
+
 def get_acc_frozen_upto():
 	acc_frozen_upto = frappe.db.get_single_value("Accounts Settings", "acc_frozen_upto")
 
@@ -514,7 +840,7 @@ def reverse_depreciation_entry_made_after_disposal(asset, date):
 			if not disposal_was_made_on_original_schedule_date(
 				asset, schedule, row, date
 			) or disposal_happens_in_the_future(date):
-				reverse_journal_entry = make_reverse_journal_entry(schedule.journal_entry)
+				reverse_journal_entry = make_reverse_depreciation_entry(schedule.journal_entry, asset.name)
 				reverse_journal_entry.posting_date = nowdate()
 
 				for account in reverse_journal_entry.accounts:
@@ -2,8 +2,10 @@
 # See license.txt
 
 import unittest
+from unittest.mock import patch
 
 import frappe
+from frappe.tests.utils import change_settings
 from frappe.utils import (
 	add_days,
 	add_months,
@@ -1180,6 +1182,96 @@ class TestDepreciationBasics(AssetSetup):
 		self.assertFalse(asset.schedules[1].journal_entry)
 		self.assertFalse(asset.schedules[2].journal_entry)
 
+	@change_settings("Accounts Settings", {"post_depreciation_entries_in_bulk": 1})
+	def test_post_depreciation_entries_in_bulk(self):
+		"""Depreciation of the assets of a category and date is posted with one journal entry, and
+		reversed only for the asset that is cancelled"""
+		assets = [
+			create_asset(
+				item_code="Macbook Pro",
+				calculate_depreciation=1,
+				available_for_use_date="2019-12-31",
+				depreciation_start_date="2020-12-31",
+				frequency_of_depreciation=12,
+				total_number_of_depreciations=3,
+				expected_value_after_useful_life=10000,
+				submit=1,
+			)
+			for i in range(2)
+		]
+
+		# rows without a finance book id are depreciated in the first finance book
+		assets[1].schedules[0].db_set("finance_book_id", None)
+
+		post_depreciation_entries(date="2021-06-01")
+		for asset in assets:
+			asset.load_from_db()
+
+		amount = assets[0].schedules[0].depreciation_amount
+		je = frappe.get_doc("Journal Entry", assets[0].schedules[0].journal_entry)
+		self.assertEqual(assets[1].schedules[0].journal_entry, je.name)
+		self.assertFalse(assets[0].schedules[1].journal_entry)
+		self.assertEqual(je.docstatus, 1)
+
+		# every asset keeps its own lines in the journal entry
+		for asset in assets:
+			self.assertEqual(
+				sorted((d.debit, d.credit) for d in je.accounts if d.reference_name == asset.name),
+				[(0, amount), (amount, 0)],
+			)
+			self.assertEqual(asset.status, "Partially Depreciated")
+			self.assertEqual(asset.depr_entry_posting_status, "Successful")
+			self.assertEqual(asset.finance_books[0].value_after_depreciation, 100000 - amount)
+
+		assets[0].cancel()
+		for asset in assets:
+			asset.load_from_db()
+
+		self.assertEqual(frappe.db.get_value("Journal Entry", je.name, "docstatus"), 1)
+		self.assertEqual(assets[1].schedules[0].journal_entry, je.name)
+		self.assertEqual(assets[1].finance_books[0].value_after_depreciation, 100000 - amount)
+
+		# only the lines of the cancelled asset are reversed
+		reverse_je = frappe.get_doc("Journal Entry", {"reversal_of": je.name, "docstatus": 1})
+		self.assertEqual(reverse_je.total_debit, amount)
+		self.assertEqual({d.reference_name for d in reverse_je.accounts}, {assets[0].name})
+		self.assertFalse(assets[0].schedules[0].journal_entry)
+		self.assertEqual(assets[0].finance_books[0].value_after_depreciation, 100000)
+
+	@change_settings("Accounts Settings", {"post_depreciation_entries_in_bulk": 1})
+	def test_post_depreciation_entries_in_bulk_for_each_asset_on_failure(self):
+		"Depreciation of the assets of a journal entry that fails is posted one asset at a time"
+		from erpnext.assets.doctype.asset import depreciation
+
+		assets = [
+			create_asset(
+				item_code="Macbook Pro",
+				calculate_depreciation=1,
+				available_for_use_date="2019-12-31",
+				depreciation_start_date="2020-12-31",
+				frequency_of_depreciation=12,
+				total_number_of_depreciations=3,
+				expected_value_after_useful_life=10000,
+				submit=1,
+			)
+			for i in range(2)
+		]
+
+		# the failed journal entry is not written, the assets of the test are kept
+		with patch.object(frappe.db, "rollback"), patch.object(
+			depreciation, "make_depreciation_entry_for_assets", side_effect=frappe.ValidationError
+		):
+			post_depreciation_entries(date="2021-06-01")
+
+		for asset in assets:
+			asset.load_from_db()
+			je = frappe.get_doc("Journal Entry", asset.schedules[0].journal_entry)
+
+			self.assertEqual(je.docstatus, 1)
+			self.assertEqual({d.reference_name for d in je.accounts}, {asset.name})
+			self.assertFalse(asset.schedules[1].journal_entry)
+			self.assertEqual(asset.depr_entry_posting_status, "Successful")
+
 	def test_depr_entry_posting_when_depr_expense_account_is_an_expense_account(self):
 		"""Tests if the Depreciation Expense Account gets debited and the Accumulated Depreciation Account gets credited when the former's an Expense Account."""
 
@@ -2,10 +2,42 @@
 # GPL v3 License. See license.txt
 
 import click
+from frappe.commands import get_site, pass_context
 
 
 def call_command(cmd, context):
 	return click.Context(cmd, obj=context).forward(cmd)
 
 
-commands = []
+@click.command("reconcile-account-monthly-balances")
+@click.option("--company", help="Reconcile the balances of this company only")
+@click.option("--from-date", help="Reconcile the months from this date only")
+@click.option("--repair", is_flag=True, default=False, help="Rebuild the months that do not match")
+@pass_context
+def reconcile_account_monthly_balances(context, company=None, from_date=None, repair=False):
+	"Compare the Account Monthly Balances with the GL Entries"
+	import frappe
+
+	from erpnext.accounts.doctype.account_monthly_balance.account_monthly_balance import (
+		reconcile_account_monthly_balances,
+	)
+
+	frappe.init(site=get_site(context))
+	frappe.connect()
+	try:
+		mismatches = reconcile_account_monthly_balances(company, from_date, repair=repair)
+		for company_name, period_start_date in mismatches:
+			click.echo(f"{company_name}: {period_start_date} does not match the GL Entries")
+
+		if repair:
+			frappe.db.commit()
+			click.echo(f"Rebuilt {len(mismatches)} months")
+		elif mismatches:
+			raise SystemExit(1)
+		else:
+			click.echo("Account Monthly Balances match the GL Entries")
+	finally:
+		frappe.destroy()
+
+
+commands = [reconcile_account_monthly_balances]
@@ -14,6 +14,7 @@ from frappe.utils import nowdate, unique
 from pypika import Order
 
 import erpnext
+from erpnext.stock.doctype.item_search_index.item_search_index import get_fulltext_search_term
 from erpnext.stock.get_item_details import _get_item_tax_template
 
 
@@ -271,58 +272,112 @@ def item_query(doctype, txt, searchfield, start, page_len, filters, as_dict=Fals
 	if frappe.db.count(doctype, cache=True) < 50000:
 		# scan description only if items are less than 50000
 		description_cond = "or tabItem.description LIKE %(txt)s"
-	
-	return frappe.db.sql(
+
+	search_join = search_rank = ""
+	search_term = get_fulltext_search_term(txt)
+	if search_term:
+		# large catalogues are searched through the fulltext index, ranked by relevance
+		search_join = "inner join `tabItem Search Index` on `tabItem Search Index`.item_code = tabItem.name"
+		search_cond = "match(`tabItem Search Index`.search_text) against (%(search_term)s in boolean mode)"
+		search_rank = search_cond + " desc,"
+	else:
+		search_cond = f"""{searchfields}
+			or tabItem.item_code IN (select parent from `tabItem Barcode` where barcode LIKE %(txt)s)
+			{description_cond}"""
+
+	items = frappe.db.sql(
 		"""select
-			tabItem.name,
-			if (
-				CAST(COALESCE(SUM(tabBin.actual_qty),0) as int) > 0,
-				CONCAT("Stock: <b style='color:#33cc33;;'>", CAST(COALESCE(SUM(tabBin.actual_qty),0) as int),"</b>"),
-				CONCAT("Stock: <b style='color:#ff0000;'>", CAST(COALESCE(SUM(tabBin.actual_qty),0) as int),"</b>")
-			) as available,
-			CONCAT("BO: <b>", CAST(COALESCE(SUM(tabBin.reserved_qty),0) as int),"</b>") as backorder,
-			CONCAT("On Order: <b>", CAST(COALESCE(SUM(tabBin.ordered_qty),0) as int),"</b>") as on_order
+			tabItem.name
 			{columns}
-		from 
+		from
 			tabItem
-		LEFT JOIN
-			tabBin
-		ON
-			tabItem.item_code = tabBin.item_code
+			{search_join}
 		where tabItem.docstatus < 2
 			and tabItem.disabled=0
 			and tabItem.has_variants=0
 			and (tabItem.end_of_life > %(today)s or ifnull(tabItem.end_of_life, '0000-00-00')='0000-00-00')
-			and ({scond} or tabItem.item_code IN (select parent from `tabItem Barcode` where barcode LIKE %(txt)s)
-				{description_cond})
+			and ({search_cond})
 			{fcond} {mcond}
-		group by
-			tabItem.item_code,
-			tabBin.item_code
 		order by
 			if(locate(%(_txt)s, tabItem.name), locate(%(_txt)s, tabItem.name), 99999),
 			if(locate(%(_txt)s, tabItem.item_name), locate(%(_txt)s, tabItem.item_name), 99999),
+			{search_rank}
 			tabItem.brand,
 			tabItem.idx asc,
-			tabItem.name, 
+			tabItem.name,
 			tabItem.item_name
 		limit %(start)s, %(page_len)s """.format(
 			columns=columns,
-			scond=searchfields,
+			search_join=search_join,
+			search_cond=search_cond,
+			search_rank=search_rank,
 			fcond=get_filters_cond(doctype, filters, conditions).replace("%", "%%"),
 			mcond=get_match_cond(doctype).replace("%", "%%"),
-			description_cond=description_cond,
 		),
 		{
 			"today": nowdate(),
 			"txt": "%%%s%%" % txt,
 			"_txt": txt.replace("%", ""),
+			"search_term": search_term,
 			"start": start,
 			"page_len": page_len,
 		},
-		as_dict=as_dict
+		as_dict=as_dict,
 	)
 
+	# stock summary is looked up separately for the page of items, instead of joining all the bins
+	if as_dict:
+		stock_summary = get_item_stock_summary([d.name for d in items])
+		return [frappe._dict({"name": d.name, **stock_summary[d.name], **d}) for d in items]
+
+	stock_summary = get_item_stock_summary([d[0] for d in items])
+	return [(d[0], *stock_summary[d[0]].values(), *d[1:]) for d in items]
+
+
+def get_item_stock_summary(item_codes):
+	"""Stock, reserved and ordered qty of the items across warehouses, as shown in Item link fields.
+
+	Cached for a minute, since it is looked up on every keystroke.
+	"""
+	stock_summary = {}
+	for item_code in item_codes:
+		if (qty := frappe.cache().get_value(f"item_stock_summary:{item_code}")) is not None:
+			stock_summary[item_code] = qty
+
+	if items_to_fetch := [item_code for item_code in item_codes if item_code not in stock_summary]:
+		bins = frappe.db.sql(
+			"""select
+				item_code,
+				CAST(COALESCE(SUM(actual_qty),0) as int),
+				CAST(COALESCE(SUM(reserved_qty),0) as int),
+				CAST(COALESCE(SUM(ordered_qty),0) as int)
+			from tabBin
+			where item_code in %(items)s
+			group by item_code""",
+			{"items": tuple(items_to_fetch)},
+		)
+		qty_by_item = {d[0]: list(d[1:]) for d in bins}
+
+		for item_code in items_to_fetch:
+			qty = qty_by_item.get(item_code) or [0, 0, 0]
+			frappe.cache().set_value(f"item_stock_summary:{item_code}", qty, expires_in_sec=60)
+			stock_summary[item_code] = qty
+
+	return {item_code: format_stock_summary(*qty) for item_code, qty in stock_summary.items()}
+
+
+def format_stock_summary(actual_qty, reserved_qty, ordered_qty):
+	if actual_qty > 0:
+		available = f"Stock: <b style='color:#33cc33;;'>{actual_qty}</b>"
+	else:
+		available = f"Stock: <b style='color:#ff0000;'>{actual_qty}</b>"
+
+	return {
+		"available": available,
+		"backorder": f"BO: <b>{reserved_qty}</b>",
+		"on_order": f"On Order: <b>{ordered_qty}</b>",
+	}
+
 
 @frappe.whitelist()
 @frappe.validate_and_sanitize_search_inputs
@@ -225,6 +225,8 @@ class StatusUpdater(Document):
 				# if target_ref_field is not specified, the programmer does not want to validate qty / amount
 				continue
 
+			rows_over_limit = self.get_target_rows_over_limit(args)
+
 			# get unique transactions to update
 			for d in self.get_all_children():
 				if hasattr(d, "qty") and d.qty < 0 and not self.get("is_return"):
@@ -248,17 +250,9 @@ class StatusUpdater(Document):
 				if d.doctype == args["source_dt"] and d.get(args["join_field"]):
 					args["name"] = d.get(args["join_field"])
 
-					# get all qty where qty > target_field
-					item = frappe.db.sql(
-						"""select item_code, `{target_ref_field}`,
-						`{target_field}`, parenttype, parent from `tab{target_dt}`
-						where `{target_ref_field}` < `{target_field}`
-						and name=%s and docstatus=1""".format(**args),
-						args["name"],
-						as_dict=1,
-					)
+					item = rows_over_limit.get(args["name"])
 					if item:
-						item = item[0]
+						item = frappe._dict(item)
 						item["idx"] = d.idx
 						item["target_ref_field"] = args["target_ref_field"].replace("_", " ")
 
@@ -272,6 +266,23 @@ class StatusUpdater(Document):
 						elif item[args["target_ref_field"]]:
 							self.check_overflow_with_allowance(item, args)
 
+	def get_target_rows_over_limit(self, args):
+		"""Target rows of all the rows of the document where qty > target_field, by name"""
+		detail_ids = set(d.get(args["join_field"]) for d in self.get_all_children(args["source_dt"]))
+		detail_ids = sorted(detail_id for detail_id in detail_ids if detail_id)
+		if not detail_ids:
+			return {}
+
+		rows = frappe.db.sql(
+			"""select name, item_code, `{target_ref_field}`,
+			`{target_field}`, parenttype, parent from `tab{target_dt}`
+			where `{target_ref_field}` < `{target_field}`
+			and name in ({names}) and docstatus=1""".format(names=get_escaped_names(detail_ids), **args),
+			as_dict=1,
+		)
+
+		return {row.pop("name"): row for row in rows}
+
 	def check_overflow_with_allowance(self, item, args):
 		"""
 		Checks if there is overflow condering a relaxation allowance
@@ -389,103 +400,123 @@ class StatusUpdater(Document):
 				self._update_percent_field_in_targets(args, update_modified)
 
 	def _update_children(self, args, update_modified):
-		"""Update quantities or amount in child table"""
-		for d in self.get_all_children():
-			if d.doctype != args["source_dt"]:
-				continue
+		"""Update quantities or amount in child table
 
-			self._update_modified(args, update_modified)
+		Quantities of all the target rows are summed up with one grouped query per source doctype,
+		and set with one update."""
+		children = self.get_all_children(args["source_dt"])
+		if not children:
+			return
 
-			# updates qty in the child table
-			args["detail_id"] = d.get(args["join_field"])
+		self._update_modified(args, update_modified)
 
-			args["second_source_condition"] = ""
-			if (
-				args.get("second_source_dt")
-				and args.get("second_source_field")
-				and args.get("second_join_field")
-			):
-				if not args.get("second_source_extra_cond"):
-					args["second_source_extra_cond"] = ""
-
-				args["second_source_condition"] = frappe.db.sql(
-					""" select ifnull((select sum({second_source_field})
-					from `tab{second_source_dt}`
-					where `{second_join_field}`='{detail_id}'
-					and (`tab{second_source_dt}`.docstatus=1)
-					{second_source_extra_cond}), 0) """.format(**args)
-				)[0][0]
+		detail_ids = sorted({d.get(args["join_field"]) for d in children if d.get(args["join_field"])})
+		if not detail_ids:
+			return
 
-			if args["detail_id"]:
-				if not args.get("extra_cond"):
-					args["extra_cond"] = ""
-
-				args["source_dt_value"] = (
-					frappe.db.sql(
-						"""
-						(select ifnull(sum({source_field}), 0)
-							from `tab{source_dt}` where `{join_field}`='{detail_id}'
-							and (docstatus=1 {cond}) {extra_cond})
-				""".format(**args)
-					)[0][0]
-					or 0.0
-				)
+		if not args.get("extra_cond"):
+			args["extra_cond"] = ""
 
-				if args["second_source_condition"]:
-					args["source_dt_value"] += flt(args["second_source_condition"])
+		source_dt_values = get_total_by_detail(
+			args["source_dt"],
+			args["source_field"],
+			args["join_field"],
+			detail_ids,
+			"(docstatus=1 {cond}) {extra_cond}".format(**args),
+		)
 
-				frappe.db.sql(
-					"""update `tab{target_dt}`
-					set {target_field} = {source_dt_value} {update_modified}
-					where name='{detail_id}'""".format(**args)
-				)
+		if args.get("second_source_dt") and args.get("second_source_field") and args.get("second_join_field"):
+			if not args.get("second_source_extra_cond"):
+				args["second_source_extra_cond"] = ""
+
+			second_source_values = get_total_by_detail(
+				args["second_source_dt"],
+				args["second_source_field"],
+				args["second_join_field"],
+				detail_ids,
+				"(`tab{second_source_dt}`.docstatus=1) {second_source_extra_cond}".format(**args),
+			)
+			for detail_id, value in second_source_values.items():
+				source_dt_values[detail_id] = flt(source_dt_values.get(detail_id)) + flt(value)
+
+		frappe.db.sql(
+			"""update `tab{target_dt}`
+			set {target_field} = case name {values} end {update_modified}
+			where name in ({names})""".format(
+				values=" ".join(
+					f"when {frappe.db.escape(d)} then {flt(source_dt_values.get(d))}" for d in detail_ids
+				),
+				names=get_escaped_names(detail_ids),
+				**args,
+			)
+		)
 
 	def _update_percent_field_in_targets(self, args, update_modified=True):
 		"""Update percent field in parent transaction"""
 		if args.get("percent_join_field_parent"):
 			# if reference to target doc where % is to be updated, is
 			# in source doc's parent form, consider percent_join_field_parent
-			args["name"] = self.get(args["percent_join_field_parent"])
-			self._update_percent_field(args, update_modified)
+			names = [self.get(args["percent_join_field_parent"])]
 		else:
 			distinct_transactions = set(
 				d.get(args["percent_join_field"]) for d in self.get_all_children(args["source_dt"])
 			)
+			names = sorted(name for name in distinct_transactions if name)
 
-			for name in distinct_transactions:
-				if name:
-					args["name"] = name
-					self._update_percent_field(args, update_modified)
+		self._update_percent_fields(args, names, update_modified)
 
 	def _update_percent_field(self, args, update_modified=True):
 		"""Update percent field in parent transaction"""
+		self._update_percent_fields(args, [args["name"]], update_modified)
+
+	def _update_percent_fields(self, args, names, update_modified=True):
+		"""Update percent field in the parent transactions, with one grouped query and one update"""
 
 		self._update_modified(args, update_modified)
 
-		if args.get("target_parent_field"):
+		names = [name for name in names if name]
+		if not (args.get("target_parent_field") and names):
+			return
+
+		escaped_names = get_escaped_names(names)
+		percentages = dict(
 			frappe.db.sql(
-				"""update `tab{target_parent_dt}`
-				set {target_parent_field} = round(
-					ifnull((select
-						ifnull(sum(case when abs({target_ref_field}) > abs({target_field}) then abs({target_field}) else abs({target_ref_field}) end), 0)
-						/ sum(abs({target_ref_field})) * 100
-					from `tab{target_dt}` where parent='{name}' and parenttype='{target_parent_dt}' having sum(abs({target_ref_field})) > 0), 0), 6)
-					{update_modified}
-				where name='{name}'""".format(**args)
+				"""select parent, round(
+					ifnull(sum(case when abs({target_ref_field}) > abs({target_field}) then abs({target_field}) else abs({target_ref_field}) end), 0)
+					/ sum(abs({target_ref_field})) * 100, 6)
+				from `tab{target_dt}` where parent in ({names}) and parenttype='{target_parent_dt}'
+				group by parent having sum(abs({target_ref_field})) > 0""".format(
+					names=escaped_names, **args
+				)
 			)
+		)
 
-			# update field
-			if args.get("status_field"):
-				frappe.db.sql(
-					"""update `tab{target_parent_dt}`
-					set {status_field} = (case when {target_parent_field}<0.001 then 'Not {keyword}'
-					else case when {target_parent_field}>=99.999999 then 'Fully {keyword}'
-					else 'Partly {keyword}' end end)
-					where name='{name}'""".format(**args)
-				)
+		frappe.db.sql(
+			"""update `tab{target_parent_dt}`
+			set {target_parent_field} = case name {values} end
+				{update_modified}
+			where name in ({names})""".format(
+				values=" ".join(
+					f"when {frappe.db.escape(name)} then {flt(percentages.get(name))}" for name in names
+				),
+				names=escaped_names,
+				**args,
+			)
+		)
 
-			if update_modified:
-				target = frappe.get_doc(args["target_parent_dt"], args["name"])
+		# update field
+		if args.get("status_field"):
+			frappe.db.sql(
+				"""update `tab{target_parent_dt}`
+				set {status_field} = (case when {target_parent_field}<0.001 then 'Not {keyword}'
+				else case when {target_parent_field}>=99.999999 then 'Fully {keyword}'
+				else 'Partly {keyword}' end end)
+				where name in ({names})""".format(names=escaped_names, **args)
+			)
+
+		if update_modified:
+			for name in names:
+				target = frappe.get_doc(args["target_parent_dt"], name)
 				target.set_status(update=True)
 				target.notify_update()
 
@@ -558,6 +589,21 @@ class StatusUpdater(Document):
 			ref_doc.set_status(update=True)
 
 
+def get_total_by_detail(doctype, field, join_field, detail_ids, condition):
+	"Sum of `field` of the rows of `doctype` by the row they are made against, in one query"
+	return dict(
+		frappe.db.sql(
+			f"""select `{join_field}`, ifnull(sum({field}), 0) from `tab{doctype}`
+			where `{join_field}` in ({get_escaped_names(detail_ids)}) and {condition}
+			group by `{join_field}`"""
+		)
+	)
+
+
+def get_escaped_names(names):
+	return ", ".join(frappe.db.escape(name) for name in names)
+
+
 @frappe.request_cache
 def get_allowance_for(
 	item_code,
@@ -21,10 +21,15 @@ from erpnext.controllers.accounts_controller import (
 from erpnext.stock.get_item_details import _get_item_tax_template
 from erpnext.utilities.regional import temporary_flag
 
+# taxes of documents with at least these many items are calculated a tax at a time for all the
+# items, see `calculate_taxes_by_column`
+TAX_MATRIX_MIN_ITEMS = 50
+
 
 class calculate_taxes_and_totals:
 	def __init__(self, doc: Document):
 		self.doc = doc
+		self._item_tax_maps = {}
 		frappe.flags.round_off_applicable_accounts = []
 
 		self._items = self.filter_rows() if self.doc.doctype == "Quotation" else self.doc.get("items")
@@ -292,7 +297,14 @@ class calculate_taxes_and_totals:
 				self._set_in_company_currency(item, ["net_rate", "net_amount"])
 
 	def _load_item_tax_rate(self, item_tax_rate):
-		return json.loads(item_tax_rate) if item_tax_rate else {}
+		if not item_tax_rate:
+			return {}
+
+		# items share a handful of tax templates, and taxes are calculated more than once per save
+		if item_tax_rate not in self._item_tax_maps:
+			self._item_tax_maps[item_tax_rate] = json.loads(item_tax_rate)
+
+		return self._item_tax_maps[item_tax_rate]
 
 	def get_current_tax_fraction(self, tax, item_tax_map):
 		"""
@@ -366,6 +378,9 @@ class calculate_taxes_and_totals:
 			self._calculate()
 
 	def calculate_taxes(self):
+		if len(self._items) >= TAX_MATRIX_MIN_ITEMS and self.can_calculate_taxes_by_column():
+			return self.calculate_taxes_by_column()
+
 		rounding_adjustment_computed = self.doc.get("is_consolidated") and self.doc.get("rounding_adjustment")
 		if not rounding_adjustment_computed:
 			self.doc.rounding_adjustment = 0
@@ -440,6 +455,142 @@ class calculate_taxes_and_totals:
 							self.doc.precision("rounding_adjustment"),
 						)
 
+	def can_calculate_taxes_by_column(self):
+		"Taxes on previous rows have to refer to an earlier row, as validated on save"
+		taxes = self.doc.get("taxes")
+		if len({tax.idx for tax in taxes}) != len(taxes):
+			return False
+
+		return all(
+			1 <= cint(tax.row_id) <= i
+			for i, tax in enumerate(taxes)
+			if tax.charge_type in ("On Previous Row Amount", "On Previous Row Total")
+		)
+
+	def calculate_taxes_by_column(self):
+		"""Same as `calculate_taxes`, over a matrix of items and taxes.
+
+		The rates of each tax are looked up once for all the items, and the amounts of a tax are
+		calculated from the columns of the earlier taxes. Amounts of every item are calculated and added
+		up in the same order as `calculate_taxes` does, so the results are the same to the last digit.
+		"""
+		rounding_adjustment_computed = self.doc.get("is_consolidated") and self.doc.get("rounding_adjustment")
+		if not rounding_adjustment_computed:
+			self.doc.rounding_adjustment = 0
+
+		taxes = self.doc.get("taxes")
+		item_tax_maps = [self._load_item_tax_rate(item.item_tax_rate) for item in self._items]
+		net_amounts = [item.net_amount for item in self._items]
+		item_wise_tax_keys = [item.item_code or item.item_name for item in self._items]
+
+		# tax amount for each item, and grand total up to the tax for each item, by tax
+		tax_amount_columns, grand_total_columns = [], []
+
+		for i, tax in enumerate(taxes):
+			rate_precision = self.doc.precision("rate", tax)
+			tax_rates = [
+				flt(item_tax_map.get(tax.account_head), rate_precision)
+				if tax.account_head in item_tax_map
+				else tax.rate
+				for item_tax_map in item_tax_maps
+			]
+
+			if tax.charge_type == "Actual":
+				actual = flt(tax.tax_amount, tax.precision("tax_amount"))
+				net_total = self.doc.net_total
+				current_tax_amounts = [
+					net_amount * actual / net_total if net_total else 0.0 for net_amount in net_amounts
+				]
+			elif tax.charge_type == "On Net Total":
+				current_tax_amounts = [
+					(tax_rate / 100.0) * net_amount
+					for tax_rate, net_amount in zip(tax_rates, net_amounts, strict=True)
+				]
+			elif tax.charge_type == "On Previous Row Amount":
+				current_tax_amounts = [
+					(tax_rate / 100.0) * amount
+					for tax_rate, amount in zip(
+						tax_rates, tax_amount_columns[cint(tax.row_id) - 1], strict=True
+					)
+				]
+			elif tax.charge_type == "On Previous Row Total":
+				current_tax_amounts = [
+					(tax_rate / 100.0) * amount
+					for tax_rate, amount in zip(
+						tax_rates, grand_total_columns[cint(tax.row_id) - 1], strict=True
+					)
+				]
+			elif tax.charge_type == "On Item Quantity":
+				current_tax_amounts = [
+					tax_rate * item.qty for tax_rate, item in zip(tax_rates, self._items, strict=True)
+				]
+			else:
+				current_tax_amounts = [0.0] * len(self._items)
+
+			if not (self.doc.get("is_consolidated") or tax.get("dont_recompute_tax")):
+				for key, tax_rate, current_tax_amount in zip(
+					item_wise_tax_keys, tax_rates, current_tax_amounts, strict=True
+				):
+					item_wise_tax_amount = current_tax_amount * self.doc.conversion_rate
+					if tax.item_wise_tax_detail.get(key):
+						item_wise_tax_amount += tax.item_wise_tax_detail[key][1]
+
+					tax.item_wise_tax_detail[key] = [tax_rate, flt(item_wise_tax_amount)]
+
+			# Adjust divisional loss to the last item
+			if tax.charge_type == "Actual":
+				remaining_tax_amount = flt(tax.tax_amount, tax.precision("tax_amount"))
+				for current_tax_amount in current_tax_amounts:
+					remaining_tax_amount -= current_tax_amount
+				current_tax_amounts[-1] += remaining_tax_amount
+
+			add_to_tax_amount = tax.charge_type != "Actual" and not (
+				self.discount_amount_applied and self.doc.apply_discount_on == "Grand Total"
+			)
+			previous_grand_totals = grand_total_columns[i - 1] if i else None
+			grand_totals = []
+
+			for n, current_tax_amount in enumerate(current_tax_amounts):
+				if add_to_tax_amount:
+					tax.tax_amount += current_tax_amount
+				tax.tax_amount_after_discount_amount += current_tax_amount
+
+				current_tax_amount = self.get_tax_amount_if_for_valuation_or_deduction(
+					current_tax_amount, tax
+				)
+				if i == 0:
+					grand_totals.append(flt(net_amounts[n] + current_tax_amount))
+				else:
+					grand_totals.append(flt(previous_grand_totals[n] + current_tax_amount))
+
+			tax_amount_columns.append(current_tax_amounts)
+			grand_total_columns.append(grand_totals)
+
+			# values of the last item, as left by `calculate_taxes`
+			tax.tax_amount_for_current_item = current_tax_amounts[-1]
+			tax.grand_total_for_current_item = grand_totals[-1]
+
+			self.round_off_totals(tax)
+			self._set_in_company_currency(tax, ["tax_amount", "tax_amount_after_discount_amount"])
+
+			self.round_off_base_values(tax)
+			self.set_cumulative_total(i, tax)
+
+			self._set_in_company_currency(tax, ["total"])
+
+			# adjust Discount Amount loss in last tax iteration
+			if (
+				i == (len(taxes) - 1)
+				and self.discount_amount_applied
+				and self.doc.discount_amount
+				and self.doc.apply_discount_on == "Grand Total"
+				and not rounding_adjustment_computed
+			):
+				self.doc.rounding_adjustment = flt(
+					self.doc.grand_total - flt(self.doc.discount_amount) - tax.total,
+					self.doc.precision("rounding_adjustment"),
+				)
+
 	def get_tax_amount_if_for_valuation_or_deduction(self, tax_amount, tax):
 		# if just for valuation, do not add the tax amount in total
 		# if tax/charges is for deduction, multiply by -1
@@ -59,6 +59,20 @@ class TestQueries(unittest.TestCase):
 		query(txt="", filters={"supplier": None})
 		query(txt="", filters={"supplier": ""})
 
+	def test_item_query_stock_summary(self):
+		query = add_default_params(queries.item_query, "Item")
+		item_code = "_Test Item"
+
+		actual_qty = frappe.db.sql(
+			"select CAST(COALESCE(SUM(actual_qty),0) as int) from tabBin where item_code=%s", item_code
+		)[0][0]
+		frappe.cache().delete_value(f"item_stock_summary:{item_code}")
+
+		for row in (query(txt=item_code), query(txt=item_code, as_dict=True)):
+			row = next(d for d in row if (d.name if isinstance(d, dict) else d[0]) == item_code)
+			available = row.available if isinstance(row, dict) else row[1]
+			self.assertIn(f">{actual_qty}</b>", available)
+
 	def test_bom_qury(self):
 		query = add_default_params(queries.bom, "BOM")
 
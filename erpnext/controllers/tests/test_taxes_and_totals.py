@@ -0,0 +1,170 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import frappe
+
+from erpnext.controllers import taxes_and_totals
+from erpnext.controllers.taxes_and_totals import calculate_taxes_and_totals
+
+TAX_FIELDS = [
+	"tax_amount",
+	"base_tax_amount",
+	"tax_amount_after_discount_amount",
+	"base_tax_amount_after_discount_amount",
+	"total",
+	"base_total",
+	"item_wise_tax_detail",
+]
+ITEM_FIELDS = ["net_rate", "net_amount", "base_net_rate", "base_net_amount"]
+DOC_FIELDS = [
+	"net_total",
+	"base_net_total",
+	"total_taxes_and_charges",
+	"base_total_taxes_and_charges",
+	"grand_total",
+	"base_grand_total",
+	"rounding_adjustment",
+	"rounded_total",
+]
+
+# item tax rates of the items, in turns
+ITEM_TAX_RATES = [
+	None,
+	{"_Test Account VAT - _TC": 5},
+	{"_Test Account VAT - _TC": 0, "_Test Account Customs Duty - _TC": 1.75},
+	None,
+	{"_Test Account Excise Duty - _TC": 18},
+]
+
+# golden corpus, each case is calculated item by item and tax by tax with the same results
+TAX_CASES = {
+	"exclusive": [
+		{"charge_type": "On Net Total", "account_head": "_Test Account VAT - _TC", "rate": 12.5},
+		{
+			"charge_type": "Actual",
+			"account_head": "_Test Account Shipping Charges - _TC",
+			"tax_amount": 100.37,
+		},
+		{
+			"charge_type": "On Previous Row Amount",
+			"account_head": "_Test Account Excise Duty - _TC",
+			"rate": 10,
+			"row_id": 1,
+		},
+		{
+			"charge_type": "On Previous Row Total",
+			"account_head": "_Test Account Education Cess - _TC",
+			"rate": 3,
+			"row_id": 3,
+		},
+		{"charge_type": "On Item Quantity", "account_head": "_Test Account Customs Duty - _TC", "rate": 2.5},
+		{"charge_type": "On Net Total", "account_head": "_Test Account CST - _TC", "rate": 2},
+		{
+			"charge_type": "On Previous Row Amount",
+			"account_head": "_Test Account S&H Education Cess - _TC",
+			"rate": 1,
+			"row_id": 3,
+		},
+		{"charge_type": "Actual", "account_head": "_Test Account Discount - _TC", "tax_amount": -33.33},
+	],
+	"inclusive": [
+		{
+			"charge_type": "On Net Total",
+			"account_head": "_Test Account VAT - _TC",
+			"rate": 12.5,
+			"included_in_print_rate": 1,
+		},
+		{
+			"charge_type": "On Previous Row Amount",
+			"account_head": "_Test Account Excise Duty - _TC",
+			"rate": 10,
+			"row_id": 1,
+			"included_in_print_rate": 1,
+		},
+		{
+			"charge_type": "On Previous Row Total",
+			"account_head": "_Test Account Education Cess - _TC",
+			"rate": 3,
+			"row_id": 2,
+			"included_in_print_rate": 1,
+		},
+		{"charge_type": "On Net Total", "account_head": "_Test Account CST - _TC", "rate": 2},
+	],
+}
+
+
+class TestTaxesAndTotals(unittest.TestCase):
+	def test_tax_matrix_matches_item_by_item_calculation(self):
+		for case, taxes in TAX_CASES.items():
+			for discount_on_grand_total in (0, 1):
+				with self.subTest(case=case, discount_on_grand_total=discount_on_grand_total):
+					self.assertEqual(
+						self.calculate(taxes, discount_on_grand_total, by_column=True),
+						self.calculate(taxes, discount_on_grand_total, by_column=False),
+					)
+
+	def test_tax_matrix_totals(self):
+		"Totals of 60 items of 100 with 12.5% tax calculated by column"
+		taxes = [{"charge_type": "On Net Total", "account_head": "_Test Account VAT - _TC", "rate": 12.5}]
+		doc = make_sales_invoice(taxes, items=60, item_code=lambda n: "_Test Item", item_tax_rates=[None])
+
+		with patch.object(taxes_and_totals, "TAX_MATRIX_MIN_ITEMS", 1):
+			calculate_taxes_and_totals(doc)
+
+		self.assertEqual(doc.net_total, 6000)
+		self.assertEqual(doc.taxes[0].tax_amount, 750)
+		self.assertEqual(doc.grand_total, 6750)
+		self.assertEqual(json.loads(doc.taxes[0].item_wise_tax_detail)["_Test Item"], [12.5, 750.0])
+
+	def calculate(self, taxes, discount_on_grand_total, by_column):
+		doc = make_sales_invoice(taxes, items=120, rate=lambda n: 99.99 + n * 1.13, qty=lambda n: 1 + n % 7)
+		if discount_on_grand_total:
+			doc.apply_discount_on = "Grand Total"
+			doc.discount_amount = 123.45
+
+		with patch.object(taxes_and_totals, "TAX_MATRIX_MIN_ITEMS", 1 if by_column else 100000):
+			calculate_taxes_and_totals(doc)
+
+		return {
+			"doc": [doc.get(fieldname) for fieldname in DOC_FIELDS],
+			"items": [[item.get(fieldname) for fieldname in ITEM_FIELDS] for item in doc.items],
+			"taxes": [[tax.get(fieldname) for fieldname in TAX_FIELDS] for tax in doc.taxes],
+		}
+
+
+def make_sales_invoice(
+	taxes,
+	items,
+	rate=lambda n: 100,
+	qty=lambda n: 1,
+	item_code=lambda n: "_Test Item" if n % 2 else "_Test Item 2",
+	item_tax_rates=None,
+):
+	"Sales Invoice with `items` rows, values of the n-th row are returned by the arguments for n"
+	item_tax_rates = item_tax_rates or ITEM_TAX_RATES
+	return frappe.get_doc(
+		{
+			"doctype": "Sales Invoice",
+			"company": "_Test Company",
+			"customer": "_Test Customer",
+			"currency": "INR",
+			"conversion_rate": 1,
+			"debit_to": "Debtors - _TC",
+			"items": [
+				{
+					"item_code": item_code(n),
+					"qty": qty(n),
+					"rate": rate(n),
+					"uom": "Nos",
+					"conversion_factor": 1,
+					"item_tax_rate": json.dumps(item_tax_rates[n % len(item_tax_rates)] or {}),
+				}
+				for n in range(items)
+			],
+			"taxes": [
+				dict(tax, cost_center="_Test Cost Center - _TC", description=tax["account_head"])
+				for tax in taxes
+			],
+		}
+	)
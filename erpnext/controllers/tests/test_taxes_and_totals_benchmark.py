@@ -0,0 +1,31 @@
+import unittest
+from unittest.mock import patch
+
+from erpnext.controllers import taxes_and_totals
+from erpnext.controllers.taxes_and_totals import calculate_taxes_and_totals
+from erpnext.controllers.tests.test_taxes_and_totals import TAX_CASES, make_sales_invoice
+from erpnext.tests.utils import benchmark
+
+ITEMS = 2000
+RUNS = 5
+
+
+@benchmark
+class TestTaxesAndTotalsBenchmark(unittest.TestCase):
+	"""Benchmark of the taxes of a 2000 item invoice with 8 taxes, item by item and by column.
+
+	Only the results are asserted to be the same."""
+
+	def run_calculation(self, by_column):
+		doc = make_sales_invoice(
+			TAX_CASES["exclusive"], items=ITEMS, rate=lambda n: 99.99 + n * 1.13, qty=lambda n: 1 + n % 7
+		)
+
+		with patch.object(taxes_and_totals, "TAX_MATRIX_MIN_ITEMS", 1 if by_column else ITEMS + 1):
+			for _ in range(RUNS):
+				calculate_taxes_and_totals(doc)
+
+		return [(tax.tax_amount, tax.total) for tax in doc.taxes]
+
+	def test_compare_with_item_by_item(self):
+		self.assertEqual(self.run_calculation(by_column=True), self.run_calculation(by_column=False))
@@ -1,11 +1,14 @@
 # Copyright (c) 2021, Frappe Technologies Pvt. Ltd. and Contributors
 # License: GNU General Public License v3. See license.txt
 
+import hashlib
+
 import frappe
 from frappe.utils import flt
 
 from erpnext.e_commerce.doctype.item_review.item_review import get_customer
-from erpnext.e_commerce.shopping_cart.product_info import get_product_info_for_website
+from erpnext.e_commerce.shopping_cart.product_info import get_product_prices_for_website
+from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
 from erpnext.utilities.product import get_non_stock_item_status
 
 
@@ -54,6 +57,12 @@ class ProductQuery:
 		Returns:
 		        dict: Dict containing items, item count & discount range
 		"""
+		cache_key = None
+		if frappe.session.user == "Guest" and self.settings.guest_listing_cache_ttl:
+			cache_key = self.get_cache_key(attributes, fields, search_term, start, item_group)
+			if (cached_result := frappe.cache().get_value(cache_key)) is not None:
+				return cached_result
+
 		# track if discounts included in field filters
 		self.filter_with_discount = bool(fields.get("discount"))
 		result, discount_list, _website_item_groups, cart_items, count = [], [], [], [], 0
@@ -86,8 +95,21 @@ class ProductQuery:
 			discounts = [min(discount_list), max(discount_list)]
 
 		result = self.filter_results_by_discount(fields, result)
+		result = {"items": result, "items_count": count, "discounts": discounts}
+
+		if cache_key:
+			frappe.cache().set_value(cache_key, result, expires_in_sec=self.settings.guest_listing_cache_ttl)
+
+		return result
+
+	def get_cache_key(self, attributes, fields, search_term, start, item_group):
+		"Listing pages shown to guests differ by the price list and the query args"
+		from erpnext.e_commerce.shopping_cart.cart import _set_price_list
 
-		return {"items": result, "items_count": count, "discounts": discounts}
+		price_list = _set_price_list(self.settings, None) if self.settings.enabled else None
+		key = frappe.as_json([price_list, item_group, start, attributes, fields, search_term])
+
+		return "product_listing:" + hashlib.sha256(key.encode()).hexdigest()
 
 	def query_items(self, start=0):
 		"""Build a query to fetch Website Items based on field filters."""
@@ -220,26 +242,35 @@ class ProductQuery:
 			self.or_filters.append([field, "like", search])
 
 	def add_display_details(self, result, discount_list, cart_items):
-		"""Add price and availability details in result."""
-		for item in result:
-			product_info = get_product_info_for_website(item.item_code, skip_quotation_creation=True).get(
-				"product_info"
+		"""Add price and availability details in result.
+
+		Prices, stock and wishlist are fetched for the whole page of items at once."""
+		item_codes = [item.item_code for item in result]
+		if not item_codes:
+			return result, discount_list
+
+		prices = get_product_prices_for_website(item_codes)
+
+		if self.settings.show_stock_availability:
+			self.set_stock_availability(result)
+
+		wished_items = set()
+		if frappe.session.user != "Guest":
+			wished_items = set(
+				frappe.get_all(
+					"Wishlist Item",
+					filters={"item_code": ("in", item_codes), "parent": frappe.session.user},
+					pluck="item_code",
+				)
 			)
 
-			if product_info and product_info["price"]:
+		for item in result:
+			if price := prices.get(item.item_code):
 				# update/mutate item and discount_list objects
-				self.get_price_discount_info(item, product_info["price"], discount_list)
-
-			if self.settings.show_stock_availability:
-				self.get_stock_availability(item)
+				self.get_price_discount_info(item, price, discount_list)
 
 			item.in_cart = item.item_code in cart_items
-
-			item.wished = False
-			if frappe.db.exists(
-				"Wishlist Item", {"item_code": item.item_code, "parent": frappe.session.user}
-			):
-				item.wished = True
+			item.wished = item.item_code in wished_items
 
 		return result, discount_list
 
@@ -258,27 +289,60 @@ class ProductQuery:
 				"formatted_discount_rate"
 			)
 
-	def get_stock_availability(self, item):
-		from erpnext.templates.pages.wishlist import (
-			get_stock_availability as get_stock_availability_from_template,
+	def set_stock_availability(self, result):
+		"""Modify item objects and add stock details, bins of all the items are fetched at once."""
+		is_stock_item = dict(
+			frappe.get_all(
+				"Item",
+				filters={"name": ("in", [item.item_code for item in result])},
+				fields=["name", "is_stock_item"],
+				as_list=True,
+			)
 		)
 
-		"""Modify item object and add stock details."""
-		item.in_stock = False
-		warehouse = item.get("website_warehouse")
-		is_stock_item = frappe.get_cached_value("Item", item.item_code, "is_stock_item")
+		warehouses, item_warehouses = {}, {}
+		for item in result:
+			warehouse = item.get("website_warehouse")
+			if item.get("on_backorder") or not warehouse or not is_stock_item.get(item.item_code):
+				continue
 
-		if item.get("on_backorder"):
-			return
+			if warehouse not in warehouses:
+				warehouses[warehouse] = (
+					get_child_warehouses(warehouse)
+					if frappe.get_cached_value("Warehouse", warehouse, "is_group") == 1
+					else [warehouse]
+				)
+			item_warehouses[item.item_code] = warehouses[warehouse]
 
-		if not is_stock_item:
-			if warehouse:
-				# product bundle case
-				item.in_stock = get_non_stock_item_status(item.item_code, "website_warehouse")
-			else:
-				item.in_stock = True
-		elif warehouse:
-			item.in_stock = get_stock_availability_from_template(item.item_code, warehouse)
+		stock_qty = {}
+		if item_warehouses:
+			for d in frappe.get_all(
+				"Bin",
+				filters={
+					"item_code": ("in", list(item_warehouses)),
+					"warehouse": ("in", list({wh for whs in warehouses.values() for wh in whs})),
+				},
+				fields=["item_code", "warehouse", "actual_qty"],
+			):
+				stock_qty[(d.item_code, d.warehouse)] = flt(d.actual_qty)
+
+		for item in result:
+			item.in_stock = False
+			warehouse = item.get("website_warehouse")
+
+			if item.get("on_backorder"):
+				continue
+
+			if not is_stock_item.get(item.item_code):
+				if warehouse:
+					# product bundle case
+					item.in_stock = get_non_stock_item_status(item.item_code, "website_warehouse")
+				else:
+					item.in_stock = True
+			elif warehouse:
+				item.in_stock = bool(
+					sum(stock_qty.get((item.item_code, wh), 0.0) for wh in item_warehouses[item.item_code])
+				)
 
 	def get_cart_items(self):
 		customer = get_customer(silent=True)
@@ -234,6 +234,37 @@ class TestProductDataEngine(unittest.TestCase):
 		self.assertEqual(len(items), 1)
 		self.assertEqual(items[0].get("item_code"), "Test 12I Laptop")
 
+	def test_product_list_prices_match_product_info(self):
+		"Test if prices fetched for the whole page match the prices fetched per item."
+		from erpnext.e_commerce.doctype.website_item.test_website_item import (
+			make_web_item_price,
+			make_web_pricing_rule,
+		)
+		from erpnext.e_commerce.shopping_cart.product_info import get_product_info_for_website
+
+		make_web_item_price(item_code="Test 17I Laptop")
+		make_web_pricing_rule(
+			title="Test Pricing Rule for Test 17I Laptop",
+			item_code="Test 17I Laptop",
+			discount_percentage=5,
+			selling=1,
+		)
+		make_web_item_price(item_code="Test 16I Laptop", price_list_rate=500)
+
+		setup_e_commerce_settings({"show_price": 1})
+		frappe.local.shopping_cart_settings = None
+
+		engine = ProductQuery()
+		result = engine.query(attributes={}, fields={}, search_term=None, start=0, item_group=None)
+
+		for item in result.get("items"):
+			product_info = get_product_info_for_website(item.item_code, skip_quotation_creation=True)
+			price = product_info.get("product_info").get("price") or {}
+
+			self.assertEqual(item.get("price_list_rate"), price.get("price_list_rate"))
+			self.assertEqual(item.get("formatted_price"), price.get("formatted_price"))
+			self.assertEqual(item.get("formatted_mrp"), price.get("formatted_mrp"))
+
 	def test_product_list_with_api(self):
 		"Test products listing using API."
 		from erpnext.e_commerce.api import get_product_filter_data
@@ -14,6 +14,7 @@ from frappe.utils import cint, cstr, flt, today
 from frappe.website.website_generator import WebsiteGenerator
 
 import erpnext
+from erpnext.manufacturing.doctype.flat_bom_item.flat_bom_item import clear_flat_bom_items
 from erpnext.setup.utils import get_exchange_rate
 from erpnext.stock.doctype.item.item import get_item_details
 from erpnext.stock.get_item_details import get_conversion_factor, get_price_list_rate
@@ -203,6 +204,7 @@ class BOM(WebsiteGenerator):
 
 	def on_submit(self):
 		self.manage_default_bom()
+		clear_flat_bom_items(item_code=self.item, bom=self.name)
 
 	def on_cancel(self):
 		self.db_set("is_active", 0)
@@ -211,10 +213,12 @@ class BOM(WebsiteGenerator):
 		# check if used in any other bom
 		self.validate_bom_links()
 		self.manage_default_bom()
+		clear_flat_bom_items(item_code=self.item, bom=self.name)
 
 	def on_update_after_submit(self):
 		self.validate_bom_links()
 		self.manage_default_bom()
+		clear_flat_bom_items(item_code=self.item, bom=self.name)
 
 	def get_item_det(self, item_code):
 		item = get_item_details(item_code)
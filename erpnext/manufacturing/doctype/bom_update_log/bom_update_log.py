@@ -1,6 +1,7 @@
 # Copyright (c) 2022, Frappe Technologies Pvt. Ltd. and contributors
 # For license information, please see license.txt
 import json
+import math
 from typing import Any
 
 import frappe
@@ -11,6 +12,7 @@ from frappe.query_builder.functions import Now
 from frappe.utils import cint, cstr, date_diff, today
 
 from erpnext.manufacturing.doctype.bom_update_log.bom_updation_utils import (
+	get_dependence_map,
 	get_leaf_boms,
 	get_next_higher_level_boms,
 	handle_exception,
@@ -18,6 +20,11 @@ from erpnext.manufacturing.doctype.bom_update_log.bom_updation_utils import (
 	set_values_in_log,
 )
 
+# BOMs of a level are split into batches updated by parallel jobs
+BOM_COST_BATCH_SIZE = 7_000
+BOM_COST_MIN_BATCH_SIZE = 500
+BOM_COST_UPDATE_JOBS = 4
+
 
 class BOMMissingError(frappe.ValidationError):
 	pass
@@ -160,32 +167,37 @@ def process_boms_cost_level_wise(
 
 
 def queue_bom_cost_jobs(current_boms_list: list[str], update_doc: "BOMUpdateLog", current_level: int) -> None:
-	"Queue batches of 20k BOMs of the same level to process parallelly"
-	batch_no = 0
-
-	while current_boms_list:
-		batch_no += 1
-		batch_size = 7_000
-		boms_to_process = current_boms_list[:batch_size]  # slice out batch of 20k BOMs
-
-		# update list to exclude 20K (queued) BOMs
-		current_boms_list = current_boms_list[batch_size:] if len(current_boms_list) > batch_size else []
+	"Queue batches of BOMs of the same level to process parallelly"
+	batch_size = get_bom_cost_batch_size(len(current_boms_list))
+	batches = []
 
+	for batch_no, index in enumerate(range(0, len(current_boms_list), batch_size), start=1):
 		batch_row = update_doc.append(
 			"bom_batches", {"level": current_level, "batch_no": batch_no, "status": "Pending"}
 		)
 		batch_row.db_insert()
+		batches.append((batch_row.name, current_boms_list[index : index + batch_size]))
 
+	# all batches of the level are to be recorded before any of them completes the level
+	for batch_name, boms_to_process in batches:
 		frappe.enqueue(
 			method="erpnext.manufacturing.doctype.bom_update_log.bom_updation_utils.update_cost_in_level",
 			doc=update_doc,
 			bom_list=boms_to_process,
-			batch_name=batch_row.name,
+			batch_name=batch_name,
 			queue="long",
 			now=frappe.flags.in_test,
+			enqueue_after_commit=True,
 		)
 
 
+def get_bom_cost_batch_size(no_of_boms: int) -> int:
+	"Spread smaller levels across jobs too, keeping each job large enough to be worth it."
+	return min(
+		BOM_COST_BATCH_SIZE, max(BOM_COST_MIN_BATCH_SIZE, math.ceil(no_of_boms / BOM_COST_UPDATE_JOBS))
+	)
+
+
 def resume_bom_cost_update_jobs():
 	"""
 	1. Checks for In Progress BOM Update Log.
@@ -194,52 +206,79 @@ def resume_bom_cost_update_jobs():
 	4. If no parents, mark as Complete.
 	5. If current level is WIP, skip the Log.
 
-	Called every 5 minutes via Cron job.
+	Called every 5 minutes via Cron job. Levels are usually started by their last
+	completed batch, see `resume_bom_cost_update_job`.
 	"""
 
 	in_progress_logs = frappe.db.get_all(
 		"BOM Update Log",
 		{"update_type": "Update Cost", "status": "In Progress"},
-		["name", "processed_boms", "current_level"],
+		["name", "current_level"],
 	)
 	if not in_progress_logs:
 		return
 
 	for log in in_progress_logs:
-		# check if all log batches of current level are processed
-		bom_batches = frappe.db.get_all(
-			"BOM Update Batch",
-			{"parent": log.name, "level": log.current_level},
-			["name", "boms_updated", "status"],
-		)
-		incomplete_level = any(row.get("status") == "Pending" for row in bom_batches)
-		if not bom_batches or incomplete_level:
-			continue
-
-		# Prep parent BOMs & updated processed BOMs for next level
-		current_boms, processed_boms = get_processed_current_boms(log, bom_batches)
-		parent_boms = get_next_higher_level_boms(child_boms=current_boms, processed_boms=processed_boms)
-
-		# Unset processed BOMs (it is used for next level BOMs) & change status if log is complete
-		status = "Completed" if not parent_boms else "In Progress"
-		processed_boms = json.dumps([] if not parent_boms else processed_boms)
-		set_values_in_log(
-			log.name,
-			values={
-				"processed_boms": processed_boms,
-				"status": status,
-			},
-			commit=True,
-		)
+		resume_bom_cost_update_job(log.name, log.current_level)
 
-		# clear progress section
-		if status == "Completed":
-			frappe.db.delete("BOM Update Batch", {"parent": log.name})
 
-		if parent_boms:  # there is a next level to process
-			process_boms_cost_level_wise(
-				update_doc=frappe.get_doc("BOM Update Log", log.name), parent_boms=parent_boms
-			)
+def resume_bom_cost_update_job(log_name: str, level: int) -> None:
+	"Start the next level of the log if all batches of `level` are processed."
+
+	# locked so that batches completing together start the next level only once
+	log = frappe.db.get_value(
+		"BOM Update Log",
+		log_name,
+		["name", "status", "processed_boms", "current_level"],
+		as_dict=True,
+		for_update=True,
+	)
+	if not log or log.status != "In Progress" or cint(log.current_level) != cint(level):
+		return
+
+	# check if all log batches of current level are processed
+	bom_batches = frappe.db.get_all(
+		"BOM Update Batch",
+		{"parent": log.name, "level": log.current_level},
+		["name", "boms_updated", "status"],
+	)
+	incomplete_level = any(row.get("status") == "Pending" for row in bom_batches)
+	if not bom_batches or incomplete_level:
+		return
+
+	# Prep parent BOMs & updated processed BOMs for next level
+	current_boms, processed_boms = get_processed_current_boms(log, bom_batches)
+	parent_boms = get_next_higher_level_boms(
+		child_boms=current_boms,
+		processed_boms=processed_boms,
+		dependence_map=get_dependence_map(log.name),
+	)
+
+	# Unset processed BOMs (it is used for next level BOMs) & change status if log is complete
+	status = "Completed" if not parent_boms else "In Progress"
+	processed_boms = json.dumps([] if not parent_boms else processed_boms)
+
+	# committed along with the next level, while the log is still locked
+	set_values_in_log(
+		log.name,
+		values={
+			"processed_boms": processed_boms,
+			"status": status,
+		},
+	)
+
+	# clear progress section
+	if status == "Completed":
+		frappe.db.delete("BOM Update Batch", {"parent": log.name})
+		frappe.cache().hdel("bom_dependence_map", log.name)
+
+		if not frappe.flags.in_test:
+			frappe.db.commit()  # nosemgrep
+
+	if parent_boms:  # there is a next level to process
+		process_boms_cost_level_wise(
+			update_doc=frappe.get_doc("BOM Update Log", log.name), parent_boms=parent_boms
+		)
 
 
 def get_processed_current_boms(
@@ -11,6 +11,53 @@ if TYPE_CHECKING:
 
 import frappe
 from frappe import _
+from frappe.query_builder.functions import Count, IfNull, Sum
+from frappe.utils import flt
+from pypika import Case
+
+from erpnext.manufacturing.doctype.flat_bom_item.flat_bom_item import clear_all_flat_bom_items
+
+# rows fetched and updated per query while rolling up costs
+BOM_COST_CHUNK_SIZE = 500
+
+BOM_COST_FIELDS = [
+	"operating_cost",
+	"base_operating_cost",
+	"raw_material_cost",
+	"base_raw_material_cost",
+	"scrap_material_cost",
+	"base_scrap_material_cost",
+	"total_cost",
+	"base_total_cost",
+]
+BOM_ITEM_FIELDS = [
+	"item_code",
+	"bom_no",
+	"qty",
+	"uom",
+	"stock_qty",
+	"stock_uom",
+	"conversion_factor",
+	"sourced_by_supplier",
+	"is_stock_item",
+	"rate",
+	"base_rate",
+]
+BOM_OPERATION_COST_FIELDS = [
+	"hour_rate",
+	"base_hour_rate",
+	"operating_cost",
+	"base_operating_cost",
+	"cost_per_unit",
+	"base_cost_per_unit",
+]
+BOM_OPERATION_FIELDS = [
+	"workstation",
+	"time_in_mins",
+	"batch_size",
+	"set_cost_based_on_bom_qty",
+	*BOM_OPERATION_COST_FIELDS,
+]
 
 
 def replace_bom(boms: dict, log_name: str) -> None:
@@ -23,6 +70,7 @@ def replace_bom(boms: dict, log_name: str) -> None:
 	update_new_bom_in_bom_items(unit_cost, current_bom, new_bom)
 
 	frappe.cache().delete_key("bom_children")
+	clear_all_flat_bom_items()
 	parent_boms = get_ancestor_boms(new_bom)
 
 	for bom in parent_boms:
@@ -46,6 +94,8 @@ def replace_bom(boms: dict, log_name: str) -> None:
 def update_cost_in_level(doc: "BOMUpdateLog", bom_list: list[str], batch_name: int | str) -> None:
 	"Updates Cost for BOMs within a given level. Runs via background jobs."
 
+	from erpnext.manufacturing.doctype.bom_update_log.bom_update_log import resume_bom_cost_update_job
+
 	try:
 		status = frappe.db.get_value("BOM Update Log", doc.name, "status")
 		if status == "Failed":
@@ -60,6 +110,13 @@ def update_cost_in_level(doc: "BOMUpdateLog", bom_list: list[str], batch_name: i
 			.set(bom_batch.status, "Completed")
 			.where(bom_batch.name == batch_name)
 		).run()
+
+		if not frappe.flags.in_test:
+			frappe.db.commit()  # nosemgrep
+
+		# the last batch of the level starts the next level, without waiting for the Cron job
+		level = frappe.db.get_value("BOM Update Batch", batch_name, "level")
+		resume_bom_cost_update_job(doc.name, level)
 	except Exception:
 		handle_exception(doc)
 	finally:
@@ -115,23 +172,374 @@ def get_bom_unit_cost(bom_name: str) -> float:
 def update_cost_in_boms(bom_list: list[str]) -> None:
 	"Updates cost in given BOMs. Returns current and total updated BOMs."
 
-	for index, bom in enumerate(bom_list):
-		bom_doc = frappe.get_doc("BOM", bom, for_update=True)
-		bom_doc.calculate_cost(save_updates=True, update_hour_rate=True)
-		bom_doc.db_update()
+	for index in range(0, len(bom_list), BOM_COST_CHUNK_SIZE):
+		BOMCostRollup(bom_list[index : index + BOM_COST_CHUNK_SIZE]).update()
 
-		if (index % 50 == 0) and not frappe.flags.in_test:
+		if not frappe.flags.in_test:
 			frappe.db.commit()  # nosemgrep
 
 
-def get_next_higher_level_boms(child_boms: list[str], processed_boms: dict[str, bool]) -> list[str]:
+class BOMCostRollup:
+	"""
+	Recalculate costs of BOMs from the same level together, as `BOM.calculate_cost` does
+	with `save_updates` and `update_hour_rate`.
+
+	Rows of all the BOMs and the rates they need are fetched in bulk and the costs are
+	written back with one update per table, instead of loading and saving each BOM.
+	Child BOMs are from lower levels and are already updated.
+	"""
+
+	def __init__(self, bom_list: list[str]) -> None:
+		self.bom_list = bom_list
+		self.precisions = {}
+
+	def update(self) -> None:
+		if not self.bom_list:
+			return
+
+		self.boms = self.get_boms()
+		self.rows = {
+			"items": self.get_rows("BOM Item", BOM_ITEM_FIELDS),
+			"operations": self.get_rows("BOM Operation", BOM_OPERATION_FIELDS),
+			"scrap_items": self.get_rows("BOM Scrap Item", ["rate", "stock_qty"]),
+			"exploded_items": self.get_rows("BOM Explosion Item", ["item_code", "stock_qty", "rate"]),
+		}
+		self.prepare_rates()
+
+		changed_items, operations, changed_exploded_items = [], [], []
+		for bom in self.boms.values():
+			operations.extend(self.calculate_op_cost(bom))
+			changed_items.extend(self.calculate_rm_cost(bom))
+			self.calculate_sm_cost(bom)
+			changed_exploded_items.extend(self.calculate_exploded_cost(bom))
+
+			bom.total_cost = bom.operating_cost + bom.raw_material_cost - bom.scrap_material_cost
+			bom.base_total_cost = (
+				bom.base_operating_cost + bom.base_raw_material_cost - bom.base_scrap_material_cost
+			)
+
+		bulk_update_rows("BOM Operation", operations, BOM_OPERATION_COST_FIELDS)
+		bulk_update_rows(
+			"BOM Item",
+			changed_items,
+			["rate", "base_rate", "amount", "base_amount", "qty_consumed_per_unit"],
+		)
+		bulk_update_rows(
+			"BOM Scrap Item", self.get_all_rows("scrap_items"), ["base_rate", "amount", "base_amount"]
+		)
+		bulk_update_rows("BOM Explosion Item", changed_exploded_items, ["rate", "amount"])
+		bulk_update_rows("BOM", list(self.boms.values()), BOM_COST_FIELDS)
+
+	def get_boms(self) -> dict[str, dict]:
+		bom = frappe.qb.DocType("BOM")
+		boms = (
+			frappe.qb.from_(bom)
+			.select(
+				bom.name,
+				bom.company,
+				bom.currency,
+				bom.quantity,
+				bom.conversion_rate,
+				bom.plc_conversion_rate,
+				bom.rm_cost_as_per,
+				bom.buying_price_list,
+				bom.with_operations,
+				bom.fg_based_operating_cost,
+				bom.operating_cost_per_bom_quantity,
+				bom.set_rate_of_sub_assembly_item_based_on_bom,
+			)
+			.where(bom.name.isin(self.bom_list))
+			.for_update()
+		).run(as_dict=True)
+
+		for row in boms:
+			row.rm_cost_as_per = row.rm_cost_as_per or "Valuation Rate"
+
+		return {row.name: row for row in boms}
+
+	def get_rows(self, doctype: str, fields: list[str]) -> dict[str, list]:
+		"Rows of the child table of all the BOMs, by BOM in the order of the table."
+		rows = frappe.get_all(
+			doctype,
+			filters={"parent": ("in", self.bom_list), "parenttype": "BOM"},
+			fields=["name", "parent", *fields],
+			order_by="idx",
+		)
+
+		rows_by_bom = defaultdict(list)
+		for row in rows:
+			rows_by_bom[row.parent].append(row)
+
+		return rows_by_bom
+
+	def get_all_rows(self, table: str) -> list:
+		return [row for rows in self.rows[table].values() for row in rows]
+
+	def prepare_rates(self) -> None:
+		"Fetch the rates needed by all the BOMs together."
+		items = self.get_all_rows("items")
+		item_codes = list({row.item_code for row in items})
+		child_boms = list({row.bom_no for row in items if row.bom_no})
+		workstations = list({row.workstation for row in self.get_all_rows("operations") if row.workstation})
+
+		self.item_details = {
+			row.name: row
+			for row in frappe.get_all(
+				"Item",
+				filters={"name": ("in", item_codes or [""])},
+				fields=["name", "is_customer_provided_item", "last_purchase_rate"],
+			)
+		}
+
+		self.hour_rates = dict(
+			frappe.get_all(
+				"Workstation",
+				filters={"name": ("in", workstations or [""])},
+				fields=["name", "hour_rate"],
+				as_list=True,
+			)
+		)
+
+		self.bom_unit_costs = {
+			row.name: (flt(row.base_total_cost) / flt(row.quantity) if flt(row.quantity) else 0)
+			for row in frappe.get_all(
+				"BOM",
+				filters={"name": ("in", child_boms or [""]), "is_active": 1},
+				fields=["name", "base_total_cost", "quantity"],
+			)
+		}
+
+		self.explosion_item_rates = defaultdict(dict)
+		for row in frappe.get_all(
+			"BOM Explosion Item",
+			filters={"parent": ("in", child_boms or [""]), "parenttype": "BOM"},
+			fields=["parent", "item_code", "rate"],
+			order_by="idx",
+		):
+			self.explosion_item_rates[row.parent][row.item_code] = flt(row.rate)
+
+		self.valuation_rates = self.get_valuation_rates(item_codes)
+
+	def get_valuation_rates(self, item_codes: list[str]) -> dict[tuple, float | None]:
+		"Average valuation rate of the items in the warehouses of each company, see `get_valuation_rate`."
+		if not item_codes:
+			return {}
+
+		companies = list({bom.company for bom in self.boms.values()})
+
+		bin_table = frappe.qb.DocType("Bin")
+		wh_table = frappe.qb.DocType("Warehouse")
+		rows = (
+			frappe.qb.from_(bin_table)
+			.join(wh_table)
+			.on(bin_table.warehouse == wh_table.name)
+			.select(
+				bin_table.item_code,
+				wh_table.company,
+				Case()
+				.when(
+					Count(bin_table.name) > 0,
+					IfNull(Sum(bin_table.stock_value) / Sum(bin_table.actual_qty), 0.0),
+				)
+				.else_(None)
+				.as_("valuation_rate"),
+			)
+			.where(bin_table.item_code.isin(item_codes) & wh_table.company.isin(companies))
+			.groupby(bin_table.item_code, wh_table.company)
+		).run(as_dict=True)
+
+		return {(row.item_code, row.company): row.valuation_rate for row in rows}
+
+	def get_valuation_rate(self, args: dict) -> float:
+		from erpnext.manufacturing.doctype.bom.bom import get_valuation_rate
+
+		valuation_rate = self.valuation_rates.get((args["item_code"], args["company"]))
+		if valuation_rate is None or valuation_rate <= 0:
+			# last valuation rate from the ledger or the item's, rare enough to be fetched per item
+			return get_valuation_rate(args)
+
+		return flt(valuation_rate)
+
+	def get_rm_rate(self, bom: dict, args: dict) -> float:
+		"Rate of the raw material, as per `BOM.get_rm_rate`."
+		from erpnext.manufacturing.doctype.bom.bom import get_bom_item_rate
+
+		rate = 0
+		item = self.item_details.get(args["item_code"]) or {}
+
+		# Customer Provided parts and Supplier sourced parts will have zero rate
+		if not item.get("is_customer_provided_item") and not args.get("sourced_by_supplier"):
+			if args.get("bom_no") and bom.set_rate_of_sub_assembly_item_based_on_bom:
+				rate = flt(self.bom_unit_costs.get(args["bom_no"])) * (args.get("conversion_factor") or 1)
+			elif bom.rm_cost_as_per == "Valuation Rate":
+				rate = self.get_valuation_rate(args) * (args.get("conversion_factor") or 1)
+			elif bom.rm_cost_as_per == "Last Purchase Rate":
+				rate = flt(item.get("last_purchase_rate")) * (args.get("conversion_factor") or 1)
+			else:
+				rate = get_bom_item_rate(args, bom)
+
+		return flt(rate) * flt(bom.plc_conversion_rate or 1) / (bom.conversion_rate or 1)
+
+	def calculate_op_cost(self, bom: dict) -> list:
+		"Set operating cost of the BOM. Returns the operations with updated rates."
+		bom.operating_cost = 0
+		bom.base_operating_cost = 0
+		updated_operations = []
+
+		if bom.with_operations:
+			for row in self.rows["operations"].get(bom.name, []):
+				if row.workstation:
+					self.update_rate_and_time(bom, row)
+					updated_operations.append(row)
+
+				operating_cost = row.operating_cost
+				base_operating_cost = row.base_operating_cost
+				if row.set_cost_based_on_bom_qty:
+					operating_cost = flt(row.cost_per_unit) * flt(bom.quantity)
+					base_operating_cost = flt(row.base_cost_per_unit) * flt(bom.quantity)
+
+				bom.operating_cost += flt(operating_cost)
+				bom.base_operating_cost += flt(base_operating_cost)
+
+		elif bom.fg_based_operating_cost:
+			total_operating_cost = flt(bom.quantity) * flt(bom.operating_cost_per_bom_quantity)
+			bom.operating_cost = total_operating_cost
+			bom.base_operating_cost = flt(total_operating_cost * bom.conversion_rate, 2)
+
+		return updated_operations
+
+	def update_rate_and_time(self, bom: dict, row: dict) -> None:
+		hour_rate = flt(self.hour_rates.get(row.workstation))
+		if hour_rate:
+			row.hour_rate = hour_rate / flt(bom.conversion_rate) if bom.conversion_rate else hour_rate
+
+		if row.hour_rate and row.time_in_mins:
+			row.base_hour_rate = flt(row.hour_rate) * flt(bom.conversion_rate)
+			row.operating_cost = flt(row.hour_rate) * flt(row.time_in_mins) / 60.0
+			row.base_operating_cost = flt(row.operating_cost) * flt(bom.conversion_rate)
+			row.cost_per_unit = row.operating_cost / (row.batch_size or 1.0)
+			row.base_cost_per_unit = row.base_operating_cost / (row.batch_size or 1.0)
+
+	def calculate_rm_cost(self, bom: dict) -> list:
+		"Set raw material cost of the BOM. Returns the items with changed rates."
+		total_rm_cost = 0
+		base_total_rm_cost = 0
+		changed_items = []
+
+		rate_precision = self.get_precision("BOM Item", "rate", bom.currency)
+		qty_precision = self.get_precision("BOM Item", "qty")
+		stock_qty_precision = self.get_precision("BOM Item", "stock_qty")
+		quantity = flt(bom.quantity, self.get_precision("BOM", "quantity"))
+
+		for d in self.rows["items"].get(bom.name, []):
+			if not d.is_stock_item and bom.rm_cost_as_per == "Valuation Rate":
+				continue
+
+			old_rate = d.rate
+			d.rate = self.get_rm_rate(
+				bom,
+				{
+					"company": bom.company,
+					"item_code": d.item_code,
+					"bom_no": d.bom_no,
+					"qty": d.qty,
+					"uom": d.uom,
+					"stock_uom": d.stock_uom,
+					"conversion_factor": d.conversion_factor,
+					"sourced_by_supplier": d.sourced_by_supplier,
+				},
+			)
+
+			d.base_rate = flt(d.rate) * flt(bom.conversion_rate)
+			d.amount = flt(d.rate, rate_precision) * flt(d.qty, qty_precision)
+			d.base_amount = d.amount * flt(bom.conversion_rate)
+			d.qty_consumed_per_unit = flt(d.stock_qty, stock_qty_precision) / quantity
+
+			total_rm_cost += d.amount
+			base_total_rm_cost += d.base_amount
+			if old_rate != d.rate:
+				changed_items.append(d)
+
+		bom.raw_material_cost = total_rm_cost
+		bom.base_raw_material_cost = base_total_rm_cost
+
+		return changed_items
+
+	def calculate_sm_cost(self, bom: dict) -> None:
+		total_sm_cost = 0
+		base_total_sm_cost = 0
+
+		rate_precision = self.get_precision("BOM Scrap Item", "rate", bom.currency)
+		stock_qty_precision = self.get_precision("BOM Scrap Item", "stock_qty")
+		amount_precision = self.get_precision("BOM Scrap Item", "amount", bom.currency)
+		conversion_rate = flt(bom.conversion_rate, self.get_precision("BOM", "conversion_rate"))
+
+		for d in self.rows["scrap_items"].get(bom.name, []):
+			d.base_rate = flt(d.rate, rate_precision) * conversion_rate
+			d.amount = flt(d.rate, rate_precision) * flt(d.stock_qty, stock_qty_precision)
+			d.base_amount = flt(d.amount, amount_precision) * conversion_rate
+			total_sm_cost += d.amount
+			base_total_sm_cost += d.base_amount
+
+		bom.scrap_material_cost = total_sm_cost
+		bom.base_scrap_material_cost = base_total_sm_cost
+
+	def calculate_exploded_cost(self, bom: dict) -> list:
+		"Set exploded row cost from the items and sub-assembly BOMs. Returns the rows with changed rates."
+		rm_rate_map = {}
+		for item in self.rows["items"].get(bom.name, []):
+			if item.bom_no:
+				rm_rate_map.update(self.explosion_item_rates.get(item.bom_no, {}))
+			else:
+				rm_rate_map[item.item_code] = flt(item.base_rate) / flt(item.conversion_factor or 1.0)
+
+		changed_rows = []
+		for row in self.rows["exploded_items"].get(bom.name, []):
+			old_rate = flt(row.rate)
+			row.rate = rm_rate_map.get(row.item_code)
+			row.amount = flt(row.stock_qty) * flt(row.rate)
+
+			if old_rate != row.rate:
+				changed_rows.append(row)
+
+		return changed_rows
+
+	def get_precision(self, doctype: str, fieldname: str, currency: str | None = None) -> int:
+		key = (doctype, fieldname, currency)
+		if key not in self.precisions:
+			self.precisions[key] = frappe.get_precision(doctype, fieldname, currency=currency)
+
+		return self.precisions[key]
+
+
+def bulk_update_rows(doctype: str, rows: list[dict], fields: list[str]) -> None:
+	"Set `fields` of the rows from their values, one query per chunk of rows."
+
+	table = frappe.qb.DocType(doctype)
+
+	for index in range(0, len(rows), BOM_COST_CHUNK_SIZE):
+		chunk = rows[index : index + BOM_COST_CHUNK_SIZE]
+		query = frappe.qb.update(table).where(table.name.isin([row.name for row in chunk]))
+
+		for field in fields:
+			value = Case()
+			for row in chunk:
+				value = value.when(table.name == row.name, row.get(field))
+			query = query.set(table[field], value)
+
+		query.run()
+
+
+def get_next_higher_level_boms(
+	child_boms: list[str], processed_boms: dict[str, bool], dependence_map: tuple | None = None
+) -> list[str]:
 	"Generate immediate higher level dependants with no unresolved dependencies (children)."
 
 	def _all_children_are_processed(parent_bom):
 		child_boms = dependency_map.get(parent_bom)
 		return all(processed_boms.get(bom) for bom in child_boms)
 
-	dependants_map, dependency_map = _generate_dependence_map()
+	dependants_map, dependency_map = dependence_map or _generate_dependence_map()
 
 	dependants = []
 	for bom in child_boms:
@@ -168,6 +576,17 @@ def get_leaf_boms() -> list[str]:
 	return boms
 
 
+def get_dependence_map(log_name: str) -> tuple:
+	"Dependence maps of the BOMs, generated once per BOM Update Log and used for all its levels."
+
+	dependence_map = frappe.cache().hget("bom_dependence_map", log_name)
+	if not dependence_map:
+		dependence_map = _generate_dependence_map()
+		frappe.cache().hset("bom_dependence_map", log_name, dependence_map)
+
+	return dependence_map
+
+
 def _generate_dependence_map() -> defaultdict:
 	"""
 	Generate maps such as: { BOM-1: [Dependant-BOM-1, Dependant-BOM-2, ..] }.
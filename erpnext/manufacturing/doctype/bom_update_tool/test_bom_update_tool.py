@@ -64,3 +64,28 @@ class TestBOMUpdateTool(FrappeTestCase):
 
 		doc.load_from_db()
 		self.assertEqual(doc.total_cost, 200)
+
+	@timeout
+	def test_bom_cost_rollup_matches_bom_calculation(self):
+		"Costs rolled up level by level match the costs calculated by the BOM itself"
+		from erpnext.manufacturing.doctype.bom.test_bom import create_nested_bom
+
+		bom_tree = {"Item A": {"Item B": {"Item C": {}, "Item D": {}}, "Item E": {}}}
+		root_bom = create_nested_bom(bom_tree, prefix="_Test Cost Rollup ")
+
+		for item_code, rate in (("Item C", 40), ("Item D", 25), ("Item E", 10)):
+			frappe.db.set_value("Item", "_Test Cost Rollup " + item_code, "valuation_rate", rate)
+		update_cost_in_all_boms_in_test()
+
+		root_bom.load_from_db()
+		expected_bom = frappe.get_doc("BOM", root_bom.name)
+		expected_bom.calculate_cost()
+		expected_bom.calculate_exploded_cost()
+
+		self.assertEqual(root_bom.total_cost, 75)
+		self.assertEqual(root_bom.total_cost, expected_bom.total_cost)
+		self.assertEqual(root_bom.raw_material_cost, expected_bom.raw_material_cost)
+		self.assertEqual(
+			{d.item_code: d.rate for d in root_bom.exploded_items},
+			{d.item_code: d.rate for d in expected_bom.exploded_items},
+		)
@@ -0,0 +1,205 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+from collections import defaultdict
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder.functions import IfNull, Sum
+from frappe.utils import cint, flt, now
+
+FLAT_BOM_ITEM_FIELDS = [
+	"name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by",
+	"bom",
+	"item_code",
+	"sequence",
+	"qty",
+	"stock_uom",
+	"source_warehouse",
+	"is_sub_assembly",
+	"has_non_stock_item",
+	"has_subcontracted_item",
+	"description",
+]
+
+
+class FlatBOMItem(Document):
+	pass
+
+
+def get_flat_bom_items(boms):
+	"""Raw materials of the BOMs, exploded through the default BOMs of their sub-assembly items.
+
+	Returns rows by BOM in the order `get_subitems` of Production Plan walks the BOMs. BOMs are
+	exploded once and the rows are kept until one of the BOMs or items in the tree changes.
+	"""
+	boms = list(set(boms))
+	if not boms:
+		return {}
+
+	rows = get_saved_flat_bom_items(boms)
+	missing_boms = [bom for bom in boms if bom not in rows]
+	if missing_boms:
+		for bom in missing_boms:
+			save_flat_bom_items(bom)
+
+		rows.update(get_saved_flat_bom_items(missing_boms))
+
+	return rows
+
+
+def get_saved_flat_bom_items(boms):
+	rows = defaultdict(list)
+
+	for row in frappe.get_all(
+		"Flat BOM Item",
+		filters={"bom": ("in", boms)},
+		fields=[
+			"bom",
+			"item_code",
+			"qty",
+			"stock_uom",
+			"source_warehouse",
+			"description",
+			"is_sub_assembly",
+			"has_non_stock_item",
+			"has_subcontracted_item",
+		],
+		order_by="sequence",
+	):
+		rows[row.bom].append(row)
+
+	return rows
+
+
+def save_flat_bom_items(bom):
+	"""Explode the BOM and replace its saved rows.
+
+	The BOM is locked while its rows are replaced, so that a BOM exploded by two transactions at
+	the same time is saved once."""
+	if not frappe.db.get_value("BOM", bom, "name", for_update=True):
+		return
+
+	frappe.db.delete("Flat BOM Item", {"bom": bom})
+
+	timestamp = now()
+	values = []
+
+	for sequence, row in enumerate(explode_bom(bom)):
+		values.append(
+			(
+				frappe.generate_hash(length=10),
+				timestamp,
+				timestamp,
+				frappe.session.user,
+				frappe.session.user,
+				bom,
+				row.item_code,
+				sequence,
+				row.qty,
+				row.stock_uom,
+				row.source_warehouse,
+				cint(row.is_sub_assembly),
+				cint(row.has_non_stock_item),
+				cint(row.has_subcontracted_item),
+				row.description,
+			)
+		)
+
+	frappe.db.bulk_insert("Flat BOM Item", fields=FLAT_BOM_ITEM_FIELDS, values=values)
+
+
+def explode_bom(bom):
+	"""Walk the BOM as `get_subitems` of Production Plan does with exploded items.
+
+	The first row is the item of the BOM, so that an empty BOM is also saved. Sub-assemblies are
+	kept as rows as well, so that the BOM is exploded again when their default BOM changes.
+	"""
+	bom_details = frappe.db.get_value("BOM", bom, ["item", "uom"], as_dict=True)
+	if not bom_details:
+		return []
+
+	rows = [frappe._dict(item_code=bom_details.item, qty=1, stock_uom=bom_details.uom, is_sub_assembly=1)]
+
+	def _explode(bom_no, parent_qty, has_non_stock_item, has_subcontracted_item, path):
+		for d in get_bom_items(bom_no):
+			d.qty = flt(parent_qty) * flt(d.qty)
+			d.has_non_stock_item = has_non_stock_item or not d.is_stock_item
+			d.has_subcontracted_item = has_subcontracted_item
+			d.is_sub_assembly = 1 if d.default_bom else 0
+			rows.append(d)
+
+			if not d.default_bom or d.default_bom in path or d.qty <= 0:
+				continue
+
+			if d.is_sub_contracted or d.default_material_request_type in ["Manufacture", "Purchase"]:
+				_explode(
+					d.default_bom,
+					d.qty,
+					d.has_non_stock_item,
+					has_subcontracted_item or cint(d.is_sub_contracted),
+					path | {d.default_bom},
+				)
+
+	_explode(bom, 1, False, False, {bom})
+
+	return rows
+
+
+def get_bom_items(bom_no):
+	bom_item = frappe.qb.DocType("BOM Item")
+	bom = frappe.qb.DocType("BOM")
+	item = frappe.qb.DocType("Item")
+
+	return (
+		frappe.qb.from_(bom_item)
+		.join(bom)
+		.on(bom.name == bom_item.parent)
+		.join(item)
+		.on(bom_item.item_code == item.name)
+		.select(
+			bom_item.item_code,
+			IfNull(Sum(bom_item.stock_qty / IfNull(bom.quantity, 1)), 0).as_("qty"),
+			bom_item.stock_uom,
+			bom_item.source_warehouse,
+			bom_item.description,
+			item.is_stock_item,
+			item.is_sub_contracted_item.as_("is_sub_contracted"),
+			item.default_bom,
+			item.default_material_request_type,
+		)
+		.where((bom.name == bom_no) & (bom_item.docstatus < 2))
+		.groupby(bom_item.item_code)
+	).run(as_dict=True)
+
+
+def clear_flat_bom_items(item_code=None, bom=None):
+	"Remove the exploded BOMs that contain the item or the BOM, they are exploded again when read"
+	flat_bom_item = frappe.qb.DocType("Flat BOM Item")
+
+	boms = []
+	if item_code:
+		boms = (
+			frappe.qb.from_(flat_bom_item)
+			.select(flat_bom_item.bom)
+			.distinct()
+			.where(flat_bom_item.item_code == item_code)
+		).run(pluck=True)
+
+	if bom:
+		boms.append(bom)
+
+	if boms:
+		frappe.db.delete("Flat BOM Item", {"bom": ("in", boms)})
+
+
+def clear_all_flat_bom_items():
+	frappe.db.delete("Flat BOM Item")
+
+
+def on_doctype_update():
+	frappe.db.add_unique("Flat BOM Item", ["bom", "sequence"], constraint_name="unique_bom_sequence")
@@ -0,0 +1,61 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.manufacturing.doctype.bom.test_bom import create_nested_bom
+from erpnext.manufacturing.doctype.flat_bom_item.flat_bom_item import (
+	get_flat_bom_items,
+	save_flat_bom_items,
+)
+from erpnext.manufacturing.doctype.production_plan.production_plan import (
+	get_subitems,
+	get_subitems_from_flat_bom,
+)
+
+
+class TestFlatBOMItem(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_flat_bom_matches_recursive_explosion(self):
+		"Raw materials read from the exploded BOM match the ones fetched level by level"
+		bom_tree = {"Item A": {"Item B": {"Item C": {}, "Item D": {}}, "Item C": {}, "Item E": {}}}
+		root_bom = create_nested_bom(bom_tree, prefix="_Test Flat BOM ")
+		company = "_Test Company"
+
+		expected = get_subitems(
+			frappe._dict(), {"include_exploded_items": 1}, {}, root_bom.name, company, 1, 0, 1, planned_qty=5
+		)
+		flat_bom_items = get_flat_bom_items([root_bom.name])[root_bom.name]
+		item_details = get_subitems_from_flat_bom({}, flat_bom_items, company, 1, 0, planned_qty=5)
+
+		self.assertEqual(
+			{item_code: d.qty for item_code, d in item_details.items()},
+			{item_code: d.qty for item_code, d in expected.items()},
+		)
+		self.assertEqual(item_details["_Test Flat BOM Item C"].qty, 10)
+
+		# exploding the BOM again replaces its rows
+		save_flat_bom_items(root_bom.name)
+		self.assertEqual(frappe.db.count("Flat BOM Item", {"bom": root_bom.name}), len(flat_bom_items))
+
+		# a new default BOM of a sub-assembly explodes the BOM again
+		sub_assembly_bom = frappe.get_doc(
+			doctype="BOM",
+			item="_Test Flat BOM Item B",
+			company=company,
+			currency="INR",
+			is_default=1,
+			items=[{"item_code": "_Test Flat BOM Item C"}],
+		)
+		sub_assembly_bom.insert()
+		sub_assembly_bom.submit()
+
+		self.assertFalse(frappe.db.exists("Flat BOM Item", {"bom": root_bom.name}))
+		flat_bom_items = get_flat_bom_items([root_bom.name])[root_bom.name]
+		self.assertEqual(
+			{d.item_code for d in flat_bom_items if not d.is_sub_assembly},
+			{"_Test Flat BOM Item C", "_Test Flat BOM Item E"},
+		)
@@ -1,6 +1,5 @@
 # Copyright (c) 2021, Frappe Technologies Pvt. Ltd. and contributors
 # For license information, please see license.txt
-import datetime
 import json
 
 import frappe
@@ -10,22 +9,16 @@ from frappe.model.mapper import get_mapped_doc
 from frappe.query_builder import Criterion
 from frappe.query_builder.functions import IfNull, Max, Min
 from frappe.utils import (
-	add_days,
-	add_to_date,
 	cint,
 	flt,
 	get_datetime,
 	get_link_to_form,
-	get_time,
-	getdate,
 	time_diff,
 	time_diff_in_hours,
 	time_diff_in_seconds,
 )
 
-from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
-	get_mins_between_operations,
-)
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import WorkstationCalendar
 from erpnext.manufacturing.doctype.workstation_type.workstation_type import get_workstations
 
 
@@ -262,98 +255,9 @@ class JobCard(Document):
 				if workstation not in busy_workstations:
 					return workstation
 
-	def schedule_time_logs(self, row):
-		row.remaining_time_in_mins = row.time_in_mins
-		while row.remaining_time_in_mins > 0:
-			args = frappe._dict({"from_time": row.planned_start_time, "to_time": row.planned_end_time})
-
-			self.validate_overlap_for_workstation(args, row)
-			self.check_workstation_time(row)
-
-	def validate_overlap_for_workstation(self, args, row):
-		if args.get("to_time") and get_datetime(args.to_time) < get_datetime(args.from_time):
-			args.to_time = add_to_date(row.planned_start_time, minutes=row.remaining_time_in_mins)
-
-		# get the last record based on the to time from the job card
-		data = self.get_overlap_for(args)
-
-		if not data:
-			row.planned_start_time = args.from_time
-			return
-
-		if data:
-			if not self.workstation:
-				self.workstation = data.workstation
-
-			if data.get("planned_start_time"):
-				args.planned_start_time = get_datetime(data.planned_start_time)
-			else:
-				args.planned_start_time = get_datetime(data.to_time + get_mins_between_operations())
-
-			args.from_time = args.planned_start_time
-			args.to_time = add_to_date(args.planned_start_time, minutes=row.remaining_time_in_mins)
-
-			self.validate_overlap_for_workstation(args, row)
-
-	def check_workstation_time(self, row):
-		workstation_doc = frappe.get_cached_doc("Workstation", self.workstation)
-		if not workstation_doc.working_hours or cint(
-			frappe.db.get_single_value("Manufacturing Settings", "allow_overtime")
-		):
-			if get_datetime(row.planned_end_time) <= get_datetime(row.planned_start_time):
-				row.planned_end_time = add_to_date(row.planned_start_time, minutes=row.time_in_mins)
-				row.remaining_time_in_mins = 0.0
-			else:
-				row.remaining_time_in_mins -= time_diff_in_minutes(
-					row.planned_end_time, row.planned_start_time
-				)
-
-			self.update_time_logs(row)
-			return
-
-		start_date = getdate(row.planned_start_time)
-		start_time = get_time(row.planned_start_time)
-
-		new_start_date = workstation_doc.validate_workstation_holiday(start_date)
-
-		if new_start_date != start_date:
-			row.planned_start_time = datetime.datetime.combine(new_start_date, start_time)
-			start_date = new_start_date
-
-		total_idx = len(workstation_doc.working_hours)
-
-		for i, time_slot in enumerate(workstation_doc.working_hours):
-			workstation_start_time = datetime.datetime.combine(start_date, get_time(time_slot.start_time))
-			workstation_end_time = datetime.datetime.combine(start_date, get_time(time_slot.end_time))
-
-			if (
-				get_datetime(row.planned_start_time) >= workstation_start_time
-				and get_datetime(row.planned_start_time) <= workstation_end_time
-			):
-				time_in_mins = time_diff_in_minutes(workstation_end_time, row.planned_start_time)
-
-				# If remaining time fit in workstation time logs else split hours as per workstation time
-				if time_in_mins > row.remaining_time_in_mins:
-					row.planned_end_time = add_to_date(
-						row.planned_start_time, minutes=row.remaining_time_in_mins
-					)
-					row.remaining_time_in_mins = 0
-				else:
-					row.planned_end_time = add_to_date(row.planned_start_time, minutes=time_in_mins)
-					row.remaining_time_in_mins -= time_in_mins
-
-				self.update_time_logs(row)
-
-				if total_idx != (i + 1) and row.remaining_time_in_mins > 0:
-					row.planned_start_time = datetime.datetime.combine(
-						start_date, get_time(workstation_doc.working_hours[i + 1].start_time)
-					)
-
-		if row.remaining_time_in_mins > 0:
-			start_date = add_days(start_date, 1)
-			row.planned_start_time = datetime.datetime.combine(
-				start_date, get_time(workstation_doc.working_hours[0].start_time)
-			)
+	def schedule_time_logs(self, row, calendar=None):
+		"Plan the operation in the free slots of the workstation, on the calendar of the planning run"
+		(calendar or WorkstationCalendar()).schedule_time_logs(self, row)
 
 	def add_time_log(self, args):
 		last_row = []
@@ -25,6 +25,7 @@ from pypika.terms import ExistsCriterion
 
 from erpnext.manufacturing.doctype.bom.bom import get_children as get_bom_children
 from erpnext.manufacturing.doctype.bom.bom import validate_bom_no
+from erpnext.manufacturing.doctype.flat_bom_item.flat_bom_item import get_flat_bom_items
 from erpnext.manufacturing.doctype.work_order.work_order import get_item_details
 from erpnext.setup.doctype.item_group.item_group import get_item_group_defaults
 from erpnext.stock.get_item_details import get_conversion_factor
@@ -600,7 +601,10 @@ class ProductionPlan(Document):
 
 	@frappe.whitelist()
 	def make_work_order(self):
-		from erpnext.manufacturing.doctype.work_order.work_order import get_default_warehouse
+		from erpnext.manufacturing.doctype.work_order.work_order import (
+			get_default_warehouse,
+			submit_work_orders,
+		)
 
 		wo_list, po_list = [], []
 		subcontracted_po = {}
@@ -609,6 +613,10 @@ class ProductionPlan(Document):
 		self.make_work_order_for_finished_goods(wo_list, default_warehouses)
 		self.make_work_order_for_subassembly_items(wo_list, subcontracted_po, default_warehouses)
 		self.make_subcontracted_purchase_order(subcontracted_po, po_list)
+
+		if self.get("submit_work_orders"):
+			submit_work_orders(wo_list)
+
 		self.show_list_created_message("Work Order", wo_list)
 		self.show_list_created_message("Purchase Order", po_list)
 
@@ -1152,6 +1160,101 @@ def get_subitems(
 	return item_details
 
 
+def get_subitems_from_flat_bom(
+	item_details,
+	flat_bom_items,
+	company,
+	include_non_stock_items,
+	include_subcontracted_items,
+	planned_qty=1,
+	item_data=None,
+):
+	"""Same as `get_subitems` with exploded items, from the BOM exploded by `get_flat_bom_items`.
+
+	`item_data` caches the item details of the company across the calls."""
+	rows = [
+		d
+		for d in flat_bom_items
+		if not d.is_sub_assembly
+		and (include_non_stock_items or not d.has_non_stock_item)
+		and (include_subcontracted_items or not d.has_subcontracted_item)
+	]
+
+	item_data = item_data if item_data is not None else {}
+	item_data.update(
+		get_item_data_for_subitems([d.item_code for d in rows if d.item_code not in item_data], company)
+	)
+
+	for d in rows:
+		qty = flt(d.qty) * flt(planned_qty)
+		if d.item_code in item_details:
+			item_details[d.item_code].qty = item_details[d.item_code].qty + qty
+			continue
+
+		item = item_data.get(d.item_code) or {}
+		item_details[d.item_code] = frappe._dict(
+			{
+				"item_code": d.item_code,
+				"default_material_request_type": item.get("default_material_request_type"),
+				"item_name": item.get("item_name"),
+				"qty": qty,
+				"is_sub_contracted": item.get("is_sub_contracted"),
+				"source_warehouse": d.source_warehouse,
+				"default_bom": None,
+				"description": d.description,
+				"stock_uom": d.stock_uom,
+				"min_order_qty": item.get("min_order_qty"),
+				"safety_stock": item.get("safety_stock"),
+				"default_warehouse": item.get("default_warehouse"),
+				"purchase_uom": item.get("purchase_uom"),
+				"conversion_factor": item.get("conversion_factor"),
+			}
+		)
+
+	return item_details
+
+
+def get_item_data_for_subitems(item_codes, company):
+	if not item_codes:
+		return {}
+
+	item = frappe.qb.DocType("Item")
+	item_default = frappe.qb.DocType("Item Default")
+	item_uom = frappe.qb.DocType("UOM Conversion Detail")
+
+	items = (
+		frappe.qb.from_(item)
+		.left_join(item_default)
+		.on((item.name == item_default.parent) & (item_default.company == company))
+		.left_join(item_uom)
+		.on((item.name == item_uom.parent) & (item_uom.uom == item.purchase_uom))
+		.select(
+			item.name.as_("item_code"),
+			item.default_material_request_type,
+			item.item_name,
+			item.is_sub_contracted_item.as_("is_sub_contracted"),
+			item.min_order_qty,
+			item.safety_stock,
+			item_default.default_warehouse,
+			item.purchase_uom,
+			item_uom.conversion_factor,
+		)
+		.where(item.name.isin(list(set(item_codes))))
+	).run(as_dict=True)
+
+	item_data = {}
+	for d in items:
+		if d.item_code in item_data:
+			continue
+
+		if not d.conversion_factor and d.purchase_uom:
+			d.conversion_factor = get_uom_conversion_factor(d.item_code, d.purchase_uom)
+
+		item_data[d.item_code] = d
+
+	return item_data
+
+
 def get_material_request_items(
 	doc,
 	row,
@@ -1413,6 +1516,20 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 		if not data.get("include_exploded_items") and doc.get("sub_assembly_items"):
 			data["include_exploded_items"] = 1
 
+	# BOMs exploded through the default BOMs of the sub-assemblies, read together for the rows
+	# whose raw materials are taken from the flat BOM below
+	flat_bom_items = {}
+	if not (doc.get("skip_available_sub_assembly_item") or doc.get("include_subcontracted_items")):
+		flat_bom_items = get_flat_bom_items(
+			[
+				data.get("bom_no")
+				for data in po_items
+				if data.get("include_exploded_items") and data.get("bom_no") and not data.get("required_qty")
+			]
+		)
+	item_data = {}
+
+	for data in po_items:
 		planned_qty = data.get("required_qty") or data.get("planned_qty")
 		ignore_existing_ordered_qty = data.get("ignore_existing_ordered_qty") or ignore_existing_ordered_qty
 		warehouse = doc.get("for_warehouse")
@@ -1454,6 +1571,16 @@ def get_items_for_material_requests(doc, warehouses=None, get_parent_warehouse_d
 						planned_qty=planned_qty,
 						doc=doc,
 					)
+				elif data.get("include_exploded_items"):
+					item_details = get_subitems_from_flat_bom(
+						item_details,
+						flat_bom_items.get(bom_no) or get_flat_bom_items([bom_no]).get(bom_no, []),
+						company,
+						include_non_stock_items,
+						include_subcontracted_items,
+						planned_qty=planned_qty,
+						item_data=item_data,
+					)
 				else:
 					item_details = get_subitems(
 						doc,
@@ -1,7 +1,7 @@
 # Copyright (c) 2017, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 import frappe
-from frappe.tests.utils import FrappeTestCase
+from frappe.tests.utils import FrappeTestCase, change_settings
 from frappe.utils import add_to_date, flt, getdate, now_datetime, nowdate
 
 from erpnext.controllers.item_variant import create_variant
@@ -1602,6 +1602,96 @@ class TestProductionPlan(FrappeTestCase):
 			self.assertEqual(row.production_item, sf_item)
 			self.assertEqual(row.qty, 5.0)
 
+	@change_settings(
+		"Manufacturing Settings",
+		{
+			"disable_capacity_planning": 0,
+			"capacity_planning_for_days": 30,
+			"mins_between_operations": 10,
+			"default_wip_warehouse": "_Test Warehouse 1 - _TC",
+			"default_fg_warehouse": "_Test Warehouse - _TC",
+		},
+	)
+	def test_submit_work_orders(self):
+		"Job cards of the work orders submitted from the plan are planned on one workstation calendar"
+		from unittest.mock import patch
+
+		from erpnext.manufacturing.doctype.routing.test_routing import (
+			create_routing,
+			setup_bom,
+			setup_operations,
+		)
+		from erpnext.manufacturing.doctype.work_order import work_order
+
+		operation = {
+			"operation": "_Test Production Plan Calendar Operation",
+			"workstation": "_Test Production Plan Calendar Workstation",
+			"time_in_mins": 60,
+		}
+		setup_operations([operation])
+		routing = create_routing(
+			routing_name="_Test Production Plan Calendar Routing", operations=[operation]
+		)
+
+		items = ["_Test Production Plan Calendar Item 1", "_Test Production Plan Calendar Item 2"]
+		for item_code in items:
+			setup_bom(item_code=item_code, routing=routing.name, currency="INR")
+
+		planned_start_date = "2026-01-05 09:00:00"
+		pln = create_production_plan(
+			item_code=items[0],
+			planned_start_date=planned_start_date,
+			warehouse="_Test Warehouse - _TC",
+			skip_getting_mr_items=True,
+			do_not_save=True,
+		)
+		pln.append(
+			"po_items",
+			{
+				"item_code": items[1],
+				"bom_no": frappe.db.get_value("Item", items[1], "default_bom"),
+				"planned_qty": 1,
+				"planned_start_date": planned_start_date,
+				"stock_uom": "Nos",
+				"warehouse": "_Test Warehouse - _TC",
+			},
+		)
+		pln.insert()
+		pln.submit()
+
+		pln.submit_work_orders = 1
+		with patch.object(
+			work_order, "WorkstationCalendar", wraps=work_order.WorkstationCalendar
+		) as calendar:
+			pln.make_work_order()
+
+		# the time logs of the workstation are read once for all the work orders
+		self.assertEqual(calendar.call_count, 1)
+
+		work_orders = frappe.get_all(
+			"Work Order", filters={"production_plan": pln.name}, fields=["name", "docstatus"]
+		)
+		self.assertEqual([d.docstatus for d in work_orders], [1, 1])
+
+		job_card = frappe.qb.DocType("Job Card")
+		time_log = frappe.qb.DocType("Job Card Time Log")
+		time_logs = (
+			frappe.qb.from_(time_log)
+			.join(job_card)
+			.on(time_log.parent == job_card.name)
+			.select(time_log.from_time, time_log.to_time)
+			.where(job_card.work_order.isin([d.name for d in work_orders]))
+			.orderby(time_log.from_time)
+		).run()
+
+		self.assertEqual(
+			[(str(from_time), str(to_time)) for from_time, to_time in time_logs],
+			[
+				("2026-01-05 09:00:00", "2026-01-05 10:00:00"),
+				("2026-01-05 10:10:00", "2026-01-05 11:10:00"),
+			],
+		)
+
 
 def create_production_plan(**args):
 	"""
@@ -30,6 +30,7 @@ from erpnext.manufacturing.doctype.bom.bom import (
 from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
 	get_mins_between_operations,
 )
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import WorkstationCalendar
 from erpnext.stock.doctype.batch.batch import make_batch
 from erpnext.stock.doctype.item.item import get_item_defaults, validate_end_of_life
 from erpnext.stock.doctype.serial_no.serial_no import (
@@ -480,22 +481,31 @@ class WorkOrder(Document):
 		enable_capacity_planning = not cint(manufacturing_settings_doc.disable_capacity_planning)
 		plan_days = cint(manufacturing_settings_doc.capacity_planning_for_days) or 30
 
+		calendar = None
+		if enable_capacity_planning:
+			# shared by the work orders submitted together, see `submit_work_orders`
+			calendar = frappe.flags.workstation_calendar or WorkstationCalendar()
+
 		for index, row in enumerate(self.operations):
 			qty = self.qty
 			while qty > 0:
 				qty = split_qty_based_on_batch_size(self, row, qty)
 				if row.job_card_qty > 0:
-					self.prepare_data_for_job_card(row, index, plan_days, enable_capacity_planning)
+					self.prepare_data_for_job_card(row, index, plan_days, enable_capacity_planning, calendar)
 
 		planned_end_date = self.operations and self.operations[-1].planned_end_time
 		if planned_end_date:
 			self.db_set("planned_end_date", planned_end_date)
 
-	def prepare_data_for_job_card(self, row, index, plan_days, enable_capacity_planning):
+	def prepare_data_for_job_card(self, row, index, plan_days, enable_capacity_planning, calendar=None):
 		self.set_operation_start_end_time(index, row)
 
 		job_card_doc = create_job_card(
-			self, row, auto_create=True, enable_capacity_planning=enable_capacity_planning
+			self,
+			row,
+			auto_create=True,
+			enable_capacity_planning=enable_capacity_planning,
+			calendar=calendar,
 		)
 
 		if enable_capacity_planning and job_card_doc:
@@ -1422,7 +1432,7 @@ def validate_operation_data(row):
 		)
 
 
-def create_job_card(work_order, row, enable_capacity_planning=False, auto_create=False):
+def create_job_card(work_order, row, enable_capacity_planning=False, auto_create=False, calendar=None):
 	doc = frappe.new_doc("Job Card")
 	doc.update(
 		{
@@ -1449,7 +1459,7 @@ def create_job_card(work_order, row, enable_capacity_planning=False, auto_create
 	if auto_create:
 		doc.flags.ignore_mandatory = True
 		if enable_capacity_planning:
-			doc.schedule_time_logs(row)
+			doc.schedule_time_logs(row, calendar)
 
 		doc.insert()
 		frappe.msgprint(_("Job card {0} created").format(get_link_to_form("Job Card", doc.name)), alert=True)
@@ -1461,6 +1471,17 @@ def create_job_card(work_order, row, enable_capacity_planning=False, auto_create
 	return doc
 
 
+def submit_work_orders(work_orders):
+	"""Submit the work orders, planning the job cards of all of them on one workstation calendar,
+	so that the time logs of each workstation are read once for the run"""
+	frappe.flags.workstation_calendar = WorkstationCalendar()
+	try:
+		for work_order in work_orders:
+			frappe.get_doc("Work Order", work_order).submit()
+	finally:
+		frappe.flags.workstation_calendar = None
+
+
 def get_work_order_operation_data(work_order, operation, workstation):
 	for d in work_order.operations:
 		if d.operation == operation and d.workstation == workstation:
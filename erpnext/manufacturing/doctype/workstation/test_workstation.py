@@ -2,7 +2,8 @@
 # See license.txt
 import frappe
 from frappe.test_runner import make_test_records
-from frappe.tests.utils import FrappeTestCase
+from frappe.tests.utils import FrappeTestCase, change_settings
+from frappe.utils import get_datetime
 
 from erpnext.manufacturing.doctype.operation.test_operation import make_operation
 from erpnext.manufacturing.doctype.routing.test_routing import create_routing, setup_bom
@@ -11,6 +12,7 @@ from erpnext.manufacturing.doctype.workstation.workstation import (
 	WorkstationHolidayError,
 	check_if_within_operating_hours,
 )
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import WorkstationCalendar
 
 test_dependencies = ["Warehouse"]
 test_records = frappe.get_test_records("Workstation")
@@ -94,6 +96,67 @@ class TestWorkstation(FrappeTestCase):
 		self.assertEqual(bom_doc.operations[0].hour_rate, 250)
 		self.assertEqual(bom_doc.operations[1].hour_rate, 250)
 
+	@change_settings(
+		"Manufacturing Settings",
+		{"allow_overtime": 0, "allow_production_on_holidays": 0, "mins_between_operations": 10},
+	)
+	def test_workstation_calendar(self):
+		"Operations are planned in the free working hours of the workstation, after the ones planned before"
+		from erpnext.setup.doctype.holiday_list.test_holiday_list import make_holiday_list
+
+		holiday_list = make_holiday_list(
+			"_Test Workstation Calendar Holiday List",
+			from_date="2026-01-01",
+			to_date="2026-12-31",
+			holiday_dates=[{"holiday_date": "2026-01-08", "description": "Test Holiday"}],
+		)
+
+		workstation = make_workstation(workstation_name="_Test Workstation Calendar")
+		workstation.production_capacity = 1
+		workstation.holiday_list = holiday_list.name
+		workstation.set("working_hours", [])
+		workstation.append("working_hours", {"start_time": "09:00:00", "end_time": "13:00:00"})
+		workstation.append("working_hours", {"start_time": "14:00:00", "end_time": "18:00:00"})
+		workstation.save()
+
+		calendar = WorkstationCalendar()
+
+		def schedule(planned_start_time, time_in_mins):
+			job_card = frappe.new_doc("Job Card")
+			job_card.workstation = workstation.name
+			row = frappe._dict(
+				{"planned_start_time": get_datetime(planned_start_time), "time_in_mins": time_in_mins}
+			)
+			job_card.schedule_time_logs(row, calendar)
+
+			return [(str(d.from_time), str(d.to_time)) for d in job_card.time_logs]
+
+		self.assertEqual(
+			schedule("2026-01-05 09:00:00", 300),
+			[
+				("2026-01-05 09:00:00", "2026-01-05 13:00:00"),
+				("2026-01-05 14:00:00", "2026-01-05 15:00:00"),
+			],
+		)
+
+		# waits for the working hours and for the operation planned before it on the calendar, with
+		# the minutes between operations
+		self.assertEqual(
+			schedule("2026-01-05 08:00:00", 240),
+			[
+				("2026-01-05 15:10:00", "2026-01-05 18:00:00"),
+				("2026-01-06 09:00:00", "2026-01-06 10:10:00"),
+			],
+		)
+
+		# moved from the holiday to the next working day, after the operation planned on it
+		self.assertEqual(
+			schedule("2026-01-09 09:00:00", 60), [("2026-01-09 09:00:00", "2026-01-09 10:00:00")]
+		)
+		self.assertEqual(
+			schedule("2026-01-08 09:00:00", 120), [("2026-01-09 10:10:00", "2026-01-09 12:10:00")]
+		)
+
 
 def make_workstation(*args, **kwargs):
 	args = args if args else kwargs
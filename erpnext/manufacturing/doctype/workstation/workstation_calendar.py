@@ -0,0 +1,238 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import datetime
+from bisect import bisect_left, insort
+
+import frappe
+from frappe.utils import add_days, cint, get_datetime, get_time, getdate
+
+from erpnext.manufacturing.doctype.manufacturing_settings.manufacturing_settings import (
+	get_mins_between_operations,
+)
+from erpnext.manufacturing.doctype.workstation_type.workstation_type import get_workstations
+from erpnext.support.doctype.issue.issue import get_holidays
+
+
+class WorkstationCalendar:
+	"""Availability of workstations for capacity planning, loaded once per planning run.
+
+	The time logs of the open job cards of a workstation are read once, when it is first scheduled,
+	into a list of (from time, to time) sorted by from time, along with its working hours, holidays
+	and production capacity. Free slots are searched in this list, and the time logs of the job cards
+	scheduled through the calendar are added to it, so that the operations of all the work orders of
+	a run are planned in memory."""
+
+	def __init__(self):
+		self.allow_overtime = cint(frappe.db.get_single_value("Manufacturing Settings", "allow_overtime"))
+		self.allow_production_on_holidays = cint(
+			frappe.db.get_single_value("Manufacturing Settings", "allow_production_on_holidays")
+		)
+		self.mins_between_operations = get_mins_between_operations()
+		self.workstations = {}
+		self.workstation_types = {}
+
+	def get_workstation(self, workstation, from_time):
+		"Workstation details with its time logs ending after `from_time`"
+		details = self.workstations.get(workstation)
+		if not details:
+			doc = frappe.get_cached_doc("Workstation", workstation)
+			holidays = set()
+			if doc.holiday_list and not self.allow_production_on_holidays:
+				holidays = {getdate(date) for date in get_holidays(doc.holiday_list)}
+
+			details = self.workstations[workstation] = frappe._dict(
+				{
+					"working_hours": [
+						(get_time(slot.start_time), get_time(slot.end_time)) for slot in doc.working_hours
+					],
+					"holidays": holidays,
+					"production_capacity": cint(doc.production_capacity) or 1,
+				}
+			)
+
+		if details.loaded_from is None or from_time < details.loaded_from:
+			# only the time logs ending before the ones already loaded are read
+			details.time_logs = sorted(
+				(details.time_logs or []) + self.get_time_logs(workstation, from_time, details.loaded_from)
+			)
+			details.max_duration = max(
+				(to_time - start for start, to_time in details.time_logs), default=datetime.timedelta()
+			)
+			details.loaded_from = from_time
+
+		return details
+
+	def get_time_logs(self, workstation, from_time, upto_time=None):
+		job_card = frappe.qb.DocType("Job Card")
+		time_log = frappe.qb.DocType("Job Card Time Log")
+
+		query = (
+			frappe.qb.from_(time_log)
+			.join(job_card)
+			.on(time_log.parent == job_card.name)
+			.select(time_log.from_time, time_log.to_time)
+			.where(
+				(job_card.workstation == workstation)
+				& (job_card.docstatus < 2)
+				& (time_log.from_time.isnotnull())
+				& (time_log.to_time > from_time)
+			)
+		)
+		if upto_time:
+			query = query.where(time_log.to_time <= upto_time)
+
+		return [(get_datetime(start), get_datetime(to_time)) for start, to_time in query.run()]
+
+	def add_time_log(self, workstation, from_time, to_time):
+		details = self.get_workstation(workstation, from_time)
+		insort(details.time_logs, (from_time, to_time))
+		details.max_duration = max(details.max_duration, to_time - from_time)
+
+	def get_overlapping_time_logs(self, workstation, from_time, to_time):
+		details = self.get_workstation(workstation, from_time)
+		time_logs = details.time_logs
+
+		# time logs starting before `from_time - max_duration` end before `from_time`
+		start = bisect_left(time_logs, (from_time - details.max_duration,))
+		end = bisect_left(time_logs, (to_time,))
+
+		return [time_log for time_log in time_logs[start:end] if time_log[1] > from_time]
+
+	def get_busy_until(self, workstation, from_time, to_time):
+		"""End of the time logs of the workstation between the times if they use up its production
+		capacity, None if it is available"""
+		overlapping = self.get_overlapping_time_logs(workstation, from_time, to_time)
+		if not overlapping:
+			return None
+
+		production_capacity = self.workstations[workstation].production_capacity
+		if production_capacity > 1:
+			# most time logs running at the same time
+			events = sorted(
+				[(start, 1) for start, _to_time in overlapping]
+				+ [(to_time, -1) for _start, to_time in overlapping]
+			)
+			running = max_running = 0
+			for _time, change in events:
+				running += change
+				max_running = max(max_running, running)
+
+			if max_running < production_capacity:
+				return None
+
+		return max(to_time for _start, to_time in overlapping)
+
+	def get_free_slot(self, job_card, from_time, minutes):
+		"""Earliest time from `from_time` at which the workstation of the job card is available for
+		`minutes`. A workstation of its workstation type is set on the job card, if it has none."""
+		while True:
+			to_time = from_time + datetime.timedelta(minutes=minutes)
+
+			busy_until = None
+
+			if job_card.workstation:
+				busy_until = self.get_busy_until(job_card.workstation, from_time, to_time)
+			elif job_card.workstation_type:
+				for workstation in self.get_workstations(job_card.workstation_type):
+					workstation_busy_until = self.get_busy_until(workstation, from_time, to_time)
+					if not workstation_busy_until:
+						job_card.workstation = workstation
+						busy_until = None
+						break
+
+					# wait for the first workstation of the type to be available
+					busy_until = min(busy_until or workstation_busy_until, workstation_busy_until)
+
+			if not busy_until:
+				return from_time
+
+			from_time = busy_until + self.mins_between_operations
+
+	def get_workstations(self, workstation_type):
+		if workstation_type not in self.workstation_types:
+			# the first available workstation by name is picked
+			self.workstation_types[workstation_type] = sorted(get_workstations(workstation_type))
+
+		return self.workstation_types[workstation_type]
+
+	def schedule_time_logs(self, job_card, row):
+		"""Add time logs to the job card for the operation `row`, from its planned start time, in the
+		free slots of the working hours of the workstation"""
+		time_logs = []
+		row.remaining_time_in_mins = row.time_in_mins
+
+		while row.remaining_time_in_mins > 0:
+			row.planned_start_time = self.get_free_slot(
+				job_card, get_datetime(row.planned_start_time), row.remaining_time_in_mins
+			)
+			if time_log := self.add_working_time_log(job_card, row):
+				time_logs.append(time_log)
+
+		if job_card.workstation:
+			for from_time, to_time in time_logs:
+				self.add_time_log(job_card.workstation, from_time, to_time)
+
+	def add_working_time_log(self, job_card, row):
+		"""Add a time log for the operation from its planned start time to the end of its working
+		hours, and move its planned start time to the next working hours if time remains"""
+		details = self.workstations.get(job_card.workstation) if job_card.workstation else None
+
+		if not details or not details.working_hours or self.allow_overtime:
+			row.planned_end_time = row.planned_start_time + datetime.timedelta(
+				minutes=row.remaining_time_in_mins
+			)
+			row.remaining_time_in_mins = 0.0
+			job_card.update_time_logs(row)
+			return row.planned_start_time, row.planned_end_time
+
+		start_date = getdate(row.planned_start_time)
+		if start_date in details.holidays:
+			start_time = get_time(row.planned_start_time)
+			while start_date in details.holidays:
+				start_date = add_days(start_date, 1)
+
+			# the workstation may already be busy on the next working day, look for a free slot again
+			row.planned_start_time = datetime.datetime.combine(start_date, start_time)
+			return None
+
+		for i, (slot_start_time, slot_end_time) in enumerate(details.working_hours):
+			workstation_start_time = datetime.datetime.combine(start_date, slot_start_time)
+			workstation_end_time = datetime.datetime.combine(start_date, slot_end_time)
+
+			if row.planned_start_time < workstation_start_time:
+				# before the working hours, wait for them to start
+				row.planned_start_time = workstation_start_time
+				return None
+
+			if row.planned_start_time < workstation_end_time:
+				time_in_mins = (workstation_end_time - row.planned_start_time).total_seconds() / 60
+
+				# If remaining time fit in workstation time logs else split hours as per workstation time
+				if time_in_mins > row.remaining_time_in_mins:
+					row.planned_end_time = row.planned_start_time + datetime.timedelta(
+						minutes=row.remaining_time_in_mins
+					)
+					row.remaining_time_in_mins = 0
+				else:
+					row.planned_end_time = workstation_end_time
+					row.remaining_time_in_mins -= time_in_mins
+
+				job_card.update_time_logs(row)
+				time_log = (row.planned_start_time, row.planned_end_time)
+
+				if row.remaining_time_in_mins > 0:
+					row.planned_start_time = self.get_next_working_time(details, start_date, i + 1)
+
+				return time_log
+
+		# after the working hours of the day
+		row.planned_start_time = self.get_next_working_time(details, start_date, len(details.working_hours))
+		return None
+
+	def get_next_working_time(self, details, date, idx):
+		"Start of the working hours at `idx` on the date, or of the first working hours of the next day"
+		if idx < len(details.working_hours):
+			return datetime.datetime.combine(date, details.working_hours[idx][0])
+
+		return datetime.datetime.combine(add_days(date, 1), details.working_hours[0][0])
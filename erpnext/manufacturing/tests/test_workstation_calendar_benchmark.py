@@ -0,0 +1,64 @@
+from itertools import pairwise
+
+import frappe
+from frappe.tests.utils import FrappeTestCase, change_settings
+from frappe.utils import add_to_date, get_datetime
+
+from erpnext.manufacturing.doctype.workstation.test_workstation import make_workstation
+from erpnext.manufacturing.doctype.workstation.workstation_calendar import WorkstationCalendar
+from erpnext.tests.utils import benchmark
+
+OPERATIONS = 10_000
+OPERATIONS_PER_WORK_ORDER = 8
+WORKSTATIONS = 8
+
+
+@benchmark
+class TestWorkstationCalendarBenchmark(FrappeTestCase):
+	"""Benchmark of planning 10k operations, 8 per work order, on the workstation calendar.
+
+	The time logs planned on each workstation are asserted not to overlap."""
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	@change_settings(
+		"Manufacturing Settings",
+		{"allow_overtime": 0, "allow_production_on_holidays": 0, "mins_between_operations": 10},
+	)
+	def test_plan_operations(self):
+		workstations = []
+		for i in range(WORKSTATIONS):
+			workstation = make_workstation(workstation_name=f"_Test Calendar Benchmark Workstation {i}")
+			workstation.production_capacity = 1
+			workstation.holiday_list = None
+			workstation.set("working_hours", [])
+			workstation.append("working_hours", {"start_time": "08:00:00", "end_time": "12:00:00"})
+			workstation.append("working_hours", {"start_time": "13:00:00", "end_time": "17:00:00"})
+			workstation.save()
+			workstations.append(workstation.name)
+
+		calendar = WorkstationCalendar()
+		job_cards = []
+
+		for i in range(OPERATIONS // OPERATIONS_PER_WORK_ORDER):
+			planned_start_time = get_datetime("2026-01-05 08:00:00")
+			for idx in range(OPERATIONS_PER_WORK_ORDER):
+				job_card = frappe.new_doc("Job Card")
+				job_card.workstation = workstations[(i + idx) % WORKSTATIONS]
+				row = frappe._dict({"planned_start_time": planned_start_time, "time_in_mins": 45})
+				job_card.schedule_time_logs(row, calendar)
+
+				# the next operation of the work order starts after this one
+				planned_start_time = add_to_date(row.planned_end_time, minutes=10)
+				job_cards.append(job_card)
+
+		time_logs = {}
+		for job_card in job_cards:
+			for d in job_card.time_logs:
+				time_logs.setdefault(job_card.workstation, []).append((d.from_time, d.to_time))
+
+		for workstation_time_logs in time_logs.values():
+			workstation_time_logs.sort()
+			for previous, current in pairwise(workstation_time_logs):
+				self.assertLessEqual(previous[1], current[0])
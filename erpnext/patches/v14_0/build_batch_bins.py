@@ -0,0 +1,5 @@
+from erpnext.stock.doctype.batch_bin.batch_bin import rebuild_batch_bins
+
+
+def execute():
+	rebuild_batch_bins()
@@ -0,0 +1,5 @@
+from erpnext.stock.doctype.item_search_index.item_search_index import rebuild_item_search_index
+
+
+def execute():
+	rebuild_item_search_index()
@@ -178,11 +178,12 @@ class TransactionDeletionRecord(Document):
 	def delete_bins(self):
 		self.validate_doc_status()
 		if not self.delete_bin_data:
-			frappe.db.sql(
-				"""delete from `tabBin` where warehouse in
-					(select name from tabWarehouse where company=%s)""",
-				self.company,
-			)
+			for doctype in ("Bin", "Batch Bin"):
+				frappe.db.sql(
+					f"""delete from `tab{doctype}` where warehouse in
+						(select name from tabWarehouse where company=%s)""",
+					self.company,
+				)
 			self.db_set("delete_bin_data", 1)
 		self.enqueue_task(task="Delete Leads and Addresses")
 
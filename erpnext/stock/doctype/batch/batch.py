@@ -11,6 +11,8 @@ from frappe.utils import cint, flt, get_link_to_form, nowtime
 from frappe.utils.data import add_days
 from frappe.utils.jinja import render_template
 
+from erpnext.stock.doctype.batch_bin.batch_bin import update_batch_details
+
 
 class UnableToSelectBatchError(frappe.ValidationError):
 	pass
@@ -150,6 +152,10 @@ class Batch(Document):
 				title=_("Expiry Date Mandatory"),
 			)
 
+	def on_update(self):
+		if self.has_value_changed("expiry_date") or self.has_value_changed("disabled"):
+			update_batch_details(self)
+
 	def get_name_from_naming_series(self):
 		"""
 		Get a name generated for a Batch from the Batch's naming series.
@@ -173,7 +179,12 @@ def get_batch_qty(batch_no=None, warehouse=None, item_code=None, posting_date=No
 
 	:param batch_no: Optional - give qty for this batch no
 	:param warehouse: Optional - give qty for this warehouse
-	:param item_code: Optional - give qty for this item"""
+	:param item_code: Optional - give qty for this item
+
+	The current qty is read from Batch Bin, the qty as on `posting_date` from the Stock Ledger."""
+
+	if not posting_date:
+		return get_batch_bin_qty(batch_no, warehouse, item_code)
 
 	sle = frappe.qb.DocType("Stock Ledger Entry")
 
@@ -215,19 +226,49 @@ def get_batch_qty(batch_no=None, warehouse=None, item_code=None, posting_date=No
 	return out
 
 
+def get_batch_bin_qty(batch_no=None, warehouse=None, item_code=None):
+	"`get_batch_qty` without a posting date, from the quantities kept in Batch Bin"
+	batch_bin = frappe.qb.DocType("Batch Bin")
+
+	out = 0
+	if batch_no and warehouse:
+		out = (
+			frappe.qb.from_(batch_bin)
+			.select(Sum(batch_bin.actual_qty))
+			.where((batch_bin.warehouse == warehouse) & (batch_bin.batch_no == batch_no))
+		).run(as_list=True)[0][0] or 0
+
+	if batch_no and not warehouse:
+		out = (
+			frappe.qb.from_(batch_bin)
+			.select(batch_bin.warehouse, Sum(batch_bin.actual_qty).as_("qty"))
+			.where(batch_bin.batch_no == batch_no)
+			.groupby(batch_bin.warehouse)
+		).run(as_dict=True)
+
+	if not batch_no and item_code and warehouse:
+		out = (
+			frappe.qb.from_(batch_bin)
+			.select(batch_bin.batch_no, batch_bin.actual_qty.as_("qty"))
+			.where((batch_bin.item_code == item_code) & (batch_bin.warehouse == warehouse))
+		).run(as_dict=True)
+
+	return out
+
+
 @frappe.whitelist()
 def get_batches_by_oldest(item_code, warehouse):
 	"""Returns the oldest batch and qty for the given item_code and warehouse"""
-	batches = get_batch_qty(item_code=item_code, warehouse=warehouse)
-	
-	if not batches:
-		return []
-	# Batches are being returned as 0 here
-	batches_dates = [
-		[batch, frappe.get_value("Batch", batch.batch_no, "expiry_date")] for batch in batches
-	]
-
 	import datetime
+
+	batch_bin = frappe.qb.DocType("Batch Bin")
+	batches = (
+		frappe.qb.from_(batch_bin)
+		.select(batch_bin.batch_no, batch_bin.actual_qty.as_("qty"), batch_bin.expiry_date)
+		.where((batch_bin.item_code == item_code) & (batch_bin.warehouse == warehouse))
+	).run(as_dict=True)
+
+	batches_dates = [[batch, batch.pop("expiry_date")] for batch in batches]
 	batches_dates.sort(key=lambda tup: tup[1] or datetime.date(9999, 12, 31))
 	return batches_dates
 
@@ -437,27 +478,25 @@ def get_batches(item_code, warehouse, qty=1, throw=False, serial_no=None):
 	from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
 
 	batch = frappe.qb.DocType("Batch")
-	sle = frappe.qb.DocType("Stock Ledger Entry")
+	batch_bin = frappe.qb.DocType("Batch Bin")
 
 	query = (
-		frappe.qb.from_(batch)
-		.join(sle)
-		.on(batch.batch_id == sle.batch_no)
+		frappe.qb.from_(batch_bin)
+		.join(batch)
+		.on(batch.name == batch_bin.batch_no)
 		.select(
-			batch.batch_id,
-			Sum(sle.actual_qty).as_("qty"),
-			batch.expiry_date,
-			batch.disabled
+			batch_bin.batch_no.as_("batch_id"),
+			batch_bin.actual_qty.as_("qty"),
+			batch_bin.expiry_date,
+			batch_bin.disabled,
 		)
 		.where(
-			(sle.item_code == item_code)
-			& (sle.warehouse == warehouse)
-			& (sle.is_cancelled == 0)
-			& (batch.disabled == 0)
-			& ((batch.expiry_date >= CurDate()) | (batch.expiry_date.isnull()))
+			(batch_bin.item_code == item_code)
+			& (batch_bin.warehouse == warehouse)
+			& (batch_bin.disabled == 0)
+			& ((batch_bin.expiry_date >= CurDate()) | (batch_bin.expiry_date.isnull()))
 		)
-		.groupby(batch.batch_id)
-		.orderby(batch.expiry_date, batch.creation)
+		.orderby(batch_bin.expiry_date, batch.creation)
 	)
 
 	if serial_no and frappe.get_cached_value("Item", item_code, "has_batch_no"):
@@ -474,7 +513,7 @@ def get_batches(item_code, warehouse, qty=1, throw=False, serial_no=None):
 		if batches and len(batches) > 1:
 			return []
 
-		query = query.where(batch.name == batches[0].batch_no)
+		query = query.where(batch_bin.batch_no == batches[0].batch_no)
 
 	return query.run(as_dict=True)
 
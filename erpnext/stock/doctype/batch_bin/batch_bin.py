@@ -0,0 +1,130 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.query_builder.functions import Sum
+from frappe.utils import cint, flt, now
+
+BATCH_BIN_FIELDS = [
+	"name",
+	"creation",
+	"modified",
+	"owner",
+	"modified_by",
+	"item_code",
+	"warehouse",
+	"batch_no",
+	"actual_qty",
+	"expiry_date",
+	"disabled",
+]
+
+
+class BatchBin(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_unique(
+		"Batch Bin", ["item_code", "warehouse", "batch_no"], constraint_name="unique_item_warehouse_batch"
+	)
+
+
+def get_or_make_batch_bin(item_code, warehouse, batch_no):
+	batch_bin = frappe.db.get_value(
+		"Batch Bin", {"item_code": item_code, "warehouse": warehouse, "batch_no": batch_no}
+	)
+
+	if not batch_bin:
+		batch_bin = _create_batch_bin(item_code, warehouse, batch_no).name
+	return batch_bin
+
+
+def _create_batch_bin(item_code, warehouse, batch_no):
+	"""Create a batch bin and take care of concurrent inserts."""
+
+	savepoint = "create_batch_bin"
+	filters = {"item_code": item_code, "warehouse": warehouse, "batch_no": batch_no}
+	try:
+		frappe.db.savepoint(savepoint)
+		batch_bin = frappe.get_doc(doctype="Batch Bin", **filters)
+		batch_bin.flags.ignore_permissions = 1
+		batch_bin.insert()
+	except frappe.UniqueValidationError:
+		frappe.db.rollback(save_point=savepoint)  # preserve transaction in postgres
+		batch_bin = frappe.get_last_doc("Batch Bin", filters)
+
+	return batch_bin
+
+
+def update_batch_bin_qty(item_code, warehouse, batch_no, qty):
+	"Add `qty` to the stock of the batch in the warehouse, in the transaction of its ledger entries"
+	if not batch_no or not flt(qty):
+		return
+
+	batch_bin_name = get_or_make_batch_bin(item_code, warehouse, batch_no)
+	batch_bin = frappe.qb.DocType("Batch Bin")
+
+	# incremented in the database, so that concurrent entries of the batch are serialized by the row lock
+	(
+		frappe.qb.update(batch_bin)
+		.set(batch_bin.actual_qty, batch_bin.actual_qty + flt(qty))
+		.set(batch_bin.modified, now())
+		.where(batch_bin.name == batch_bin_name)
+	).run()
+
+
+def update_batch_details(batch):
+	"Copy the expiry date and status of the batch to its batch bins"
+	frappe.db.set_value(
+		"Batch Bin",
+		{"batch_no": batch.name},
+		{"expiry_date": batch.expiry_date, "disabled": cint(batch.disabled)},
+		update_modified=False,
+	)
+
+
+def rebuild_batch_bins(item_code=None):
+	"Build the batch bins of the item, or of all the items, from the Stock Ledger Entries"
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+	batch = frappe.qb.DocType("Batch")
+
+	query = (
+		frappe.qb.from_(sle)
+		.join(batch)
+		.on(batch.name == sle.batch_no)
+		.select(
+			sle.item_code,
+			sle.warehouse,
+			sle.batch_no,
+			Sum(sle.actual_qty).as_("actual_qty"),
+			batch.expiry_date,
+			batch.disabled,
+		)
+		.where((sle.is_cancelled == 0) & (sle.batch_no.isnotnull()) & (sle.batch_no != ""))
+		.groupby(sle.item_code, sle.warehouse, sle.batch_no)
+	)
+	if item_code:
+		query = query.where(sle.item_code == item_code)
+
+	timestamp = now()
+	values = [
+		(
+			frappe.generate_hash(length=10),
+			timestamp,
+			timestamp,
+			frappe.session.user,
+			frappe.session.user,
+			row.item_code,
+			row.warehouse,
+			row.batch_no,
+			flt(row.actual_qty),
+			row.expiry_date,
+			cint(row.disabled),
+		)
+		for row in query.run(as_dict=True)
+	]
+
+	frappe.db.delete("Batch Bin", {"item_code": item_code} if item_code else None)
+	frappe.db.bulk_insert("Batch Bin", fields=BATCH_BIN_FIELDS, values=values)
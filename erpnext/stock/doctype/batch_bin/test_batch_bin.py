@@ -0,0 +1,47 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, today
+
+from erpnext.stock.doctype.batch.batch import get_batch_qty, get_batches
+from erpnext.stock.doctype.batch.test_batch import make_new_batch
+from erpnext.stock.doctype.batch_bin.batch_bin import rebuild_batch_bins
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+
+
+class TestBatchBin(FrappeTestCase):
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def test_batch_bin_follows_stock_ledger(self):
+		"Batch quantities kept in Batch Bin match the Stock Ledger through receipts, issues and cancellations"
+		item_code = make_item("_Test Batch Bin Item", {"has_batch_no": 1, "is_stock_item": 1}).name
+		warehouse = "_Test Warehouse - _TC"
+		batch_no = make_new_batch(
+			item_code=item_code, batch_id="_TBB-0001", expiry_date=add_days(today(), 30)
+		).name
+
+		make_stock_entry(item_code=item_code, to_warehouse=warehouse, qty=20, rate=10, batch_no=batch_no)
+		issue = make_stock_entry(item_code=item_code, from_warehouse=warehouse, qty=8, batch_no=batch_no)
+		self.assertEqual(get_batch_qty(batch_no, warehouse), 12)
+
+		issue.cancel()
+		self.assertEqual(get_batch_qty(batch_no, warehouse), 20)
+		self.assertEqual(get_batch_qty(batch_no, warehouse, posting_date=today()), 20)
+
+		# expiry and status are copied from the batch for batch selection
+		batch = frappe.get_doc("Batch", batch_no)
+		batch.disabled = 1
+		batch.save()
+		self.assertFalse(get_batches(item_code, warehouse))
+
+		batch.disabled = 0
+		batch.save()
+		self.assertEqual([(d.batch_id, d.qty) for d in get_batches(item_code, warehouse)], [(batch_no, 20)])
+
+		rebuild_batch_bins(item_code)
+		self.assertEqual(get_batch_qty(batch_no, warehouse), 20)
+		self.assertEqual(get_batch_qty(batch_no=batch_no), [{"warehouse": warehouse, "qty": 20}])
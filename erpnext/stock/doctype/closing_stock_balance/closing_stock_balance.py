@@ -8,10 +8,23 @@ from frappe import _
 from frappe.core.doctype.prepared_report.prepared_report import create_json_gz_file
 from frappe.desk.form.load import get_attachments
 from frappe.model.document import Document
-from frappe.utils import get_link_to_form, gzip_decompress, parse_json
+from frappe.query_builder import Order
+from frappe.query_builder.functions import IfNull, Min
+from frappe.utils import (
+	add_days,
+	cint,
+	get_first_day,
+	get_link_to_form,
+	getdate,
+	gzip_decompress,
+	parse_json,
+	today,
+)
 from frappe.utils.background_jobs import enqueue
+from frappe.utils.nestedset import get_descendants_of
 
-from erpnext.stock.report.stock_balance.stock_balance import execute
+# filters a Closing Stock Balance can be prepared for
+CLOSING_BALANCE_FILTERS = ["warehouse", "item_code", "item_group", "warehouse_type"]
 
 
 class ClosingStockBalance(Document):
@@ -49,7 +62,7 @@ class ClosingStockBalance(Document):
 			)
 		)
 
-		for fieldname in ["warehouse", "item_code", "item_group", "warehouse_type"]:
+		for fieldname in CLOSING_BALANCE_FILTERS:
 			if self.get(fieldname):
 				query = query.where(table[fieldname] == self.get(fieldname))
 
@@ -84,6 +97,8 @@ class ClosingStockBalance(Document):
 			frappe.delete_doc("File", attachment.name)
 
 	def create_closing_stock_balance_entries(self):
+		from erpnext.stock.report.stock_balance.stock_balance import execute
+
 		columns, data = execute(
 			filters=frappe._dict(
 				{
@@ -129,3 +144,124 @@ def prepare_closing_stock_balance(name):
 	except Exception:
 		doc.db_set("status", "Failed")
 		doc.log_error(title="Closing Stock Balance Failed")
+
+
+def get_latest_closing_stock_balance(company, before_date, filters=None):
+	"""Latest completed Closing Stock Balance of the company ending before `before_date`.
+
+	Only balances prepared without filters, or with the same filters as `filters`, cover the
+	rows of a report run with `filters`.
+	"""
+	if not company:
+		return
+
+	filters = filters or {}
+	table = frappe.qb.DocType("Closing Stock Balance")
+
+	query = (
+		frappe.qb.from_(table)
+		.select(table.name, table.to_date)
+		.where(
+			(table.docstatus == 1)
+			& (table.company == company)
+			& (table.to_date < before_date)
+			& (table.status == "Completed")
+		)
+		.orderby(table.to_date, order=Order.desc)
+		.limit(1)
+	)
+
+	for fieldname in CLOSING_BALANCE_FILTERS:
+		if filters.get(fieldname):
+			query = query.where(
+				(IfNull(table[fieldname], "") == "") | (table[fieldname] == filters.get(fieldname))
+			)
+		else:
+			query = query.where(IfNull(table[fieldname], "") == "")
+
+	closing_balance = query.run(as_dict=True)
+	return closing_balance[0] if closing_balance else None
+
+
+def get_closing_stock_balance_data(name, filters=None):
+	"""Rows of a Closing Stock Balance, limited to the item and warehouse filters of a report"""
+	data = frappe.get_doc("Closing Stock Balance", name).get_prepared_data()
+	rows = [frappe._dict(row) for row in data.get("data") or []]
+
+	filters = filters or {}
+	if filters.get("item_code"):
+		rows = [row for row in rows if row.item_code == filters.get("item_code")]
+
+	item_filters = {}
+	if filters.get("item_group"):
+		item_group = filters.get("item_group")
+		item_filters["item_group"] = (
+			"in",
+			[*get_descendants_of("Item Group", item_group, ignore_permissions=True), item_group],
+		)
+	if filters.get("brand"):
+		item_filters["brand"] = filters.get("brand")
+
+	if item_filters and rows:
+		item_filters["name"] = ("in", list({row.item_code for row in rows}))
+		items = set(frappe.get_all("Item", filters=item_filters, pluck="name"))
+		rows = [row for row in rows if row.item_code in items]
+
+	warehouse_filters = {}
+	if filters.get("warehouse"):
+		warehouse = filters.get("warehouse")
+		warehouse_filters["name"] = (
+			"in",
+			[*get_descendants_of("Warehouse", warehouse, ignore_permissions=True), warehouse],
+		)
+	if filters.get("warehouse_type"):
+		warehouse_filters["warehouse_type"] = filters.get("warehouse_type")
+
+	if warehouse_filters:
+		warehouses = set(frappe.get_all("Warehouse", filters=warehouse_filters, pluck="name"))
+		rows = [row for row in rows if row.warehouse in warehouses]
+
+	return rows
+
+
+def create_monthly_closing_stock_balance():
+	"""Scheduled monthly, closes the stock balance of every company up to the end of the last month"""
+	if not cint(frappe.db.get_single_value("Stock Settings", "create_closing_stock_balance_monthly")):
+		return
+
+	to_date = add_days(get_first_day(today()), -1)
+
+	for company in frappe.get_all("Company", pluck="name"):
+		try:
+			create_closing_stock_balance(company, to_date)
+		except Exception:
+			frappe.db.rollback()
+			frappe.log_error(title=f"Monthly Closing Stock Balance Failed for {company}")
+		else:
+			frappe.db.commit()
+
+
+def create_closing_stock_balance(company, to_date):
+	last_closing_balance = get_latest_closing_stock_balance(company, add_days(to_date, 1))
+	if last_closing_balance:
+		if getdate(last_closing_balance.to_date) >= getdate(to_date):
+			return
+
+		from_date = add_days(last_closing_balance.to_date, 1)
+	else:
+		sle = frappe.qb.DocType("Stock Ledger Entry")
+		from_date = (
+			frappe.qb.from_(sle)
+			.select(Min(sle.posting_date))
+			.where((sle.company == company) & (sle.is_cancelled == 0) & (sle.posting_date <= to_date))
+		).run()[0][0]
+
+		if not from_date:
+			# no stock transactions to close
+			return
+
+	doc = frappe.new_doc("Closing Stock Balance")
+	doc.update({"company": company, "from_date": from_date, "to_date": to_date})
+	doc.submit()
+
+	return doc
@@ -1,9 +1,54 @@
 # Copyright (c) 2023, Frappe Technologies Pvt. Ltd. and Contributors
 # See license.txt
 
-# import frappe
+import frappe
 from frappe.tests.utils import FrappeTestCase
 
+from erpnext.stock.doctype.closing_stock_balance.closing_stock_balance import (
+	get_latest_closing_stock_balance,
+)
+
 
 class TestClosingStockBalance(FrappeTestCase):
-	pass
+	def test_latest_closing_stock_balance(self):
+		company = "_Test Company"
+		warehouse = "_Test Warehouse - _TC"
+
+		unfiltered = make_closing_stock_balance(company, "2010-01-01", "2010-01-31")
+		warehouse_wise = make_closing_stock_balance(
+			company, "2010-02-01", "2010-02-28", warehouse=warehouse
+		)
+
+		# balances are only used for reports starting after them
+		self.assertIsNone(get_latest_closing_stock_balance(company, "2010-01-31"))
+		self.assertEqual(get_latest_closing_stock_balance(company, "2010-02-01").name, unfiltered.name)
+
+		# a balance prepared for a warehouse does not cover the other warehouses
+		self.assertEqual(get_latest_closing_stock_balance(company, "2010-03-01").name, unfiltered.name)
+		self.assertEqual(
+			get_latest_closing_stock_balance(company, "2010-03-01", {"warehouse": warehouse}).name,
+			warehouse_wise.name,
+		)
+		self.assertEqual(
+			get_latest_closing_stock_balance(
+				company, "2010-03-01", {"warehouse": "_Test Warehouse 1 - _TC"}
+			).name,
+			unfiltered.name,
+		)
+
+
+def make_closing_stock_balance(company, from_date, to_date, **args):
+	doc = frappe.get_doc(
+		{
+			"doctype": "Closing Stock Balance",
+			"company": company,
+			"from_date": from_date,
+			"to_date": to_date,
+			**args,
+		}
+	).insert()
+
+	# skip the background job preparing the balance
+	doc.db_set({"docstatus": 1, "status": "Completed"})
+
+	return doc
@@ -1449,6 +1449,42 @@ class TestDeliveryNote(FrappeTestCase):
 		self.assertEqual(so.items[0].rate, rate)
 		self.assertEqual(dn.items[0].rate, so.items[0].rate)
 
+	def test_delivered_qty_updated_in_bulk(self):
+		"Queries updating the Sales Order do not grow with the number of rows delivered"
+		from unittest.mock import patch
+
+		from erpnext.selling.doctype.sales_order.sales_order import make_delivery_note
+
+		item = make_item(properties={"is_stock_item": 0}).name
+
+		def get_sales_order_queries(rows):
+			so = make_sales_order(
+				item_list=[
+					{"item_code": item, "qty": 2, "rate": 100, "warehouse": "_Test Warehouse - _TC"}
+					for i in range(rows)
+				]
+			)
+			dn = make_delivery_note(so.name)
+			dn.items[0].qty = 1
+			dn.submit()
+
+			so.load_from_db()
+			self.assertEqual([d.delivered_qty for d in so.items], [1] + [2] * (rows - 1))
+			self.assertEqual(so.per_delivered, flt((2 * rows - 1) / (2 * rows) * 100, 6))
+
+			# quantities are summed up again, as on submit
+			with patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+				dn.update_prevdoc_status()
+
+			queries = [call.args[0] for call in sql.call_args_list if "`tabSales Order" in str(call.args[0])]
+
+			return len(queries)
+
+		queries = get_sales_order_queries(2)
+		self.assertEqual(get_sales_order_queries(20), queries)
+		# fewer queries than rows
+		self.assertLess(queries, 20)
+
 
 def create_delivery_note(**args):
 	dn = frappe.new_doc("Delivery Note")
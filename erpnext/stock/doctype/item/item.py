@@ -29,8 +29,10 @@ from erpnext.controllers.item_variant import (
 	make_variant_item_code,
 	validate_item_variant_attributes,
 )
+from erpnext.manufacturing.doctype.flat_bom_item.flat_bom_item import clear_flat_bom_items
 from erpnext.setup.doctype.item_group.item_group import invalidate_cache_for
 from erpnext.stock.doctype.item_default.item_default import ItemDefault
+from erpnext.stock.doctype.item_search_index.item_search_index import update_item_search_index
 
 
 class DuplicateReorderRows(frappe.ValidationError):
@@ -124,6 +126,8 @@ class Item(Document):
 		self.update_variants()
 		self.update_item_price()
 		self.update_website_item()
+		update_item_search_index(self)
+		clear_flat_bom_items(item_code=self.name)
 
 	def validate_description(self):
 		"""Clean HTML description if set"""
@@ -465,6 +469,8 @@ class Item(Document):
 	def on_trash(self):
 		frappe.db.sql("""delete from tabBin where item_code=%s""", self.name)
 		frappe.db.sql("delete from `tabItem Price` where item_code=%s", self.name)
+		frappe.db.delete("Item Search Index", {"item_code": self.name})
+		clear_flat_bom_items(item_code=self.name)
 		for variant_of in frappe.get_all("Item", filters={"variant_of": self.name}):
 			frappe.delete_doc("Item", variant_of.name)
 
@@ -491,6 +497,7 @@ class Item(Document):
 			invalidate_cache_for_item(self)
 
 		frappe.db.set_value("Item", new_name, "item_code", new_name)
+		update_item_search_index(frappe.get_doc("Item", new_name))
 
 		if merge:
 			self.set_last_purchase_rate(new_name)
@@ -0,0 +1,102 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import re
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cstr, now, strip_html
+
+# scanning every search field with LIKE gets too slow above this many items,
+# Item link fields are searched through the fulltext index instead
+ITEM_SEARCH_INDEX_THRESHOLD = 50000
+
+# innodb_ft_min_token_size, shorter words are not indexed
+MIN_TOKEN_SIZE = 3
+
+
+class ItemSearchIndex(Document):
+	pass
+
+
+def on_doctype_update():
+	if frappe.db.db_type == "mariadb" and not frappe.db.has_index(
+		"tabItem Search Index", "search_text"
+	):
+		frappe.db.sql_ddl("alter table `tabItem Search Index` add fulltext index search_text(search_text)")
+
+
+def get_item_search_fields():
+	meta = frappe.get_meta("Item", cached=True)
+	return sorted({"name", "item_code", "item_name", "item_group", "description", *meta.get_search_fields()})
+
+
+def get_item_search_text(item, barcodes=None):
+	"Text of all the search fields and barcodes of the item, as indexed"
+	values = [strip_html(cstr(item.get(fieldname))) for fieldname in get_item_search_fields()]
+	values += barcodes or []
+
+	return " ".join(value for value in values if value)
+
+
+def update_item_search_index(item):
+	"Called on save of the Item, barcodes are saved along with it"
+	frappe.db.delete("Item Search Index", {"item_code": item.name})
+
+	frappe.get_doc(
+		{
+			"doctype": "Item Search Index",
+			"item_code": item.name,
+			"search_text": get_item_search_text(item, [d.barcode for d in item.get("barcodes") or []]),
+		}
+	).insert(ignore_permissions=True)
+
+
+def rebuild_item_search_index():
+	frappe.db.delete("Item Search Index")
+
+	barcodes = {}
+	for d in frappe.get_all("Item Barcode", fields=["parent", "barcode"]):
+		barcodes.setdefault(d.parent, []).append(d.barcode)
+
+	timestamp = now()
+	values = []
+	for item in frappe.get_all("Item", fields=get_item_search_fields()):
+		values.append(
+			(
+				frappe.generate_hash(length=10),
+				timestamp,
+				timestamp,
+				frappe.session.user,
+				frappe.session.user,
+				item.name,
+				get_item_search_text(item, barcodes.get(item.name)),
+			)
+		)
+
+	fields = ["name", "creation", "modified", "owner", "modified_by", "item_code", "search_text"]
+	frappe.db.bulk_insert("Item Search Index", fields=fields, values=values)
+
+
+def get_fulltext_search_term(txt):
+	"""Boolean mode search term matching every word of `txt` as a prefix.
+
+	Returns None if the index can not be used for the search, for words shorter than the
+	indexed tokens or catalogues small enough to be scanned.
+	"""
+	if frappe.db.db_type != "mariadb":
+		return
+
+	# punctuation are operators in boolean mode
+	words = re.findall(r"\w+", cstr(txt))
+	if not words or any(len(word) < MIN_TOKEN_SIZE for word in words):
+		return
+
+	if frappe.db.count("Item", cache=True) < ITEM_SEARCH_INDEX_THRESHOLD:
+		return
+
+	if not frappe.db.count("Item Search Index", cache=True):
+		# not built yet
+		return
+
+	return " ".join(f"+{word}*" for word in words)
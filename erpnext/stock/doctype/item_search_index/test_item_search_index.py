@@ -0,0 +1,22 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+
+
+class TestItemSearchIndex(FrappeTestCase):
+	def test_index_updated_on_save(self):
+		item = make_item("_Test Item Search Index Item", {"description": "<p>Blue Ceramic Mug</p>"})
+		item.append("barcodes", {"barcode": "8901234567897"})
+		item.save()
+
+		search_text = frappe.db.get_value("Item Search Index", {"item_code": item.name}, "search_text")
+		self.assertIn("Blue Ceramic Mug", search_text)
+		self.assertIn("8901234567897", search_text)
+		self.assertNotIn("<p>", search_text)
+
+		item.delete()
+		self.assertFalse(frappe.db.exists("Item Search Index", {"item_code": item.name}))
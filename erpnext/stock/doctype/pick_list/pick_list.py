@@ -716,33 +716,39 @@ def get_available_item_locations_for_batched_item(
 	total_picked_qty=0,
 	consider_rejected_warehouses=False,
 ):
-	sle = frappe.qb.DocType("Stock Ledger Entry")
+	batch_bin = frappe.qb.DocType("Batch Bin")
 	batch = frappe.qb.DocType("Batch")
+	warehouse = frappe.qb.DocType("Warehouse")
 
 	query = (
-		frappe.qb.from_(sle)
-		.from_(batch)
-		.select(sle.warehouse, sle.batch_no, Sum(sle.actual_qty).as_("qty"))
+		frappe.qb.from_(batch_bin)
+		.join(batch)
+		.on(batch.name == batch_bin.batch_no)
+		.join(warehouse)
+		.on(warehouse.name == batch_bin.warehouse)
+		.select(batch_bin.warehouse, batch_bin.batch_no, batch_bin.actual_qty.as_("qty"))
 		.where(
-			(sle.batch_no == batch.name)
-			& (sle.item_code == item_code)
-			& (sle.company == company)
-			& (batch.disabled == 0)
-			& (sle.is_cancelled == 0)
-			& (IfNull(batch.expiry_date, "2200-01-01") > today())
+			(batch_bin.item_code == item_code)
+			& (warehouse.company == company)
+			& (batch_bin.disabled == 0)
+			& (batch_bin.actual_qty > 0)
+			& (IfNull(batch_bin.expiry_date, "2200-01-01") > today())
+		)
+		.orderby(
+			IfNull(batch_bin.expiry_date, "2200-01-01"),
+			batch.creation,
+			batch_bin.batch_no,
+			batch_bin.warehouse,
 		)
-		.groupby(sle.warehouse, sle.batch_no, sle.item_code)
-		.having(Sum(sle.actual_qty) > 0)
-		.orderby(IfNull(batch.expiry_date, "2200-01-01"), batch.creation, sle.batch_no, sle.warehouse)
 		.limit(ceil(required_qty + total_picked_qty))
 	)
 
 	if from_warehouses:
-		query = query.where(sle.warehouse.isin(from_warehouses))
+		query = query.where(batch_bin.warehouse.isin(from_warehouses))
 
 	if not consider_rejected_warehouses:
 		if rejected_warehouses := get_rejected_warehouses():
-			query = query.where(sle.warehouse.notin(rejected_warehouses))
+			query = query.where(batch_bin.warehouse.notin(rejected_warehouses))
 
 	return query.run(as_dict=True)
 
@@ -8,6 +8,7 @@ from frappe.model.document import Document
 from frappe.query_builder import DocType, Interval
 from frappe.query_builder.functions import Max, Now
 from frappe.utils import cint, get_link_to_form, get_weekday, getdate, now, nowtime
+from frappe.utils.background_jobs import is_job_enqueued
 from frappe.utils.user import get_users_with_role
 from rq.timeouts import JobTimeoutException
 
@@ -379,6 +380,10 @@ def repost_entries():
 
 	riv_entries = get_repost_item_valuation_entries()
 
+	if cint(frappe.db.get_single_value("Stock Reposting Settings", "parallel_reposting")):
+		enqueue_parallel_reposts(riv_entries)
+		return
+
 	for row in riv_entries:
 		doc = frappe.get_doc("Repost Item Valuation", row.name)
 		if doc.status in ("Queued", "In Progress"):
@@ -390,6 +395,167 @@ def repost_entries():
 		return
 
 
+def enqueue_parallel_reposts(riv_entries):
+	"""Dispatch independent groups of queued reposts to separate background workers."""
+	if not riv_entries:
+		return
+
+	max_workers = cint(frappe.db.get_single_value("Stock Reposting Settings", "reposting_workers")) or 1
+	item_codes_by_riv = get_item_codes_by_riv([row.name for row in riv_entries])
+
+	for riv_names in group_dependent_reposts(item_codes_by_riv, max_workers):
+		job_id = f"repost_item_valuation_{riv_names[0]}"
+		if is_job_enqueued(job_id):
+			continue
+
+		frappe.enqueue(
+			"erpnext.stock.doctype.repost_item_valuation.repost_item_valuation.repost_group",
+			queue="long",
+			timeout=7200,
+			job_id=job_id,
+			riv_names=riv_names,
+			now=frappe.flags.in_test,
+		)
+
+
+def repost_group(riv_names):
+	"""Repost a group of dependent entries in their posting order.
+
+	Each entry is locked while it is being reposted. If an entry is already locked by another
+	worker, rest of the group is left for the next run as it might depend on that entry."""
+	for name in riv_names:
+		doc = frappe.get_doc("Repost Item Valuation", name)
+		if doc.status not in ("Queued", "In Progress"):
+			continue
+
+		if doc.is_locked:
+			break
+
+		doc.lock()
+		try:
+			repost(doc)
+			doc.deduplicate_similar_repost()
+		finally:
+			doc.unlock()
+
+
+def get_item_codes_by_riv(riv_names) -> dict[str, set[str]]:
+	"""Items whose ledger can be touched by each repost entry, used to find independent reposts."""
+	riv_entries = frappe.get_all(
+		"Repost Item Valuation",
+		filters={"name": ("in", riv_names)},
+		fields=[
+			"name",
+			"based_on",
+			"item_code",
+			"voucher_type",
+			"voucher_no",
+			"posting_date",
+			"posting_time",
+			"company",
+			"distinct_item_and_warehouse",
+		],
+	)
+
+	vouchers = [row.voucher_no for row in riv_entries if row.based_on == "Transaction" and row.voucher_no]
+	items_by_voucher = {}
+	if vouchers:
+		for sle in frappe.get_all(
+			"Stock Ledger Entry",
+			filters={"voucher_no": ("in", vouchers)},
+			fields=["voucher_type", "voucher_no", "item_code"],
+			distinct=True,
+		):
+			items_by_voucher.setdefault((sle.voucher_type, sle.voucher_no), set()).add(sle.item_code)
+
+	item_codes_by_riv = {}
+	for row in riv_entries:
+		item_codes = set(items_by_voucher.get((row.voucher_type, row.voucher_no), []))
+		if row.item_code:
+			item_codes.add(row.item_code)
+
+		# items found as dependencies in a partially completed repost
+		if row.distinct_item_and_warehouse:
+			for key in frappe.parse_json(row.distinct_item_and_warehouse):
+				item_codes.add(frappe.safe_eval(key)[0])
+
+		item_codes_by_riv[row.name] = get_items_of_dependent_vouchers(row, item_codes)
+
+	# preserve the posting order of entries
+	return {name: item_codes_by_riv.get(name, set()) for name in riv_names}
+
+
+def get_items_of_dependent_vouchers(riv, item_codes: set[str]) -> set[str]:
+	"""Add items of future vouchers which will be reposted along with the given items.
+
+	Reposting an item revalues the other items of a Manufacture or Repack entry through
+	`dependant_sle_voucher_detail_no`, and GL entries of every future voucher of the item are
+	reposted as well. Items of such vouchers are followed until no new item is found."""
+	item_codes = set(item_codes)
+	pending_items = set(item_codes)
+
+	while pending_items:
+		dependent_items = frappe.db.sql_list(
+			"""select distinct sle.item_code
+			from `tabStock Ledger Entry` sle
+			where sle.is_cancelled = 0
+				and sle.voucher_no in (
+					select future_sle.voucher_no
+					from `tabStock Ledger Entry` future_sle
+					where future_sle.item_code in %(item_codes)s
+						and future_sle.is_cancelled = 0
+						and future_sle.company = %(company)s
+						and timestamp(future_sle.posting_date, future_sle.posting_time)
+							>= timestamp(%(posting_date)s, %(posting_time)s)
+				)""",
+			{
+				"item_codes": list(pending_items),
+				"company": riv.company,
+				"posting_date": riv.posting_date,
+				"posting_time": riv.posting_time,
+			},
+		)
+
+		pending_items = set(dependent_items) - item_codes
+		item_codes.update(pending_items)
+
+	return item_codes
+
+
+def group_dependent_reposts(item_codes_by_riv: dict[str, set[str]], max_groups: int) -> list[list[str]]:
+	"""Partition repost entries into at most `max_groups` groups.
+
+	Entries sharing an item are always placed in the same group, as reposting one can change
+	the valuation used by the other. Order of entries is preserved within a group.
+
+	Concurrent reposts of the same item-warehouse are still serialized by the row locks taken
+	on future Stock Ledger Entries, grouping avoids such contention and duplicate work."""
+	parent = {}
+
+	def find(node):
+		parent.setdefault(node, node)
+		while parent[node] != node:
+			parent[node] = parent[parent[node]]
+			node = parent[node]
+		return node
+
+	for riv_name, item_codes in item_codes_by_riv.items():
+		for item_code in item_codes:
+			parent[find(("item", item_code))] = find(("riv", riv_name))
+		find(("riv", riv_name))
+
+	components = {}
+	for riv_name in item_codes_by_riv:
+		components.setdefault(find(("riv", riv_name)), []).append(riv_name)
+
+	groups = [[] for _ in range(min(max(max_groups, 1), len(components)))]
+	for component in sorted(components.values(), key=len, reverse=True):
+		min(groups, key=len).extend(component)
+
+	order = {riv_name: idx for idx, riv_name in enumerate(item_codes_by_riv)}
+	return [sorted(group, key=order.get) for group in groups]
+
+
 def get_repost_item_valuation_entries():
 	return frappe.db.sql(
 		""" SELECT name from `tabRepost Item Valuation`
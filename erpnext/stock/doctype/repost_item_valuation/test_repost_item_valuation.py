@@ -14,6 +14,8 @@ from erpnext.controllers.stock_controller import create_item_wise_repost_entries
 from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.purchase_receipt.test_purchase_receipt import make_purchase_receipt
 from erpnext.stock.doctype.repost_item_valuation.repost_item_valuation import (
+	get_item_codes_by_riv,
+	group_dependent_reposts,
 	in_configured_timeslot,
 )
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
@@ -85,6 +87,90 @@ class TestRepostItemValuation(FrappeTestCase, StockTestMixin):
 				msg=f"Exepcted false from : {case}",
 			)
 
+	def test_group_dependent_reposts(self):
+		item_codes_by_riv = {
+			"RIV-1": {"A"},
+			"RIV-2": {"B"},
+			"RIV-3": {"A", "C"},
+			"RIV-4": {"C"},
+			"RIV-5": {"D"},
+		}
+
+		# entries sharing items directly or transitively stay together, in posting order
+		self.assertEqual(
+			group_dependent_reposts(item_codes_by_riv, 4),
+			[["RIV-1", "RIV-3", "RIV-4"], ["RIV-2"], ["RIV-5"]],
+		)
+
+		# independent groups are merged when there are fewer workers
+		self.assertEqual(
+			group_dependent_reposts(item_codes_by_riv, 2),
+			[["RIV-1", "RIV-3", "RIV-4"], ["RIV-2", "RIV-5"]],
+		)
+
+		self.assertEqual(group_dependent_reposts({}, 2), [])
+
+	def test_group_reposts_with_dependent_vouchers(self):
+		frappe.flags.dont_execute_stock_reposts = True
+
+		component, fg_item, other_item = (make_item().name for _ in range(3))
+		warehouse = "_Test Warehouse - _TC"
+
+		for item_code in (component, other_item):
+			make_stock_entry(
+				item_code=item_code,
+				to_warehouse=warehouse,
+				qty=10,
+				rate=100,
+				posting_date=add_days(today(), -5),
+			)
+
+		repack = make_stock_entry(
+			item_code=component,
+			from_warehouse=warehouse,
+			qty=10,
+			purpose="Repack",
+			posting_date=add_days(today(), -3),
+			do_not_save=True,
+		)
+		repack.append(
+			"items",
+			{
+				"item_code": fg_item,
+				"t_warehouse": warehouse,
+				"qty": 10,
+				"transfer_qty": 10,
+				"uom": "Nos",
+				"stock_uom": "Nos",
+				"conversion_factor": 1.0,
+			},
+		)
+		repack.submit()
+
+		rivs = []
+		for item_code in (component, other_item, fg_item):
+			riv = frappe.get_doc(
+				doctype="Repost Item Valuation",
+				based_on="Item and Warehouse",
+				item_code=item_code,
+				warehouse=warehouse,
+				posting_date=add_days(today(), -4),
+				posting_time="00:01:00",
+			)
+			riv.flags.dont_run_in_test = True
+			riv.submit()
+			rivs.append(riv.name)
+
+		item_codes_by_riv = get_item_codes_by_riv(rivs)
+
+		# finished item of the future repack is revalued while reposting its component
+		self.assertEqual(item_codes_by_riv[rivs[0]], {component, fg_item})
+		self.assertEqual(item_codes_by_riv[rivs[1]], {other_item})
+		self.assertEqual(group_dependent_reposts(item_codes_by_riv, 2), [[rivs[0], rivs[2]], [rivs[1]]])
+
+		for name in rivs:
+			frappe.get_doc("Repost Item Valuation", name).set_status("Skipped")
+
 	def test_clear_old_logs(self):
 		# create 10 logs
 		for i in range(1, 20):
@@ -6,7 +6,7 @@ import json
 
 import frappe
 from frappe import ValidationError, _
-from frappe.model.naming import make_autoname
+from frappe.model.naming import make_autoname, parse_naming_series
 from frappe.query_builder.functions import Coalesce
 from frappe.utils import add_days, cint, cstr, flt, get_link_to_form, getdate, now, nowdate, safe_json_loads
 
@@ -130,7 +130,10 @@ class SerialNo(StockController):
 			self.purchase_rate = purchase_sle.incoming_rate
 			if purchase_sle.voucher_type in ("Purchase Receipt", "Purchase Invoice"):
 				self.supplier, self.supplier_name = frappe.db.get_value(
-					purchase_sle.voucher_type, purchase_sle.voucher_no, ["supplier", "supplier_name"]
+					purchase_sle.voucher_type,
+					purchase_sle.voucher_no,
+					["supplier", "supplier_name"],
+					cache=True,
 				)
 
 			# If sales return entry
@@ -156,7 +159,10 @@ class SerialNo(StockController):
 			self.delivery_time = delivery_sle.posting_time
 			if delivery_sle.voucher_type in ("Delivery Note", "Sales Invoice"):
 				self.customer, self.customer_name = frappe.db.get_value(
-					delivery_sle.voucher_type, delivery_sle.voucher_no, ["customer", "customer_name"]
+					delivery_sle.voucher_type,
+					delivery_sle.voucher_no,
+					["customer", "customer_name"],
+					cache=True,
 				)
 			if self.warranty_period:
 				self.warranty_expiry_date = add_days(
@@ -174,9 +180,10 @@ class SerialNo(StockController):
 			):
 				self.set(fieldname, None)
 
-	def get_last_sle(self, serial_no=None):
+	def get_last_sle(self, serial_no=None, sle_dict=None):
 		entries = {}
-		sle_dict = self.get_stock_ledger_entries(serial_no)
+		if sle_dict is None:
+			sle_dict = self.get_stock_ledger_entries(serial_no)
 		if sle_dict:
 			if sle_dict.get("incoming", []):
 				entries["purchase_sle"] = sle_dict["incoming"][-1]
@@ -248,14 +255,33 @@ class SerialNo(StockController):
 				_("Cannot delete Serial No {0}, as it is used in stock transactions").format(self.name)
 			)
 
-	def update_serial_no_reference(self, serial_no=None):
-		last_sle = self.get_last_sle(serial_no)
+	def update_serial_no_reference(self, serial_no=None, sle_dict=None):
+		last_sle = self.get_last_sle(serial_no, sle_dict)
 		self.set_purchase_details(last_sle.get("purchase_sle"))
 		self.set_sales_details(last_sle.get("delivery_sle"))
 		self.set_maintenance_status()
 		self.set_status()
 
 
+# existing serial nos of a ledger entry are updated with bulk queries from this many
+BULK_UPDATE_MIN_SERIAL_NOS = 20
+
+SERIAL_NO_DETAIL_FIELDS = [
+	"name",
+	"item_code",
+	"batch_no",
+	"sales_order",
+	"delivery_document_no",
+	"delivery_document_type",
+	"warehouse",
+	"purchase_document_type",
+	"purchase_document_no",
+	"company",
+	"status",
+	"work_order",
+]
+
+
 def process_serial_no(sle):
 	item_det = get_item_details(sle.item_code)
 	validate_serial_no(sle, item_det)
@@ -301,28 +327,18 @@ def validate_serial_no(sle, item_det):
 			if sle.voucher_no and sle.voucher_type == "Stock Entry":
 				work_order = frappe.get_cached_value("Stock Entry", sle.voucher_no, "work_order")
 
-			for serial_no in serial_nos:
-				if frappe.db.exists("Serial No", serial_no):
-					sr = frappe.db.get_value(
-						"Serial No",
-						serial_no,
-						[
-							"name",
-							"item_code",
-							"batch_no",
-							"sales_order",
-							"delivery_document_no",
-							"delivery_document_type",
-							"warehouse",
-							"purchase_document_type",
-							"purchase_document_no",
-							"company",
-							"status",
-							"work_order",
-						],
-						as_dict=1,
-					)
+			# all the serial nos are read at once, details of the voucher are read once when first needed
+			serial_no_details = get_serial_no_details(serial_nos, SERIAL_NO_DETAIL_FIELDS)
+			voucher_details = {}
+
+			def get_voucher_detail(key, method, *args):
+				if key not in voucher_details:
+					voucher_details[key] = method(*args)
+				return voucher_details[key]
 
+			for serial_no in serial_nos:
+				sr = serial_no_details.get(serial_no.upper())
+				if sr:
 					if sr.item_code != sle.item_code:
 						if not allow_serial_nos_with_different_item(serial_no, sle):
 							frappe.throw(
@@ -343,7 +359,9 @@ def validate_serial_no(sle, item_det):
 						msg = ""
 
 						if sle.voucher_type == "Stock Entry":
-							se_purpose = frappe.db.get_value("Stock Entry", sle.voucher_no, "purpose")
+							se_purpose = get_voucher_detail(
+								"purpose", frappe.db.get_value, "Stock Entry", sle.voucher_no, "purpose"
+							)
 							if se_purpose in ["Manufacture", "Material Receipt"]:
 								msg = f"Cannot create a {sle.voucher_type} ({se_purpose}) for the Item {frappe.bold(sle.item_code)} with the existing Serial No {frappe.bold(serial_no)}."
 						else:
@@ -368,8 +386,12 @@ def validate_serial_no(sle, item_det):
 						and sle.voucher_type not in ["Stock Entry", "Stock Reconciliation"]
 						and sle.voucher_type == sr.delivery_document_type
 					):
-						return_against = frappe.db.get_value(
-							sle.voucher_type, sle.voucher_no, "return_against"
+						return_against = get_voucher_detail(
+							"return_against",
+							frappe.db.get_value,
+							sle.voucher_type,
+							sle.voucher_no,
+							"return_against",
 						)
 						if return_against and return_against != sr.delivery_document_no:
 							frappe.throw(_("Serial no {0} has been already returned").format(sr.name))
@@ -405,80 +427,23 @@ def validate_serial_no(sle, item_det):
 
 							# if Sales Order reference in Serial No validate the Delivery Note or Invoice is against the same
 							if sr.sales_order and sr.delivery_document_no:
-								if sle.voucher_type == "Sales Invoice":
-									if not frappe.db.exists(
-										"Sales Invoice Item",
-										{
-											"parent": sle.voucher_no,
-											"item_code": sle.item_code,
-											"sales_order": sr.sales_order,
-										},
-									):
-										frappe.throw(
-											_(
-												"Cannot deliver Serial No {0} of item {1} as it is reserved to fullfill Sales Order {2}"
-											).format(sr.name, sle.item_code, sr.sales_order)
-										)
-								elif sle.voucher_type == "Delivery Note":
-									if not frappe.db.exists(
-										"Delivery Note Item",
-										{
-											"parent": sle.voucher_no,
-											"item_code": sle.item_code,
-											"against_sales_order": sr.sales_order,
-										},
-									):
-										invoice = frappe.db.get_value(
-											"Delivery Note Item",
-											{"parent": sle.voucher_no, "item_code": sle.item_code},
-											"against_sales_invoice",
-										)
-										if not invoice or frappe.db.exists(
-											"Sales Invoice Item",
-											{
-												"parent": invoice,
-												"item_code": sle.item_code,
-												"sales_order": sr.sales_order,
-											},
-										):
-											frappe.throw(
-												_(
-													"Cannot deliver Serial No {0} of item {1} as it is reserved to fullfill Sales Order {2}"
-												).format(sr.name, sle.item_code, sr.sales_order)
-											)
-							# if Sales Order reference in Delivery Note or Invoice validate SO reservations for item
-							if sle.voucher_type == "Sales Invoice":
-								sales_order = frappe.db.get_value(
-									"Sales Invoice Item",
-									{"parent": sle.voucher_no, "item_code": sle.item_code},
-									"sales_order",
-								)
-								if sales_order and get_reserved_qty_for_so(sales_order, sle.item_code):
-									validate_so_serial_no(sr, sales_order)
-							elif sle.voucher_type == "Delivery Note":
-								sales_order = frappe.get_value(
-									"Delivery Note Item",
-									{"parent": sle.voucher_no, "item_code": sle.item_code},
-									"against_sales_order",
-								)
-								if sales_order and get_reserved_qty_for_so(sales_order, sle.item_code):
-									validate_so_serial_no(sr, sales_order)
-								else:
-									sales_invoice = frappe.get_value(
-										"Delivery Note Item",
-										{"parent": sle.voucher_no, "item_code": sle.item_code},
-										"against_sales_invoice",
+								if not get_voucher_detail(
+									("against_sales_order", sr.sales_order),
+									is_delivered_against_sales_order,
+									sle,
+									sr.sales_order,
+								):
+									frappe.throw(
+										_(
+											"Cannot deliver Serial No {0} of item {1} as it is reserved to fullfill Sales Order {2}"
+										).format(sr.name, sle.item_code, sr.sales_order)
 									)
-									if sales_invoice:
-										sales_order = frappe.db.get_value(
-											"Sales Invoice Item",
-											{"parent": sales_invoice, "item_code": sle.item_code},
-											"sales_order",
-										)
-										if sales_order and get_reserved_qty_for_so(
-											sales_order, sle.item_code
-										):
-											validate_so_serial_no(sr, sales_order)
+							# if Sales Order reference in Delivery Note or Invoice validate SO reservations for item
+							sales_order = get_voucher_detail(
+								"reserved_sales_order", get_reserved_sales_order, sle
+							)
+							if sales_order:
+								validate_so_serial_no(sr, sales_order)
 				elif cint(sle.actual_qty) < 0:
 					# transfer out
 					frappe.throw(_("Serial No {0} not in stock").format(serial_no), SerialNoNotExistsError)
@@ -488,12 +453,100 @@ def validate_serial_no(sle, item_det):
 			)
 	elif serial_nos:
 		# SLE is being cancelled and has serial nos
+		serial_no_details = get_serial_no_details(serial_nos, ["name", "warehouse", "company", "status"])
 		for serial_no in serial_nos:
-			check_serial_no_validity_on_cancel(serial_no, sle)
+			sr = serial_no_details.get(serial_no.upper(), frappe._dict())
+			check_serial_no_validity_on_cancel(serial_no, sle, sr)
+
+
+def get_serial_no_details(serial_nos, fields):
+	"Details of the existing serial nos, by serial no in upper case as returned by `get_serial_nos`"
+	if not serial_nos:
+		return {}
+
+	return {
+		d.name.upper(): d
+		for d in frappe.get_all("Serial No", filters={"name": ("in", serial_nos)}, fields=fields)
+	}
+
+
+def is_delivered_against_sales_order(sle, sales_order):
+	"Whether the Delivery Note or Sales Invoice of the ledger entry delivers the item against the order"
+	if sle.voucher_type == "Sales Invoice":
+		return frappe.db.exists(
+			"Sales Invoice Item",
+			{
+				"parent": sle.voucher_no,
+				"item_code": sle.item_code,
+				"sales_order": sales_order,
+			},
+		)
+
+	if frappe.db.exists(
+		"Delivery Note Item",
+		{
+			"parent": sle.voucher_no,
+			"item_code": sle.item_code,
+			"against_sales_order": sales_order,
+		},
+	):
+		return True
+
+	invoice = frappe.db.get_value(
+		"Delivery Note Item",
+		{"parent": sle.voucher_no, "item_code": sle.item_code},
+		"against_sales_invoice",
+	)
+	return invoice and not frappe.db.exists(
+		"Sales Invoice Item",
+		{
+			"parent": invoice,
+			"item_code": sle.item_code,
+			"sales_order": sales_order,
+		},
+	)
 
 
-def check_serial_no_validity_on_cancel(serial_no, sle):
-	sr = frappe.db.get_value("Serial No", serial_no, ["name", "warehouse", "company", "status"], as_dict=1)
+def get_reserved_sales_order(sle):
+	"Sales Order of the Delivery Note or Sales Invoice that has a reservation for the item"
+	if sle.voucher_type == "Sales Invoice":
+		sales_order = frappe.db.get_value(
+			"Sales Invoice Item",
+			{"parent": sle.voucher_no, "item_code": sle.item_code},
+			"sales_order",
+		)
+		if sales_order and get_reserved_qty_for_so(sales_order, sle.item_code):
+			return sales_order
+
+	elif sle.voucher_type == "Delivery Note":
+		sales_order = frappe.get_value(
+			"Delivery Note Item",
+			{"parent": sle.voucher_no, "item_code": sle.item_code},
+			"against_sales_order",
+		)
+		if sales_order and get_reserved_qty_for_so(sales_order, sle.item_code):
+			return sales_order
+
+		sales_invoice = frappe.get_value(
+			"Delivery Note Item",
+			{"parent": sle.voucher_no, "item_code": sle.item_code},
+			"against_sales_invoice",
+		)
+		if sales_invoice:
+			sales_order = frappe.db.get_value(
+				"Sales Invoice Item",
+				{"parent": sales_invoice, "item_code": sle.item_code},
+				"sales_order",
+			)
+			if sales_order and get_reserved_qty_for_so(sales_order, sle.item_code):
+				return sales_order
+
+
+def check_serial_no_validity_on_cancel(serial_no, sle, sr=None):
+	if sr is None:
+		sr = frappe.db.get_value(
+			"Serial No", serial_no, ["name", "warehouse", "company", "status"], as_dict=1
+		)
 	sr_link = frappe.utils.get_link_to_form("Serial No", serial_no)
 	doc_link = frappe.utils.get_link_to_form(sle.voucher_type, sle.voucher_no)
 	actual_qty = cint(sle.actual_qty)
@@ -589,11 +642,53 @@ def update_serial_nos(sle, item_det):
 
 
 def get_auto_serial_nos(serial_no_series, qty):
+	return "\n".join(make_serial_nos_from_series(serial_no_series, cint(qty)))
+
+
+def make_serial_nos_from_series(series, qty):
+	"""`qty` new serial nos of the naming series, numbered from blocks of the series reserved at once.
+
+	Numbers of serial nos that already exist are skipped, as `get_new_serial_number` does."""
+	if "#" not in series:
+		series += ".#####"
+
+	parts = series.split(".")
+	hash_index = next((i for i, part in enumerate(parts) if part.startswith("#")), None)
+	if hash_index is None:
+		return [get_new_serial_number(series) for _i in range(qty)]
+
+	prefix = parse_naming_series(parts[:hash_index], doctype="Serial No")
+	suffix = parse_naming_series(parts[hash_index + 1 :], doctype="Serial No")
+	digits = len(parts[hash_index])
+
 	serial_nos = []
-	for _i in range(cint(qty)):
-		serial_nos.append(get_new_serial_number(serial_no_series))
+	while len(serial_nos) < qty:
+		count = qty - len(serial_nos)
+		start = reserve_series_numbers(prefix, count)
+		block = [f"{prefix}{number:0{digits}d}{suffix}" for number in range(start, start + count)]
+
+		existing_serial_nos = get_serial_no_details(block, ["name"])
+		serial_nos.extend(d for d in block if d.upper() not in existing_serial_nos)
+
+	return serial_nos
+
 
-	return "\n".join(serial_nos)
+def reserve_series_numbers(prefix, count):
+	"Reserve the next `count` numbers of the series with one locked update, returns the first number"
+	series = frappe.qb.DocType("Series")
+
+	current = (
+		frappe.qb.from_(series).select(series.current).where(series.name == prefix).for_update()
+	).run()
+
+	if current:
+		start = cint(current[0][0]) + 1
+		frappe.qb.update(series).set(series.current, start + count - 1).where(series.name == prefix).run()
+	else:
+		start = 1
+		frappe.db.sql("insert into `tabSeries` (`name`, `current`) values (%s, %s)", (prefix, count))
+
+	return start
 
 
 def get_new_serial_number(series):
@@ -608,13 +703,20 @@ def auto_make_serial_nos(args):
 	created_numbers = []
 	voucher_type = args.get("voucher_type")
 	item_code = args.get("item_code")
+	existing_serial_nos = get_serial_no_details(serial_nos, ["*"])
+	bulk_update = len(existing_serial_nos) >= BULK_UPDATE_MIN_SERIAL_NOS
+
 	for serial_no in serial_nos:
-		if frappe.db.exists("Serial No", serial_no):
-			sr = frappe.get_cached_doc("Serial No", serial_no)
-			sr = update_args_for_serial_no(sr, serial_no, args)
+		if serial_no.upper() in existing_serial_nos:
+			if not bulk_update:
+				sr = frappe.get_cached_doc("Serial No", serial_no)
+				sr = update_args_for_serial_no(sr, serial_no, args)
 		elif args.get("actual_qty", 0) > 0 and serial_no:
 			created_numbers.append(serial_no)
 
+	if bulk_update:
+		update_serial_nos_in_bulk(list(existing_serial_nos.values()), args)
+
 	if created_numbers:
 		make_bulk_serial_nos(args, created_numbers)
 
@@ -737,6 +839,18 @@ def clean_serial_no_string(serial_no: str) -> str:
 
 
 def update_args_for_serial_no(serial_no_doc, serial_no, args, is_new=False):
+	set_args_for_serial_no(serial_no_doc, serial_no, args, is_new)
+	serial_no_doc.update_serial_no_reference(serial_no)
+
+	if is_new:
+		serial_no_doc.db_insert()
+	else:
+		serial_no_doc.db_update()
+
+	return serial_no_doc
+
+
+def set_args_for_serial_no(serial_no_doc, serial_no, args, is_new=False):
 	for field in ["item_code", "work_order", "company", "batch_no", "supplier", "location"]:
 		if args.get(field):
 			serial_no_doc.set(field, args.get(field))
@@ -755,14 +869,73 @@ def update_args_for_serial_no(serial_no_doc, serial_no, args, is_new=False):
 		serial_no_doc.sales_order = None
 
 	serial_no_doc.validate_item()
-	serial_no_doc.update_serial_no_reference(serial_no)
 
-	if is_new:
-		serial_no_doc.db_insert()
-	else:
-		serial_no_doc.db_update()
 
-	return serial_no_doc
+def update_serial_nos_in_bulk(serial_nos, args):
+	"""`update_args_for_serial_no` for rows of existing serial nos.
+
+	The ledger entries of the serial nos are read at once and the changed values are written with
+	an UPDATE per set of values, instead of reading the ledger and saving each serial no."""
+	docs = []
+	for row in serial_nos:
+		doc = frappe.get_doc(dict(row, doctype="Serial No"))
+		set_args_for_serial_no(doc, doc.name, args)
+		docs.append(doc)
+
+	docs_by_item = {}
+	for doc in docs:
+		docs_by_item.setdefault((doc.item_code, doc.company), []).append(doc)
+
+	for (item_code, company), item_docs in docs_by_item.items():
+		sle_dicts = get_stock_ledger_entries_by_serial_no(item_code, company, [d.name for d in item_docs])
+		for doc in item_docs:
+			doc.update_serial_no_reference(doc.name, sle_dicts.get(doc.name.upper(), {}))
+
+	columns = [column for column in docs[0].meta.get_valid_columns() if column != "name"] if docs else []
+	serial_nos_by_values = {}
+	for doc, row in zip(docs, serial_nos, strict=True):
+		values = tuple(
+			(column, doc.get(column)) for column in columns if cstr(doc.get(column)) != cstr(row.get(column))
+		)
+		if values:
+			serial_nos_by_values.setdefault(values, []).append(doc.name)
+
+	serial_no = frappe.qb.DocType("Serial No")
+	for values, names in serial_nos_by_values.items():
+		query = frappe.qb.update(serial_no).where(serial_no.name.isin(names))
+		for column, value in values:
+			query = query.set(serial_no[column], value)
+		query.run()
+
+		for name in names:
+			frappe.clear_document_cache("Serial No", name)
+
+
+def get_stock_ledger_entries_by_serial_no(item_code, company, serial_nos):
+	"`SerialNo.get_stock_ledger_entries` of the serial nos of the item, from one read of the ledger"
+	serial_nos = {serial_no.upper() for serial_no in serial_nos}
+	sle_dicts = {}
+
+	for sle in frappe.db.sql(
+		"""
+		SELECT voucher_type, voucher_no,
+			posting_date, posting_time, incoming_rate, actual_qty, serial_no
+		FROM
+			`tabStock Ledger Entry`
+		WHERE
+			item_code=%s AND company = %s
+			AND is_cancelled = 0
+			AND ifnull(serial_no, '') != ''
+		ORDER BY
+			posting_date desc, posting_time desc, creation desc""",
+		(item_code, company),
+		as_dict=1,
+	):
+		for serial_no in serial_nos.intersection(get_serial_nos(sle.serial_no)):
+			sle_dict = sle_dicts.setdefault(serial_no, {})
+			sle_dict.setdefault("incoming" if cint(sle.actual_qty) > 0 else "outgoing", []).append(sle)
+
+	return sle_dicts
 
 
 def update_serial_nos_after_submit(controller, parentfield):
@@ -4,6 +4,7 @@
 # ERPNext - web based ERP (http://erpnext.com)
 # For license information, please see license.txt
 
+from unittest.mock import patch
 
 import frappe
 from frappe.tests.utils import FrappeTestCase
@@ -11,6 +12,7 @@ from frappe.tests.utils import FrappeTestCase
 from erpnext.stock.doctype.delivery_note.test_delivery_note import create_delivery_note
 from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.purchase_receipt.test_purchase_receipt import make_purchase_receipt
+from erpnext.stock.doctype.serial_no import serial_no as serial_no_module
 from erpnext.stock.doctype.serial_no.serial_no import *
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
@@ -226,6 +228,55 @@ class TestSerialNo(FrappeTestCase):
 		for serial_no in get_serial_nos(pr_2.get("items")[0].serial_no):
 			self.assertNotEqual(serial_no, "XYZ005")
 
+	def test_serial_nos_numbered_from_reserved_block(self):
+		"Auto created Serial Nos are numbered from one reservation of the series, skipping existing ones"
+		item_code = make_item(
+			"_Test Block Serial Item", {"has_serial_no": 1, "serial_no_series": "TBLK-.####"}
+		).item_code
+		frappe.db.sql("delete from tabSeries where name = %s", "TBLK-")
+		make_purchase_receipt(item_code=item_code, qty=1, serial_no="TBLK-0003")
+
+		serial_nos = get_serial_nos(get_auto_serial_nos("TBLK-.####", 4))
+
+		self.assertEqual(serial_nos, ["TBLK-0001", "TBLK-0002", "TBLK-0004", "TBLK-0005"])
+		self.assertEqual(frappe.db.sql("SELECT current from tabSeries where name = %s", "TBLK-")[0][0], 5)
+
+	def test_bulk_update_of_serial_nos(self):
+		"Serial nos of a voucher updated in bulk get the same values as when saved one at a time"
+		item_code = make_item(
+			"_Test Bulk Serial Item", {"has_serial_no": 1, "serial_no_series": "TBSI-.####"}
+		).item_code
+		warehouse = "_Test Warehouse - _TC"
+		fields = [
+			"status",
+			"warehouse",
+			"company",
+			"purchase_document_type",
+			"purchase_rate",
+			"delivery_document_type",
+			"maintenance_status",
+			"item_name",
+		]
+
+		results = []
+		for min_serial_nos in (1, 1000):
+			receipt = make_stock_entry(item_code=item_code, to_warehouse=warehouse, qty=3, rate=100)
+			serial_nos = get_serial_nos(receipt.items[0].serial_no)
+
+			with patch.object(serial_no_module, "BULK_UPDATE_MIN_SERIAL_NOS", min_serial_nos):
+				issue = make_stock_entry(
+					item_code=item_code, from_warehouse=warehouse, qty=3, serial_no="\n".join(serial_nos)
+				)
+
+			for serial_no in serial_nos:
+				delivery_document_no = frappe.db.get_value("Serial No", serial_no, "delivery_document_no")
+				self.assertEqual(delivery_document_no, issue.name)
+
+			results.append([frappe.db.get_value("Serial No", sn, fields, as_dict=True) for sn in serial_nos])
+
+		self.assertEqual(results[0], results[1])
+		self.assertEqual(results[0][0].status, "Delivered")
+
 	def test_serial_no_sanitation(self):
 		"Test if Serial No input is sanitised before entering the DB."
 		item_code = "_Test Serialized Item"
@@ -0,0 +1,148 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and contributors
+# For license information, please see license.txt
+
+import json
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_days, flt, getdate, now, today
+from frappe.utils.nestedset import get_descendants_of
+
+
+class StockAgeingSlot(Document):
+	pass
+
+
+def update_stock_ageing_slots(upto_date=None):
+	"""Scheduled daily, advances the FIFO slots of every company up to yesterday.
+
+	Only the stock ledger entries posted since the previous run (and the entries of the items
+	with back-dated changes) are replayed, see `FIFOSlots`.
+	"""
+	upto_date = getdate(upto_date or add_days(today(), -1))
+
+	for company in frappe.get_all("Company", pluck="name"):
+		try:
+			update_stock_ageing_slots_for_company(company, upto_date)
+		except Exception:
+			frappe.db.rollback()
+			frappe.log_error(title=f"Stock Ageing Slots Update Failed for {company}")
+		else:
+			frappe.db.commit()
+
+
+def update_stock_ageing_slots_for_company(company, upto_date):
+	from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots
+
+	upto_date = getdate(upto_date)
+	last_slots = get_latest_stock_ageing_slots(company)
+	if last_slots and getdate(last_slots.upto_date) >= upto_date:
+		return
+
+	# entries modified after this are checked on the next run
+	processed_on = now()
+
+	item_details = FIFOSlots(
+		frappe._dict({"company": company, "to_date": upto_date, "show_warehouse_wise_stock": 1})
+	).generate()
+
+	frappe.db.delete("Stock Ageing Slot", {"company": company})
+
+	values = []
+	for (item_code, warehouse), row in item_details.items():
+		values.append(
+			(
+				frappe.generate_hash(length=10),
+				processed_on,
+				processed_on,
+				frappe.session.user,
+				frappe.session.user,
+				company,
+				item_code,
+				warehouse,
+				upto_date,
+				processed_on,
+				flt(row.get("qty_after_transaction")),
+				flt(row.get("total_qty")),
+				json.dumps(row["fifo_queue"], default=str),
+			)
+		)
+
+	fields = [
+		"name",
+		"creation",
+		"modified",
+		"owner",
+		"modified_by",
+		"company",
+		"item_code",
+		"warehouse",
+		"upto_date",
+		"processed_on",
+		"qty_after_transaction",
+		"total_qty",
+		"fifo_queue",
+	]
+
+	frappe.db.bulk_insert("Stock Ageing Slot", fields=fields, values=values)
+
+
+def get_latest_stock_ageing_slots(company):
+	"Date up to which the FIFO slots of the company are prepared, all the slots are advanced together"
+	if not company:
+		return
+
+	return frappe.db.get_value(
+		"Stock Ageing Slot", {"company": company}, ["upto_date", "processed_on"], as_dict=True
+	)
+
+
+def get_items_to_rebuild(company, upto_date, processed_on):
+	"""Items with entries posted on or before `upto_date` that were created or cancelled after the
+	slots were processed, the slots of these items are to be rebuilt from the first entry."""
+	sle = frappe.qb.DocType("Stock Ledger Entry")
+
+	return (
+		frappe.qb.from_(sle)
+		.select(sle.item_code)
+		.distinct()
+		.where(
+			(sle.company == company) & (sle.modified > processed_on) & (sle.posting_date <= upto_date)
+		)
+	).run(pluck=True)
+
+
+def get_stock_ageing_slots_data(company, filters=None):
+	"Slots of the company, limited to the item and warehouse filters of a report"
+	filters = filters or {}
+	slot_filters = {"company": company}
+
+	if filters.get("item_code"):
+		slot_filters["item_code"] = filters.get("item_code")
+
+	warehouse_filters = {}
+	if filters.get("warehouse"):
+		warehouse = filters.get("warehouse")
+		warehouse_filters["name"] = (
+			"in",
+			[*get_descendants_of("Warehouse", warehouse, ignore_permissions=True), warehouse],
+		)
+	if filters.get("warehouse_type"):
+		warehouse_filters["warehouse_type"] = filters.get("warehouse_type")
+
+	if warehouse_filters:
+		slot_filters["warehouse"] = (
+			"in",
+			frappe.get_all("Warehouse", filters=warehouse_filters, pluck="name") or [""],
+		)
+
+	rows = frappe.get_all(
+		"Stock Ageing Slot",
+		filters=slot_filters,
+		fields=["item_code", "warehouse", "qty_after_transaction", "total_qty", "fifo_queue"],
+	)
+
+	for row in rows:
+		row.fifo_queue = json.loads(row.fifo_queue or "[]")
+
+	return rows
@@ -0,0 +1,53 @@
+# Copyright (c) 2026, Frappe Technologies Pvt. Ltd. and Contributors
+# See license.txt
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+from frappe.utils import add_days, today
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.stock_ageing_slot.stock_ageing_slot import (
+	update_stock_ageing_slots_for_company,
+)
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots
+
+
+class TestStockAgeingSlot(FrappeTestCase):
+	def test_incremental_fifo_slots(self):
+		"Slots advanced from the stored queue match the slots replayed from the first entry"
+		item_code = make_item("_Test Stock Ageing Slot Item", {"is_stock_item": 1}).name
+		warehouse = "_Test Warehouse - _TC"
+		company = "_Test Company"
+
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=10, rate=100, posting_date=add_days(today(), -10)
+		)
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=5, rate=100, posting_date=add_days(today(), -6)
+		)
+		update_stock_ageing_slots_for_company(company, add_days(today(), -4))
+		self.assertTrue(
+			frappe.db.exists("Stock Ageing Slot", {"item_code": item_code, "warehouse": warehouse})
+		)
+
+		make_stock_entry(item_code=item_code, source=warehouse, qty=3, posting_date=add_days(today(), -2))
+		self.assertEqual(self.get_slots(item_code), self.get_slots(item_code, ignore_closing_balance=1))
+
+		# back-dated entry before the slots, the item is replayed from the first entry
+		make_stock_entry(
+			item_code=item_code, target=warehouse, qty=2, rate=100, posting_date=add_days(today(), -8)
+		)
+		slots = self.get_slots(item_code)
+		self.assertEqual(slots, self.get_slots(item_code, ignore_closing_balance=1))
+		self.assertEqual(slots["total_qty"], 14)
+
+	def get_slots(self, item_code, **filters):
+		filters = frappe._dict(company="_Test Company", to_date=today(), item_code=item_code, **filters)
+		slots = FIFOSlots(filters).generate()[item_code]
+
+		return {
+			"fifo_queue": slots["fifo_queue"],
+			"qty_after_transaction": slots["qty_after_transaction"],
+			"total_qty": slots["total_qty"],
+		}
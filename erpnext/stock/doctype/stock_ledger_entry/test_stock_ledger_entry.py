@@ -1325,6 +1325,38 @@ class TestStockLedgerEntry(FrappeTestCase, StockTestMixin):
 			item_code=item_code, source=warehouse, qty=470.84, rate=100, posting_date=add_days(today(), -1)
 		)
 
+	def test_batched_reposting(self):
+		"""Batched reposting should produce the same ledger as row-at-a-time reposting."""
+
+		def _day(days):
+			return add_to_date(date=today(), days=days)
+
+		def make_ledger(item):
+			for i in range(1, 6):
+				make_stock_entry(item_code=item, target=warehouse, qty=10, rate=10 * i, posting_date=_day(i))
+				make_stock_entry(item_code=item, source=warehouse, qty=5, posting_date=_day(i))
+
+			# backdated receipt reposts all the entries above
+			make_stock_entry(item_code=item, target=warehouse, qty=7, rate=3, posting_date=_day(0))
+
+			return frappe.get_all(
+				"Stock Ledger Entry",
+				fields=["qty_after_transaction", "valuation_rate", "stock_value", "stock_queue"],
+				filters={"item_code": item, "warehouse": warehouse, "is_cancelled": 0},
+				order_by="posting_datetime, creation",
+				as_list=True,
+			)
+
+		warehouse = "_Test Warehouse - _TC"
+		expected_ledger = make_ledger(make_item().name)
+
+		settings = frappe.get_single("Stock Reposting Settings")
+		settings.batched_reposting = 1
+		settings.reposting_batch_size = 3
+		settings.save()
+
+		self.assertEqual(make_ledger(make_item().name), expected_ledger)
+
 
 def create_repack_entry(**args):
 	args = frappe._dict(args)
@@ -3,6 +3,7 @@
 
 
 import json
+from contextlib import contextmanager
 
 import frappe
 from frappe import _, throw
@@ -62,7 +63,7 @@ def get_item_details(args, doc=None, for_validate=False, overwrite_warehouse=Tru
 	args = process_args(args)
 	for_validate = process_string_args(for_validate)
 	overwrite_warehouse = process_string_args(overwrite_warehouse)
-	item = frappe.get_cached_doc("Item", args.item_code)
+	item = get_item(args.item_code)
 	validate_item_details(args, item)
 
 	if isinstance(doc, str):
@@ -116,7 +117,7 @@ def get_item_details(args, doc=None, for_validate=False, overwrite_warehouse=Tru
 			args[key] = value
 
 	if args.get("update_stock"):
-		if frappe.get_cached_value("Item", args.get("item_code"), "has_batch_no") and not args.batch_no:
+		if get_item(args.get("item_code")).has_batch_no and not args.batch_no:
 			batch_results = get_batch_no(args.get("item_code"), args.get("warehouse"), args.get("qty"), cur_batch_no=args.get(args.batch_no), return_error=False, return_shortdated=True)
 			if batch_results:
 				args.batch_no, args.shortdated_batch = batch_results
@@ -143,6 +144,168 @@ def get_item_details(args, doc=None, for_validate=False, overwrite_warehouse=Tru
 	return out
 
 
+@frappe.whitelist()
+def get_items_details_bulk(args_list, doc=None, for_validate=False, overwrite_warehouse=True):
+	"""Get item details for all the rows of a document at once.
+
+	Returns the output of `get_item_details` for each row, in the order of `args_list`.
+	Item, Item Default, Item Price, Bin and UOM Conversion data of all the rows is loaded
+	with a few set based queries instead of per row lookups.
+	"""
+	args_list = [process_args(args) for args in process_string_args(args_list)]
+
+	if isinstance(doc, str):
+		doc = json.loads(doc)
+
+	with prefetch_item_details(args_list):
+		return [
+			get_item_details(args, doc, for_validate=for_validate, overwrite_warehouse=overwrite_warehouse)
+			for args in args_list
+		]
+
+
+@contextmanager
+def prefetch_item_details(args_list):
+	"""Preload the data `get_item_details` needs for all the rows in `args_list`"""
+	if frappe.flags.item_details_prefetch is not None:
+		# already preloaded by the caller
+		yield
+		return
+
+	frappe.flags.item_details_prefetch = get_item_details_prefetch(args_list)
+	try:
+		yield
+	finally:
+		frappe.flags.item_details_prefetch = None
+
+
+def get_item_details_prefetch(args_list):
+	"""
+	:Data Structure:
+
+	{
+	        "items": {item_code: Item},
+	        "item_prices": {(item_code, price_list): [Item Price rows]},
+	        "packing_units": {item_price: packing_unit},
+	        "bins": {item_code: {warehouse: Bin row}},
+	        "conversion_factors": {item_code: {uom: conversion_factor}},
+	        "child_warehouses": {warehouse: [child warehouses]},
+	}
+	"""
+	prefetch = frappe._dict(
+		{
+			"items": {},
+			"item_prices": {},
+			"packing_units": {},
+			"bins": {},
+			"conversion_factors": {},
+			"child_warehouses": {},
+		}
+	)
+
+	item_codes = list({args.get("item_code") for args in args_list if args.get("item_code")})
+	if not item_codes:
+		return prefetch
+
+	prefetch.items = get_items(item_codes)
+	item_codes = [item_code for item_code in item_codes if item_code in prefetch.items]
+	templates = list({prefetch.items[item_code].variant_of for item_code in item_codes} - {None, ""})
+	prefetch.items.update(get_items(templates))
+
+	for item_code in item_codes + templates:
+		prefetch.conversion_factors[item_code] = {
+			d.uom: d.conversion_factor for d in prefetch.items[item_code].uoms
+		}
+
+	price_lists = list(
+		{
+			args.get("price_list") or args.get("selling_price_list") or args.get("buying_price_list")
+			for args in args_list
+		}
+		- {None, ""}
+	)
+
+	if price_lists:
+		for item_code in item_codes + templates:
+			for price_list in price_lists:
+				prefetch.item_prices[(item_code, price_list)] = []
+
+		for row in frappe.get_all(
+			"Item Price",
+			filters={"item_code": ("in", item_codes + templates), "price_list": ("in", price_lists)},
+			fields=[
+				"name",
+				"item_code",
+				"price_list",
+				"price_list_rate",
+				"uom",
+				"batch_no",
+				"customer",
+				"supplier",
+				"valid_from",
+				"valid_upto",
+				"packing_unit",
+			],
+		):
+			prefetch.item_prices[(row.item_code, row.price_list)].append(row)
+			prefetch.packing_units[row.name] = row.packing_unit
+
+	for item_code in item_codes:
+		prefetch.bins[item_code] = {}
+
+	for row in frappe.get_all(
+		"Bin",
+		filters={"item_code": ("in", item_codes)},
+		fields=["item_code", "warehouse", "projected_qty", "actual_qty", "reserved_qty"],
+	):
+		prefetch.bins[row.item_code][row.warehouse] = row
+
+	return prefetch
+
+
+def get_prefetched_item_details(key):
+	"""Details preloaded under `key` by `prefetch_item_details`, an empty dict outside of it.
+
+	The preloaded dict is returned even when it is empty, the values memoized in it are kept."""
+	if frappe.flags.item_details_prefetch is None:
+		return {}
+
+	return frappe.flags.item_details_prefetch[key]
+
+
+def get_item(item_code):
+	"Item preloaded by `prefetch_item_details`, else from the document cache"
+	return get_prefetched_item_details("items").get(item_code) or frappe.get_cached_doc("Item", item_code)
+
+
+def get_items(item_codes):
+	"""Items with their child tables, loaded with one query per table"""
+	if not item_codes:
+		return {}
+
+	items = {
+		d.name: d
+		for d in frappe.get_all("Item", filters={"name": ("in", item_codes)}, fields=["*"])
+	}
+	if not items:
+		return {}
+
+	for df in frappe.get_meta("Item").get_table_fields():
+		for row in frappe.get_all(
+			df.options,
+			filters={"parent": ("in", list(items)), "parenttype": "Item", "parentfield": df.fieldname},
+			fields=["*"],
+			order_by="idx asc",
+		):
+			row.doctype = df.options
+			items[row.parent].setdefault(df.fieldname, []).append(row)
+
+	for item in items.values():
+		item.doctype = "Item"
+
+	return {item_code: frappe.get_doc(item) for item_code, item in items.items()}
+
+
 def remove_standard_fields(details):
 	for key in child_table_fields + default_fields:
 		details.pop(key, None)
@@ -496,7 +659,7 @@ def get_basic_details(args, item, overwrite_warehouse=True):
 			out["manufacturer_part_no"] = None
 			out["manufacturer"] = None
 	else:
-		data = frappe.get_value(
+		data = frappe.get_cached_value(
 			"Item", item.name, ["default_item_manufacturer", "default_manufacturer_part_no"], as_dict=1
 		)
 
@@ -618,7 +781,7 @@ def get_item_tax_info(company, tax_category, item_codes, item_rates=None, item_t
 			continue
 
 		out[item_code[1]] = {}
-		item = frappe.get_cached_doc("Item", item_code[0])
+		item = get_item(item_code[0])
 		args = {
 			"company": company,
 			"tax_category": tax_category,
@@ -734,7 +897,7 @@ def get_item_tax_map(company, item_tax_template, as_json=True):
 def calculate_service_end_date(args, item=None):
 	args = process_args(args)
 	if not item:
-		item = frappe.get_cached_doc("Item", args.item_code)
+		item = get_item(args.item_code)
 
 	doctype = args.get("parenttype") or args.get("doctype")
 	if doctype == "Sales Invoice":
@@ -933,6 +1096,9 @@ def insert_item_price(args):
 				["name", "price_list_rate"],
 				as_dict=1,
 			)
+			# prices changed below, don't serve this item's prices from the preloaded rows anymore
+			get_prefetched_item_details("item_prices").pop((args.item_code, args.price_list), None)
+
 			if item_price and item_price.name:
 				if item_price.price_list_rate != price_list_rate and frappe.db.get_single_value(
 					"Stock Settings", "update_existing_price_list_rate"
@@ -971,6 +1137,10 @@ def get_item_price(args, item_code, ignore_party=False):
 	:param item_code: str, Item Doctype field item_code
 	"""
 
+	item_prices = get_prefetched_item_details("item_prices").get((item_code, args.get("price_list")))
+	if item_prices is not None:
+		return filter_item_prices(item_prices, args, ignore_party)
+
 	ip = frappe.qb.DocType("Item Price")
 	query = (
 		frappe.qb.from_(ip)
@@ -1003,6 +1173,45 @@ def get_item_price(args, item_code, ignore_party=False):
 	return query.run()
 
 
+def filter_item_prices(item_prices, args, ignore_party=False):
+	"""Apply the conditions and sort order of `get_item_price` on preloaded Item Price rows"""
+	transaction_date = getdate(args["transaction_date"]) if args.get("transaction_date") else None
+
+	def is_applicable(row):
+		if cstr(row.uom) not in ("", args.get("uom")) or cstr(row.batch_no) not in ("", args.get("batch_no")):
+			return False
+
+		if not ignore_party:
+			if args.get("customer"):
+				if row.customer != args.get("customer"):
+					return False
+			elif args.get("supplier"):
+				if row.supplier != args.get("supplier"):
+					return False
+			elif row.customer or row.supplier:
+				return False
+
+		if transaction_date:
+			return (
+				getdate(row.valid_from or "2000-01-01")
+				<= transaction_date
+				<= getdate(row.valid_upto or "2500-12-31")
+			)
+
+		return True
+
+	item_prices = [row for row in item_prices if is_applicable(row)]
+
+	# valid_from desc, ifnull(batch_no, '') desc, uom desc; nulls sort last like in the database
+	item_prices.sort(key=lambda row: (row.uom is not None, cstr(row.uom)), reverse=True)
+	item_prices.sort(key=lambda row: cstr(row.batch_no), reverse=True)
+	item_prices.sort(
+		key=lambda row: (row.valid_from is not None, getdate(row.valid_from or "2000-01-01")), reverse=True
+	)
+
+	return [(row.name, row.price_list_rate, row.uom) for row in item_prices]
+
+
 def get_price_list_rate_for(args, item_code):
 	"""
 	:param customer: link to Customer DocType
@@ -1064,9 +1273,14 @@ def check_packing_list(price_list_rate_name, desired_qty, item_code):
 	"""
 
 	flag = True
-	item_price = frappe.get_doc("Item Price", price_list_rate_name)
-	if item_price.packing_unit:
-		packing_increment = desired_qty % item_price.packing_unit
+	packing_units = get_prefetched_item_details("packing_units")
+	if price_list_rate_name in packing_units:
+		packing_unit = packing_units[price_list_rate_name]
+	else:
+		packing_unit = frappe.db.get_value("Item Price", price_list_rate_name, "packing_unit")
+
+	if packing_unit:
+		packing_increment = desired_qty % packing_unit
 
 		if packing_increment != 0:
 			flag = False
@@ -1226,11 +1440,18 @@ def get_serial_nos_by_fifo(args, sales_order=None):
 @frappe.whitelist()
 def get_conversion_factor(item_code, uom):
 	variant_of = frappe.db.get_value("Item", item_code, "variant_of", cache=True)
-	filters = {"parent": item_code, "uom": uom}
+	conversion_factors = get_prefetched_item_details("conversion_factors")
 
-	if variant_of:
-		filters["parent"] = ("in", (item_code, variant_of))
-	conversion_factor = frappe.db.get_value("UOM Conversion Detail", filters, "conversion_factor")
+	if item_code in conversion_factors:
+		conversion_factor = conversion_factors[item_code].get(uom)
+		if not conversion_factor and variant_of:
+			conversion_factor = conversion_factors.get(variant_of, {}).get(uom)
+	else:
+		filters = {"parent": item_code, "uom": uom}
+
+		if variant_of:
+			filters["parent"] = ("in", (item_code, variant_of))
+		conversion_factor = frappe.db.get_value("UOM Conversion Detail", filters, "conversion_factor")
 	if not conversion_factor:
 		stock_uom = frappe.db.get_value("Item", item_code, "stock_uom")
 		conversion_factor = get_uom_conv_factor(uom, stock_uom)
@@ -1256,18 +1477,31 @@ def get_bin_details(item_code, warehouse, company=None, include_child_warehouses
 
 		from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
 
-		warehouses = get_child_warehouses(warehouse) if include_child_warehouses else [warehouse]
+		if include_child_warehouses:
+			child_warehouses = get_prefetched_item_details("child_warehouses")
+			if warehouse not in child_warehouses:
+				child_warehouses[warehouse] = get_child_warehouses(warehouse)
+			warehouses = child_warehouses[warehouse]
+		else:
+			warehouses = [warehouse]
 
-		bin = frappe.qb.DocType("Bin")
-		bin_details = (
-			frappe.qb.from_(bin)
-			.select(
-				Coalesce(Sum(bin.projected_qty), 0).as_("projected_qty"),
-				Coalesce(Sum(bin.actual_qty), 0).as_("actual_qty"),
-				Coalesce(Sum(bin.reserved_qty), 0).as_("reserved_qty"),
-			)
-			.where((bin.item_code == item_code) & (bin.warehouse.isin(warehouses)))
-		).run(as_dict=True)[0]
+		bins = get_prefetched_item_details("bins").get(item_code)
+		if bins is not None:
+			bin_details = {
+				fieldname: sum(flt(bins[d][fieldname]) for d in warehouses if d in bins)
+				for fieldname in bin_details
+			}
+		else:
+			bin = frappe.qb.DocType("Bin")
+			bin_details = (
+				frappe.qb.from_(bin)
+				.select(
+					Coalesce(Sum(bin.projected_qty), 0).as_("projected_qty"),
+					Coalesce(Sum(bin.actual_qty), 0).as_("actual_qty"),
+					Coalesce(Sum(bin.reserved_qty), 0).as_("reserved_qty"),
+				)
+				.where((bin.item_code == item_code) & (bin.warehouse.isin(warehouses)))
+			).run(as_dict=True)[0]
 
 	if company:
 		bin_details["company_total_stock"] = get_company_total_stock(item_code, company)
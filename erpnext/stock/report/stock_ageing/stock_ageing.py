@@ -6,9 +6,18 @@ from operator import itemgetter
 
 import frappe
 from frappe import _
-from frappe.utils import cint, date_diff, flt
+from frappe.utils import add_days, cint, date_diff, flt, getdate
 
+from erpnext.stock.doctype.closing_stock_balance.closing_stock_balance import (
+	get_closing_stock_balance_data,
+	get_latest_closing_stock_balance,
+)
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+from erpnext.stock.doctype.stock_ageing_slot.stock_ageing_slot import (
+	get_items_to_rebuild,
+	get_latest_stock_ageing_slots,
+	get_stock_ageing_slots_data,
+)
 
 Filters = frappe._dict
 
@@ -216,6 +225,8 @@ class FIFOSlots:
 		self.serial_no_batch_purchase_details = {}
 		self.filters = filters
 		self.sle = sle
+		self.start_from = None
+		self.items_to_rebuild = set()
 
 	def generate(self) -> dict:
 		"""
@@ -228,6 +239,8 @@ class FIFOSlots:
 		}
 		"""
 		stock_ledger_entries = self.sle
+		if stock_ledger_entries is None:
+			self.__set_opening_balances()
 
 		_system_settings = frappe.get_cached_doc("System Settings")
 		with frappe.db.unbuffered_cursor():
@@ -259,6 +272,81 @@ class FIFOSlots:
 
 		return self.item_details
 
+	def __set_opening_balances(self):
+		"""Start the FIFO Queues from the latest Stock Ageing Slots or Closing Stock Balance,
+		only the entries after them are read."""
+		if self.filters.get("ignore_closing_balance") or not self.filters.get("to_date"):
+			return
+
+		company = self.filters.get("company")
+		to_date = getdate(self.filters.get("to_date"))
+
+		# only the filters applied on the stock ledger entries below
+		filters = {"item_code": self.filters.get("item_code"), "brand": self.filters.get("brand")}
+		if self.filters.get("warehouse"):
+			filters["warehouse"] = self.filters.get("warehouse")
+		else:
+			filters["warehouse_type"] = self.filters.get("warehouse_type")
+
+		closing_balance = get_latest_closing_stock_balance(company, to_date, filters)
+		slots = get_latest_stock_ageing_slots(company)
+		if slots and getdate(slots.upto_date) > to_date:
+			slots = None
+
+		if slots and not (closing_balance and getdate(closing_balance.to_date) > getdate(slots.upto_date)):
+			# back-dated entries after the slots were processed, replay these items from the first entry
+			self.items_to_rebuild = set(get_items_to_rebuild(company, slots.upto_date, slots.processed_on))
+			rows = get_stock_ageing_slots_data(company, filters)
+			self.start_from = add_days(slots.upto_date, 1)
+		elif closing_balance:
+			rows = [
+				frappe._dict(row, qty_after_transaction=row.bal_qty, total_qty=row.bal_qty)
+				for row in get_closing_stock_balance_data(closing_balance.name, filters)
+			]
+			self.start_from = add_days(closing_balance.to_date, 1)
+		else:
+			return
+
+		self.__set_opening_rows(rows)
+
+	def __set_opening_rows(self, rows: list[dict]):
+		if not rows:
+			return
+
+		item_table = frappe.qb.DocType("Item")
+		items = {
+			d.name: d
+			for d in self.__get_item_query()
+			.where(item_table.name.isin(list({row.item_code for row in rows})))
+			.run(as_dict=True)
+		}
+
+		for row in rows:
+			item = items.get(row.item_code)
+			if not item or row.item_code in self.items_to_rebuild:
+				continue
+
+			key = (row.item_code, row.warehouse)
+			if key in self.item_details:
+				# items or warehouses merged since, replay from the first entry
+				self.items_to_rebuild.add(row.item_code)
+				continue
+
+			self.item_details[key] = {
+				"details": frappe._dict(item, warehouse=row.warehouse),
+				"fifo_queue": [[slot[0], getdate(slot[1])] for slot in row.get("fifo_queue") or []],
+				"qty_after_transaction": flt(row.qty_after_transaction),
+				"total_qty": flt(row.total_qty),
+				"has_serial_no": item.has_serial_no,
+			}
+
+		for key in list(self.item_details):
+			if key[0] in self.items_to_rebuild:
+				del self.item_details[key]
+			elif self.item_details[key]["has_serial_no"]:
+				for slot in self.item_details[key]["fifo_queue"]:
+					self.serial_no_batch_purchase_details.setdefault(slot[0], slot[1])
+
 	def __init_key_stores(self, row: dict) -> tuple:
 		"Initialise keys and FIFO Queue."
 
@@ -416,6 +504,13 @@ class FIFOSlots:
 			)
 		)
 
+		if self.start_from:
+			condition = sle.posting_date >= self.start_from
+			if self.items_to_rebuild:
+				condition |= sle.item_code.isin(list(self.items_to_rebuild))
+
+			sle_query = sle_query.where(condition)
+
 		if self.filters.get("warehouse"):
 			sle_query = self.__get_warehouse_conditions(sle, sle_query)
 		elif self.filters.get("warehouse_type"):
@@ -7,12 +7,15 @@ from typing import Any, TypedDict
 
 import frappe
 from frappe import _
-from frappe.query_builder import Order
 from frappe.query_builder.functions import Coalesce
 from frappe.utils import add_days, cint, date_diff, flt, getdate
 from frappe.utils.nestedset import get_descendants_of
 
 import erpnext
+from erpnext.stock.doctype.closing_stock_balance.closing_stock_balance import (
+	get_closing_stock_balance_data,
+	get_latest_closing_stock_balance,
+)
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.doctype.warehouse.warehouse import apply_warehouse_filter
 from erpnext.stock.report.stock_ageing.stock_ageing import FIFOSlots, get_average_age
@@ -80,11 +83,8 @@ class StockBalanceReport:
 			return
 
 		self.start_from = add_days(closing_balance[0].to_date, 1)
-		res = frappe.get_doc("Closing Stock Balance", closing_balance[0].name).get_prepared_data()
-
-		for entry in res.data:
-			entry = frappe._dict(entry)
 
+		for entry in get_closing_stock_balance_data(closing_balance[0].name, self.filters):
 			group_by_key = self.get_group_by_key(entry)
 			if group_by_key not in self.opening_data:
 				self.opening_data.setdefault(group_by_key, entry)
@@ -238,26 +238,16 @@ class StockBalanceReport:
 		if self.filters.get("ignore_closing_balance"):
 			return []
 
-		table = frappe.qb.DocType("Closing Stock Balance")
+		# closing balances are not prepared dimension wise
+		if self.filters.get("show_dimension_wise_stock") or any(
+			self.filters.get(fieldname) for fieldname in self.inventory_dimensions
+		):
+			return []
 
-		query = (
-			frappe.qb.from_(table)
-			.select(table.name, table.to_date)
-			.where(
-				(table.docstatus == 1)
-				& (table.company == self.filters.company)
-				& (table.to_date <= self.from_date)
-				& (table.status == "Completed")
-			)
-			.orderby(table.to_date, order=Order.desc)
-			.limit(1)
+		closing_balance = get_latest_closing_stock_balance(
+			self.filters.get("company"), self.from_date, self.filters
 		)
-
-		for fieldname in ["warehouse", "item_code", "item_group", "warehouse_type"]:
-			if self.filters.get(fieldname):
-				query = query.where(table[fieldname] == self.filters.get(fieldname))
-
-		return query.run(as_dict=True)
+		return [closing_balance] if closing_balance else []
 
 	def prepare_stock_ledger_entries(self):
 		sle = frappe.qb.DocType("Stock Ledger Entry")
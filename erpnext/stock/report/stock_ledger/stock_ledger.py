@@ -5,7 +5,7 @@
 import frappe
 from frappe import _
 from frappe.query_builder.functions import CombineDatetime
-from frappe.utils import cint, flt
+from frappe.utils import add_days, cint, flt
 
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
@@ -401,14 +401,17 @@ def get_opening_balance(filters, columns, sl_entries):
 
 	from erpnext.stock.stock_ledger import get_previous_sle
 
-	last_entry = get_previous_sle(
-		{
-			"item_code": filters.item_code,
-			"warehouse_condition": get_warehouse_condition(filters.warehouse),
-			"posting_date": filters.from_date,
-			"posting_time": "00:00:00",
-		}
-	)
+	if frappe.get_cached_value("Warehouse", filters.warehouse, "is_group"):
+		last_entry = get_opening_balance_for_group_warehouse(filters)
+	else:
+		last_entry = get_previous_sle(
+			{
+				"item_code": filters.item_code,
+				"warehouse_condition": get_warehouse_condition(filters.warehouse),
+				"posting_date": filters.from_date,
+				"posting_time": "00:00:00",
+			}
+		)
 
 	# check if any SLEs are actually Opening Stock Reconciliation
 	for sle in list(sl_entries):
@@ -430,6 +433,36 @@ def get_opening_balance(filters, columns, sl_entries):
 	return row
 
 
+def get_opening_balance_for_group_warehouse(filters):
+	"""Sum of the balances of all the warehouses under the group warehouse.
+
+	The Stock Balance report starts from the latest Closing Stock Balance, so only the
+	entries after it are read.
+	"""
+	from erpnext.stock.report.stock_balance.stock_balance import execute as get_stock_balance
+
+	_columns, data = get_stock_balance(
+		frappe._dict(
+			{
+				"company": filters.company,
+				"from_date": filters.from_date,
+				"to_date": add_days(filters.from_date, -1),
+				"item_code": filters.item_code,
+				"warehouse": filters.warehouse,
+			}
+		)
+	)
+
+	qty_after_transaction = sum(flt(row.bal_qty) for row in data)
+	stock_value = sum(flt(row.bal_val) for row in data)
+
+	return {
+		"qty_after_transaction": qty_after_transaction,
+		"stock_value": stock_value,
+		"valuation_rate": flt(stock_value / qty_after_transaction) if qty_after_transaction else 0,
+	}
+
+
 def get_warehouse_condition(warehouse):
 	warehouse_details = frappe.db.get_value("Warehouse", warehouse, ["lft", "rgt"], as_dict=1)
 	if warehouse_details:
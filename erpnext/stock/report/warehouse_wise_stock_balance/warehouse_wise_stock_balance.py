@@ -6,6 +6,12 @@ from typing import Any, TypedDict
 import frappe
 from frappe import _
 from frappe.query_builder.functions import Sum
+from frappe.utils import add_days, flt, today
+
+from erpnext.stock.doctype.closing_stock_balance.closing_stock_balance import (
+	get_closing_stock_balance_data,
+	get_latest_closing_stock_balance,
+)
 
 
 class StockBalanceFilter(TypedDict):
@@ -35,11 +41,22 @@ def get_warehouse_wise_balance(filters: StockBalanceFilter) -> list[SLEntry]:
 		.groupby(sle.warehouse)
 	)
 
-	if filters.get("company"):
-		query = query.where(sle.company == filters.get("company"))
+	warehouse_balance = frappe._dict()
+	if company := filters.get("company"):
+		query = query.where(sle.company == company)
+
+		# start from the latest closing balance and only sum the entries after it
+		if closing_balance := get_latest_closing_stock_balance(company, add_days(today(), 1)):
+			query = query.where(sle.posting_date > closing_balance.to_date)
+			for row in get_closing_stock_balance_data(closing_balance.name):
+				warehouse_balance.setdefault(row.warehouse, 0.0)
+				warehouse_balance[row.warehouse] += flt(row.bal_val)
+
+	for warehouse, stock_balance in query.run(as_list=True):
+		warehouse_balance.setdefault(warehouse, 0.0)
+		warehouse_balance[warehouse] += flt(stock_balance)
 
-	data = query.run(as_list=True)
-	return frappe._dict(data) if data else frappe._dict()
+	return warehouse_balance
 
 
 def get_warehouses(report_filters: StockBalanceFilter):
@@ -10,6 +10,7 @@ from frappe.query_builder.functions import Sum
 from frappe.utils import cint, cstr, flt, format_date, get_link_to_form, getdate, now, nowdate
 
 import erpnext
+from erpnext.stock.doctype.batch_bin.batch_bin import update_batch_bin_qty
 from erpnext.stock.doctype.bin.bin import update_qty as update_bin_qty
 from erpnext.stock.doctype.inventory_dimension.inventory_dimension import get_inventory_dimensions
 from erpnext.stock.utils import (
@@ -19,13 +20,33 @@ from erpnext.stock.utils import (
 	get_or_make_bin,
 	get_valuation_method,
 )
-from erpnext.stock.valuation import FIFOValuation, LIFOValuation, round_off_if_near_zero
+from erpnext.stock.valuation import (
+	CompactFIFOValuation,
+	LIFOValuation,
+	dump_stock_queue,
+	load_stock_queue,
+	round_off_if_near_zero,
+)
 
 
 class NegativeStockError(frappe.ValidationError):
 	pass
 
 
+# fields recomputed by `update_entries_after.process_sle`, written back in batched reposting
+REPOSTED_SLE_FIELDS = (
+	"actual_qty",
+	"serial_no",
+	"incoming_rate",
+	"outgoing_rate",
+	"qty_after_transaction",
+	"valuation_rate",
+	"stock_value",
+	"stock_value_difference",
+	"stock_queue",
+)
+
+
 def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_voucher=False):
 	"""Create SL entries from SL entry dicts
 
@@ -80,6 +101,9 @@ def make_sl_entries(sl_entries, allow_negative_stock=False, via_landed_cost_vouc
 				bin_name = get_or_make_bin(args.get("item_code"), args.get("warehouse"))
 				repost_current_voucher(args, allow_negative_stock, via_landed_cost_voucher)
 				update_bin_qty(bin_name, args)
+				update_batch_bin_qty(
+					sle.get("item_code"), sle.get("warehouse"), sle.get("batch_no"), sle.get("actual_qty")
+				)
 			else:
 				frappe.msgprint(
 					_("Item {0} ignored since it is not a stock item").format(args.get("item_code"))
@@ -354,6 +378,8 @@ class update_entries_after:
 		self.distinct_item_warehouses = args.get("distinct_item_warehouses", frappe._dict())
 		self.affected_transactions: set[tuple[str, str]] = set()
 
+		self.set_reposting_settings()
+
 		self.data = frappe._dict()
 		self.initialize_previous_data(self.args)
 		self.build()
@@ -364,6 +390,22 @@ class update_entries_after:
 			frappe.get_meta("Stock Ledger Entry").get_field("stock_value")
 		)
 
+	def set_reposting_settings(self):
+		settings = frappe.db.get_value(
+			"Stock Reposting Settings",
+			None,
+			["batched_reposting", "reposting_batch_size", "compress_stock_queue"],
+			as_dict=True,
+		)
+
+		self.compress_stock_queue = cint(settings.compress_stock_queue)
+
+		# In batched mode, reposted SLEs are buffered and written back with bulk updates,
+		# and the bin is updated once at the end instead of after every SLE.
+		self.batched_reposting = cint(settings.batched_reposting) and not self.args.get("sle_id")
+		self.reposting_batch_size = cint(settings.reposting_batch_size) or 1000
+		self.pending_sle_updates = {}
+
 	def initialize_previous_data(self, args):
 		"""
 		Get previous sl entries for current item for each related warehouse
@@ -395,7 +437,7 @@ class update_entries_after:
 		warehouse_dict.update(
 			{
 				"prev_stock_value": previous_sle.stock_value or 0.0,
-				"stock_queue": json.loads(previous_sle.stock_queue or "[]"),
+				"stock_queue": load_stock_queue(previous_sle.stock_queue),
 				"stock_value_difference": 0.0,
 			}
 		)
@@ -416,11 +458,16 @@ class update_entries_after:
 				i += 1
 
 				self.process_sle(sle)
-				self.update_bin_data(sle)
+				if not self.batched_reposting:
+					self.update_bin_data(sle)
 
 				if sle.dependant_sle_voucher_detail_no:
 					entries_to_fix = self.get_dependent_entries_to_fix(entries_to_fix, sle)
 
+			if self.batched_reposting and entries_to_fix:
+				self.flush_sle_updates()
+				self.update_bin_data(entries_to_fix[-1])
+
 		if self.exceptions:
 			self.raise_exceptions()
 
@@ -650,22 +697,49 @@ class update_entries_after:
 		sle.qty_after_transaction = self.wh_data.qty_after_transaction
 		sle.valuation_rate = self.wh_data.valuation_rate
 		sle.stock_value = self.wh_data.stock_value
-		sle.stock_queue = json.dumps(self.wh_data.stock_queue)
+		sle.stock_queue = dump_stock_queue(self.get_stock_queue_state(), compress=self.compress_stock_queue)
 
 		if not sle.is_adjustment_entry:
 			sle.stock_value_difference = stock_value_difference
 
-		sle.doctype = "Stock Ledger Entry"
-		frappe.get_doc(sle).db_update()
+		self.update_sle(sle)
 
 		if not self.args.get("sle_id"):
 			self.update_outgoing_rate_on_transaction(sle)
 
+	def update_sle(self, sle):
+		if not self.batched_reposting:
+			sle.doctype = "Stock Ledger Entry"
+			frappe.get_doc(sle).db_update()
+			return
+
+		self.pending_sle_updates[sle.name] = {field: sle.get(field) for field in REPOSTED_SLE_FIELDS}
+		if len(self.pending_sle_updates) >= self.reposting_batch_size:
+			self.flush_sle_updates()
+
+	def flush_sle_updates(self):
+		"""Write buffered SLE values to the database.
+
+		Called before anything that reads the ledger back (fallback rates, batch and serial
+		no rates, voucher recalculation) so that those reads see the reposted values."""
+		if not self.pending_sle_updates:
+			return
+
+		frappe.db.bulk_update(
+			"Stock Ledger Entry",
+			self.pending_sle_updates,
+			chunk_size=self.reposting_batch_size,
+			update_modified=False,
+		)
+		self.pending_sle_updates = {}
+
 	def reset_actual_qty_for_stock_reco(self, sle):
+		self.flush_sle_updates()
 		doc = frappe.get_cached_doc("Stock Reconciliation", sle.voucher_no)
 		doc.recalculate_current_qty(sle.voucher_detail_no, sle.creation, sle.actual_qty >= 0)
 
 		if sle.actual_qty < 0:
+			previous_actual_qty = flt(sle.actual_qty)
 			stock_reco_details = frappe.db.get_value(
 				"Stock Reconciliation Item",
 				sle.voucher_detail_no,
@@ -674,6 +748,9 @@ class update_entries_after:
 			)
 
 			sle.actual_qty = flt(stock_reco_details.current_qty) * -1
+			update_batch_bin_qty(
+				sle.item_code, sle.warehouse, sle.batch_no, sle.actual_qty - previous_actual_qty
+			)
 
 			if stock_reco_details.sn_no:
 				sle.serial_no = stock_reco_details.sn_no
@@ -739,6 +816,8 @@ class update_entries_after:
 				sle.outgoing_rate = rate
 
 	def get_incoming_outgoing_rate_from_transaction(self, sle):
+		self.flush_sle_updates()
+
 		rate = 0
 		# Material Transfer, Repack, Manufacturing
 		if sle.voucher_type == "Stock Entry":
@@ -847,6 +926,7 @@ class update_entries_after:
 			self.recalculate_amounts_in_stock_entry(sle.voucher_no)
 
 	def recalculate_amounts_in_stock_entry(self, voucher_no):
+		self.flush_sle_updates()
 		stock_entry = frappe.get_doc("Stock Entry", voucher_no, for_update=True)
 		stock_entry.calculate_rate_and_amount(reset_outgoing_rate=False, raise_error_if_no_rate=False)
 		stock_entry.db_update()
@@ -907,6 +987,7 @@ class update_entries_after:
 
 	def update_rate_on_stock_reconciliation(self, sle):
 		if not sle.serial_no and not sle.batch_no:
+			self.flush_sle_updates()
 			sr = frappe.get_doc("Stock Reconciliation", sle.voucher_no, for_update=True)
 
 			for item in sr.items:
@@ -976,6 +1057,8 @@ class update_entries_after:
 				self.wh_data.valuation_rate = self.get_fallback_rate(sle)
 
 	def get_incoming_value_for_serial_nos(self, sle, serial_nos):
+		self.flush_sle_updates()
+
 		# get rate from serial nos within same company
 		all_serial_nos = frappe.get_all(
 			"Serial No", fields=["purchase_rate", "name", "company"], filters={"name": ("in", serial_nos)}
@@ -1060,7 +1143,7 @@ class update_entries_after:
 		if self.valuation_method == "LIFO":
 			stock_queue = LIFOValuation(self.wh_data.stock_queue)
 		else:
-			stock_queue = FIFOValuation(self.wh_data.stock_queue)
+			stock_queue = self.get_fifo_queue()
 
 		_prev_qty, prev_stock_value = stock_queue.get_total_stock_and_value()
 
@@ -1085,17 +1168,42 @@ class update_entries_after:
 
 		stock_value_difference = stock_value - prev_stock_value
 
-		self.wh_data.stock_queue = stock_queue.state
+		if self.valuation_method == "LIFO":
+			self.wh_data.stock_queue = stock_queue.state
+			has_stock_bins = bool(self.wh_data.stock_queue)
+		else:
+			# compacted lazily by the queue, see `get_stock_queue_state`
+			self.wh_data.stock_queue = stock_queue.bins
+			has_stock_bins = bool(len(stock_queue))
 		self.wh_data.stock_value = round_off_if_near_zero(self.wh_data.stock_value + stock_value_difference)
 
-		if not self.wh_data.stock_queue:
-			self.wh_data.stock_queue.append(
+		if not has_stock_bins:
+			self.wh_data.stock_queue = [
 				[0, sle.incoming_rate or sle.outgoing_rate or self.wh_data.valuation_rate]
-			)
+			]
 
 		if self.wh_data.qty_after_transaction:
 			self.wh_data.valuation_rate = self.wh_data.stock_value / self.wh_data.qty_after_transaction
 
+	def get_fifo_queue(self) -> CompactFIFOValuation:
+		"""Reuse the FIFO queue built for the previous SLE of the warehouse,
+		unless the stock queue was replaced in between (e.g. by a stock reconciliation)."""
+		fifo_queue = self.wh_data.get("fifo_queue")
+		if fifo_queue is None or fifo_queue.bins is not self.wh_data.stock_queue:
+			fifo_queue = CompactFIFOValuation(self.wh_data.stock_queue)
+			self.wh_data.fifo_queue = fifo_queue
+
+		return fifo_queue
+
+	def get_stock_queue_state(self) -> list:
+		"""Stock queue of the warehouse to be saved with the SLE, without the bins consumed from
+		the head of its FIFO queue"""
+		fifo_queue = self.wh_data.get("fifo_queue")
+		if fifo_queue is not None and fifo_queue.bins is self.wh_data.stock_queue:
+			return fifo_queue.live_state
+
+		return self.wh_data.stock_queue
+
 	def update_batched_values(self, sle):
 		incoming_rate = flt(sle.incoming_rate)
 		actual_qty = flt(sle.actual_qty)
@@ -1107,6 +1215,7 @@ class update_entries_after:
 		if actual_qty > 0:
 			stock_value_difference = incoming_rate * actual_qty
 		else:
+			self.flush_sle_updates()
 			outgoing_rate = get_batch_incoming_rate(
 				item_code=sle.item_code,
 				warehouse=sle.warehouse,
@@ -1143,6 +1252,7 @@ class update_entries_after:
 	def get_fallback_rate(self, sle) -> float:
 		"""When exact incoming rate isn't available use any of other "average" rates as fallback.
 		This should only get used for negative stock."""
+		self.flush_sle_updates()
 		return get_valuation_rate(
 			sle.item_code,
 			sle.warehouse,
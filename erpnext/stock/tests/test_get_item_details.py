@@ -2,7 +2,7 @@ import frappe
 from frappe.test_runner import make_test_records
 from frappe.tests.utils import FrappeTestCase
 
-from erpnext.stock.get_item_details import get_item_details
+from erpnext.stock.get_item_details import get_item_details, get_items_details_bulk
 
 test_ignore = ["BOM"]
 test_dependencies = ["Customer", "Supplier", "Item", "Price List", "Item Price"]
@@ -34,3 +34,43 @@ class TestGetItemDetail(FrappeTestCase):
 		)
 		details = get_item_details(args)
 		self.assertEqual(details.get("price_list_rate"), 100)
+
+	def test_get_items_details_bulk(self):
+		base_args = {
+			"company": "_Test Company",
+			"conversion_rate": 1.0,
+			"price_list_currency": "USD",
+			"plc_conversion_rate": 1.0,
+			"doctype": "Purchase Order",
+			"name": None,
+			"supplier": "_Test Supplier",
+			"transaction_date": None,
+			"price_list": "_Test Buying Price List",
+			"is_subcontracted": 0,
+			"ignore_pricing_rule": 1,
+			"qty": 1,
+		}
+		args_list = [
+			dict(base_args, item_code="_Test Item"),
+			dict(base_args, item_code="_Test Item 2", qty=5),
+			dict(base_args, item_code="_Test Item"),
+		]
+
+		bulk_details = get_items_details_bulk(args_list)
+		self.assertEqual(len(bulk_details), len(args_list))
+		self.assertFalse(frappe.flags.item_details_prefetch)
+
+		for args, details in zip(args_list, bulk_details, strict=True):
+			expected = get_item_details(frappe._dict(args))
+			for fieldname in (
+				"item_code",
+				"price_list_rate",
+				"conversion_factor",
+				"stock_qty",
+				"warehouse",
+				"projected_qty",
+				"actual_qty",
+			):
+				self.assertEqual(details.get(fieldname), expected.get(fieldname), fieldname)
+
+		self.assertEqual(bulk_details[0].get("price_list_rate"), 100)
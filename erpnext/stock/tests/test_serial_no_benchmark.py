@@ -0,0 +1,52 @@
+from unittest.mock import patch
+
+import frappe
+from frappe.tests.utils import FrappeTestCase
+
+from erpnext.stock.doctype.item.test_item import make_item
+from erpnext.stock.doctype.serial_no import serial_no as serial_no_module
+from erpnext.stock.doctype.serial_no.serial_no import get_serial_nos
+from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
+from erpnext.tests.utils import benchmark
+
+SERIAL_NOS = 10_000
+WAREHOUSE = "_Test Warehouse - _TC"
+
+
+@benchmark
+class TestSerialNoBenchmark(FrappeTestCase):
+	"""Benchmark of issuing a voucher of 10k serial nos, updated in bulk and one at a time.
+
+	The serial nos are asserted to be delivered, with fewer queries in bulk."""
+
+	def tearDown(self):
+		frappe.db.rollback()
+
+	def issue_serial_nos(self, bulk):
+		item_code = make_item(
+			f"_Test Serial No Benchmark Item {int(bulk)}",
+			{"has_serial_no": 1, "serial_no_series": f"TSNB{int(bulk)}-.#####"},
+		).item_code
+		receipt = make_stock_entry(item_code=item_code, to_warehouse=WAREHOUSE, qty=SERIAL_NOS, rate=10)
+		serial_nos = get_serial_nos(receipt.items[0].serial_no)
+
+		with patch.object(
+			serial_no_module, "BULK_UPDATE_MIN_SERIAL_NOS", 1 if bulk else SERIAL_NOS + 1
+		), patch.object(frappe.db, "sql", wraps=frappe.db.sql) as sql:
+			make_stock_entry(
+				item_code=item_code, from_warehouse=WAREHOUSE, qty=SERIAL_NOS, serial_no="\n".join(serial_nos)
+			)
+
+		statuses = frappe.get_all(
+			"Serial No", filters={"item_code": item_code}, pluck="status", distinct=True
+		)
+
+		return sql.call_count, statuses
+
+	def test_compare_with_one_at_a_time(self):
+		loop_queries, loop_statuses = self.issue_serial_nos(bulk=False)
+		bulk_queries, bulk_statuses = self.issue_serial_nos(bulk=True)
+
+		self.assertEqual(loop_statuses, ["Delivered"])
+		self.assertEqual(bulk_statuses, ["Delivered"])
+		self.assertLess(bulk_queries, loop_queries)
@@ -1,9 +1,8 @@
-import json
-
 import frappe
 from frappe.tests.utils import FrappeTestCase
 
 from erpnext.stock.utils import scan_barcode
+from erpnext.stock.valuation import load_stock_queue
 
 
 class StockTestMixin:
@@ -32,7 +31,7 @@ class StockTestMixin:
 			for k, v in exp_sle.items():
 				act_value = act_sle[k]
 				if k == "stock_queue":
-					act_value = json.loads(act_value)
+					act_value = load_stock_queue(act_value)
 					if act_value and act_value[0][0] == 0:
 						# ignore empty fifo bins
 						continue
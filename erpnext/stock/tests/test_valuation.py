@@ -8,7 +8,14 @@ from hypothesis import strategies as st
 
 from erpnext.stock.doctype.item.test_item import make_item
 from erpnext.stock.doctype.stock_entry.stock_entry_utils import make_stock_entry
-from erpnext.stock.valuation import FIFOValuation, LIFOValuation, round_off_if_near_zero
+from erpnext.stock.valuation import (
+	CompactFIFOValuation,
+	FIFOValuation,
+	LIFOValuation,
+	dump_stock_queue,
+	load_stock_queue,
+	round_off_if_near_zero,
+)
 
 qty_gen = st.floats(min_value=-1e6, max_value=1e6)
 value_gen = st.floats(min_value=1, max_value=1e6)
@@ -195,6 +202,89 @@ class TestFIFOValuation(unittest.TestCase):
 			self.assertTotalValue(total_value)
 
 
+class TestCompactFIFOValuation(unittest.TestCase):
+	"""Compact queue should behave exactly like the list based FIFO queue."""
+
+	def assertSameQueues(self, expected, actual):
+		self.assertEqual(expected.state, actual.state)
+
+		# running totals can only differ by accumulated float errors
+		scale = max(1.0, sum(abs(qty * rate) for qty, rate in expected.state))
+		for expected_total, actual_total in zip(
+			expected.get_total_stock_and_value(), actual.get_total_stock_and_value(), strict=True
+		):
+			self.assertAlmostEqual(expected_total, actual_total, delta=scale * 1e-9)
+
+	def test_head_consumption(self):
+		queue = CompactFIFOValuation([])
+		for rate in range(1, 11):
+			queue.add_stock(1, rate)
+
+		consumed = queue.remove_stock(7)
+		self.assertEqual(consumed, [[1, rate] for rate in range(1, 8)])
+		self.assertEqual(queue.get_total_stock_and_value(), (3, 27))
+		self.assertEqual(queue.state, [[1, 8], [1, 9], [1, 10]])
+
+	def test_live_state_is_not_compacted(self):
+		state = [[1, 10], [2, 20], [3, 30]]
+		queue = CompactFIFOValuation(state)
+		queue.remove_stock(1)
+
+		self.assertEqual(queue.live_state, [[2, 20], [3, 30]])
+		self.assertEqual(queue.head, 1)
+		self.assertIs(queue.bins, state)
+
+	def test_consume_till_negative(self):
+		queue = CompactFIFOValuation([[1, 10], [2, 20]])
+		queue.remove_stock(5)
+		self.assertEqual(queue.state, [[-2, 20]])
+		self.assertEqual(queue.get_total_stock_and_value(), (-2, -40))
+
+	def test_state_is_reused(self):
+		state = [[1, 10], [2, 20]]
+		queue = CompactFIFOValuation(state)
+		queue.remove_stock(1)
+		queue.add_stock(1, 30)
+		self.assertIs(queue.state, state)
+		self.assertEqual(state, [[2, 20], [1, 30]])
+
+	@given(stock_queue_generator, st.floats(min_value=0, max_value=1e6))
+	def test_compact_fifo_matches_fifo_hypothesis(self, stock_queue, outgoing_rate):
+		expected = FIFOValuation([])
+		actual = CompactFIFOValuation([])
+
+		for qty, rate in stock_queue:
+			if round_off_if_near_zero(qty) == 0:
+				continue
+			if qty > 0:
+				expected.add_stock(qty, rate)
+				actual.add_stock(qty, rate)
+			else:
+				self.assertEqual(
+					expected.remove_stock(abs(qty), outgoing_rate),
+					actual.remove_stock(abs(qty), outgoing_rate),
+				)
+			self.assertSameQueues(expected, actual)
+
+
+class TestStockQueueSerialization(unittest.TestCase):
+	def test_small_queues_are_not_compressed(self):
+		queue = [[1, 10], [2, 20]]
+		self.assertEqual(dump_stock_queue(queue, compress=True), json.dumps(queue))
+
+	def test_compressed_queue_roundtrip(self):
+		queue = [[i, i * 10.5] for i in range(1, 1000)]
+
+		compressed = dump_stock_queue(queue, compress=True)
+		self.assertLess(len(compressed), len(json.dumps(queue)))
+		self.assertEqual(load_stock_queue(compressed), queue)
+
+	def test_load_legacy_queue(self):
+		self.assertEqual(load_stock_queue("[[1, 10]]"), [[1, 10]])
+		self.assertEqual(load_stock_queue(None), [])
+		self.assertEqual(load_stock_queue(""), [])
+
+
 class TestLIFOValuation(unittest.TestCase):
 	def setUp(self):
 		self.stack = LIFOValuation([])
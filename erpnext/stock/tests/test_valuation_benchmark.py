@@ -0,0 +1,64 @@
+import time
+import unittest
+
+from erpnext.stock.valuation import CompactFIFOValuation, FIFOValuation
+from erpnext.tests.utils import benchmark
+
+OPERATIONS = 1_000_000
+QUEUE_DEPTH = 10_000
+
+
+@benchmark
+class TestValuationBenchmark(unittest.TestCase):
+	"""Micro-benchmarks for bin wise valuation queues, run with ERPNEXT_RUN_BENCHMARKS set.
+
+	The compact queue is asserted to end in the same state as the list based queue."""
+
+	def run_operations(self, queue, operations):
+		"""Alternate between building a deep queue and draining it one unit at a time."""
+		done = 0
+		while done < operations:
+			for rate in range(1, QUEUE_DEPTH + 1):
+				queue.add_stock(1, rate)
+			for _ in range(QUEUE_DEPTH):
+				queue.remove_stock(1)
+			done += 2 * QUEUE_DEPTH
+
+	def run_ledger_entries(self, queue, entries):
+		"""Issue and receive one unit per entry on a deep queue, reading its totals before and after
+		each entry like `update_entries_after.update_queue_values`."""
+		start = time.perf_counter()
+
+		for rate in range(entries):
+			queue.get_total_stock_and_value()
+			if rate % 2:
+				queue.add_stock(1, rate)
+			else:
+				queue.remove_stock(1)
+			queue.get_total_stock_and_value()
+
+		return time.perf_counter() - start
+
+	def test_compare_with_fifo(self):
+		state = [[1, rate] for rate in range(1, QUEUE_DEPTH + 1)]
+		fifo_queue = FIFOValuation([list(stock_bin) for stock_bin in state])
+		compact_fifo_queue = CompactFIFOValuation([list(stock_bin) for stock_bin in state])
+
+		fifo_time = self.run_ledger_entries(fifo_queue, OPERATIONS // 100)
+		compact_fifo_time = self.run_ledger_entries(compact_fifo_queue, OPERATIONS // 100)
+
+		self.assertEqual(compact_fifo_queue.state, fifo_queue.state)
+		self.assertEqual(
+			compact_fifo_queue.get_total_stock_and_value(), fifo_queue.get_total_stock_and_value()
+		)
+		self.assertLess(compact_fifo_time, fifo_time)
+
+	def test_compact_fifo_add_remove(self):
+		fifo_queue = FIFOValuation([])
+		compact_fifo_queue = CompactFIFOValuation([])
+
+		self.run_operations(fifo_queue, OPERATIONS // 10)
+		self.run_operations(compact_fifo_queue, OPERATIONS)
+
+		self.assertEqual(compact_fifo_queue.get_total_stock_and_value(), (0.0, 0.0))
+		self.assertEqual(compact_fifo_queue.state, fifo_queue.state)
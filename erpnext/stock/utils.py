@@ -11,7 +11,7 @@ from frappe.utils import cstr, flt, get_link_to_form, get_time, getdate, nowdate
 
 import erpnext
 from erpnext.stock.doctype.warehouse.warehouse import get_child_warehouses
-from erpnext.stock.valuation import FIFOValuation, LIFOValuation
+from erpnext.stock.valuation import FIFOValuation, LIFOValuation, load_stock_queue
 
 BarcodeScanResult = dict[str, str | None]
 
@@ -289,7 +289,7 @@ def get_incoming_rate(args, raise_error_if_no_rate=True):
 		previous_sle = get_previous_sle(args)
 		if valuation_method in ("FIFO", "LIFO"):
 			if previous_sle:
-				previous_stock_queue = json.loads(previous_sle.get("stock_queue", "[]") or "[]")
+				previous_stock_queue = load_stock_queue(previous_sle.get("stock_queue"))
 				in_rate = (
 					_get_fifo_lifo_rate(previous_stock_queue, args.get("qty") or 0, valuation_method)
 					if previous_stock_queue
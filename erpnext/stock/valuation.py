@@ -1,3 +1,6 @@
+import base64
+import json
+import zlib
 from abc import ABC, abstractmethod, abstractproperty
 from collections.abc import Callable
 from typing import NewType
@@ -10,6 +13,10 @@ StockBin = NewType("StockBin", list[float])  # [[qty, rate], ...]
 QTY = 0
 RATE = 1
 
+# Serialized stock queues longer than this are compressed, if enabled.
+COMPRESSED_QUEUE_PREFIX = "z:"
+COMPRESS_QUEUE_ABOVE = 256
+
 
 class BinWiseValuation(ABC):
 	@abstractmethod
@@ -151,6 +158,168 @@ class FIFOValuation(BinWiseValuation):
 		return consumed_bins
 
 
+class CompactFIFOValuation(BinWiseValuation):
+	"""FIFO valuation with O(1) amortized consumption from the head of the queue.
+
+	Behaves exactly like `FIFOValuation` but consumed bins are skipped using a head offset
+	instead of being popped from the front of the list, and running totals of qty and value
+	are maintained so `get_total_stock_and_value` doesn't have to walk the queue.
+
+	The underlying list is compacted lazily, when more than half of it is consumed or when
+	`state` is accessed, so that the state can be reused across multiple transactions.
+	`live_state` reads the bins without compacting them.
+	"""
+
+	__slots__ = ["bins", "head", "total_qty", "total_value"]
+
+	def __init__(self, state: list[StockBin] | None):
+		self.bins: list[StockBin] = state if state is not None else []
+		self.head = 0
+		self.resync_totals()
+
+	@property
+	def state(self) -> list[StockBin]:
+		"""Get current state of queue."""
+		self.compact()
+		return self.bins
+
+	@property
+	def live_state(self) -> list[StockBin]:
+		"""Bins from the head of the queue, without compacting it."""
+		return self.bins[self.head :]
+
+	def __len__(self):
+		return len(self.bins) - self.head
+
+	def resync_totals(self) -> None:
+		"""Recompute running totals from the bins, discards accumulated float errors."""
+		self.total_qty = 0.0
+		self.total_value = 0.0
+
+		for idx in range(self.head, len(self.bins)):
+			qty, rate = self.bins[idx]
+			self.total_qty += flt(qty)
+			self.total_value += flt(qty) * flt(rate)
+
+	def compact(self) -> None:
+		if self.head:
+			del self.bins[: self.head]
+			self.head = 0
+			self.resync_totals()
+
+	def get_total_stock_and_value(self) -> tuple[float, float]:
+		return round_off_if_near_zero(self.total_qty), round_off_if_near_zero(self.total_value)
+
+	def append_bin(self, qty: float, rate: float) -> None:
+		self.bins.append([qty, rate])
+		self.total_qty += flt(qty)
+		self.total_value += flt(qty) * flt(rate)
+
+	def set_bin(self, index: int, qty: float, rate: float) -> None:
+		"""Replace bin at absolute `index` while keeping totals in sync."""
+		stock_bin = self.bins[index]
+		self.total_qty += flt(qty) - flt(stock_bin[QTY])
+		self.total_value += flt(qty) * flt(rate) - flt(stock_bin[QTY]) * flt(stock_bin[RATE])
+		stock_bin[QTY] = qty
+		stock_bin[RATE] = rate
+
+	def pop_bin(self, index: int) -> StockBin:
+		"""Remove bin at absolute `index`, O(1) when removing from the head."""
+		if index == self.head:
+			stock_bin = self.bins[index]
+			self.head += 1
+		else:
+			stock_bin = self.bins.pop(index)
+
+		self.total_qty -= flt(stock_bin[QTY])
+		self.total_value -= flt(stock_bin[QTY]) * flt(stock_bin[RATE])
+
+		if self.head == len(self.bins):
+			self.bins.clear()
+			self.head = 0
+			self.total_qty = self.total_value = 0.0
+		elif self.head > len(self.bins) // 2:
+			self.compact()
+
+		return stock_bin
+
+	def add_stock(self, qty: float, rate: float) -> None:
+		"""Update fifo queue with new stock.
+
+		args:
+		        qty: new quantity to add
+		        rate: incoming rate of new quantity"""
+
+		if not len(self):
+			self.append_bin(0, 0)
+
+		last_bin = self.bins[-1]
+
+		# last row has the same rate, merge new bin.
+		if last_bin[RATE] == rate:
+			self.set_bin(-1, last_bin[QTY] + qty, rate)
+		else:
+			# Item has a positive balance qty, add new entry
+			if last_bin[QTY] > 0:
+				self.append_bin(qty, rate)
+			else:  # negative balance qty
+				qty = last_bin[QTY] + qty
+				if qty > 0:  # new balance qty is positive
+					self.set_bin(-1, qty, rate)
+				else:  # new balance qty is still negative, maintain same rate
+					self.set_bin(-1, qty, last_bin[RATE])
+
+	def remove_stock(
+		self, qty: float, outgoing_rate: float = 0.0, rate_generator: Callable[[], float] | None = None
+	) -> list[StockBin]:
+		"""Remove stock from the queue and return popped bins.
+
+		args:
+		        qty: quantity to remove
+		        rate: outgoing rate
+		        rate_generator: function to be called if queue is not found and rate is required.
+		"""
+		if not rate_generator:
+			rate_generator = lambda: 0.0  # noqa
+
+		consumed_bins = []
+		while qty:
+			if not len(self):
+				# rely on rate generator.
+				self.append_bin(0, rate_generator())
+
+			index = self.head
+			if outgoing_rate > 0:
+				# Find the entry where rate matched with outgoing rate,
+				# if no entry found with outgoing rate, consume as per FIFO
+				for idx in range(self.head, len(self.bins)):
+					if self.bins[idx][RATE] == outgoing_rate:
+						index = idx
+						break
+
+			# select first bin or the bin with same rate
+			fifo_bin = self.bins[index]
+			if qty >= fifo_bin[QTY]:
+				# consume current bin
+				qty = round_off_if_near_zero(qty - fifo_bin[QTY])
+				to_consume = self.pop_bin(index)
+				consumed_bins.append(list(to_consume))
+
+				if not len(self) and qty:
+					# stock finished, qty still remains to be withdrawn
+					# negative stock, keep in as a negative bin
+					self.append_bin(-qty, outgoing_rate or to_consume[RATE])
+					consumed_bins.append([qty, outgoing_rate or to_consume[RATE]])
+					break
+			else:
+				# qty found in current bin consume it and exit
+				self.set_bin(index, round_off_if_near_zero(fifo_bin[QTY] - qty), fifo_bin[RATE])
+				consumed_bins.append([qty, fifo_bin[RATE]])
+				qty = 0
+
+		return consumed_bins
+
+
 class LIFOValuation(BinWiseValuation):
 	"""Valuation method where a *stack* of all the incoming stock is maintained.
 
@@ -253,3 +422,27 @@ def round_off_if_near_zero(number: float, precision: int = 7) -> float:
 		return 0.0
 
 	return flt(number)
+
+
+def dump_stock_queue(stock_queue: list[StockBin], compress: bool = False) -> str:
+	"""Serialize stock queue for storing it on Stock Ledger Entry.
+
+	Deep queues are stored as base64 encoded zlib compressed JSON when `compress` is set,
+	`load_stock_queue` reads both the formats so existing entries stay readable."""
+	serialized = json.dumps(stock_queue)
+	if not compress or len(serialized) <= COMPRESS_QUEUE_ABOVE:
+		return serialized
+
+	compact = json.dumps(stock_queue, separators=(",", ":")).encode()
+	return COMPRESSED_QUEUE_PREFIX + base64.b64encode(zlib.compress(compact)).decode()
+
+
+def load_stock_queue(serialized: str | None) -> list[StockBin]:
+	"""Deserialize stock queue stored by `dump_stock_queue`."""
+	if not serialized:
+		return []
+
+	if serialized.startswith(COMPRESSED_QUEUE_PREFIX):
+		serialized = zlib.decompress(base64.b64decode(serialized[len(COMPRESSED_QUEUE_PREFIX) :]))
+
+	return json.loads(serialized)
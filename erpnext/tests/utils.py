@@ -1,6 +1,8 @@
 # Copyright (c) 2021, Frappe Technologies Pvt. Ltd. and Contributors
 # License: GNU General Public License v3. See license.txt
 
+import os
+import unittest
 from typing import Any, NewType
 
 import frappe
@@ -9,6 +11,16 @@ from frappe.core.doctype.report.report import get_report_module_dotted_path
 ReportFilters = dict[str, Any]
 ReportName = NewType("ReportName", str)
 
+# benchmarks build large volumes of data, they only run when this environment variable is set
+RUN_BENCHMARKS_ENV = "ERPNEXT_RUN_BENCHMARKS"
+
+
+def benchmark(test_item):
+	"Skip the benchmark test case or method unless `ERPNEXT_RUN_BENCHMARKS` is set"
+	return unittest.skipUnless(
+		os.environ.get(RUN_BENCHMARKS_ENV), f"set {RUN_BENCHMARKS_ENV} to run benchmarks"
+	)(test_item)
+
 
 def create_test_contact_and_address():
 	frappe.db.sql("delete from tabContact")
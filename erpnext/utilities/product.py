@@ -92,26 +92,65 @@ def qty_from_all_warehouses(batch_info):
 
 
 def get_price(item_code, price_list, customer_group, company, qty=1):
+	return get_prices([item_code], price_list, customer_group, company, qty=qty).get(item_code)
+
+
+def get_prices(item_codes, price_list, customer_group, company, qty=1):
+	"""Website prices of the items with pricing rules applied, as a dict of item code and price.
+
+	Item Prices, variant templates and sales UOM conversion factors are fetched for all the items
+	at once, for product listings."""
 	from erpnext.e_commerce.shopping_cart.cart import get_party
 
-	template_item_code = frappe.db.get_value("Item", item_code, "variant_of")
+	prices = {}
+	if not price_list or not item_codes:
+		return prices
 
-	if price_list:
-		price = frappe.get_all(
-			"Item Price",
-			fields=["price_list_rate", "currency"],
-			filters={"price_list": price_list, "item_code": item_code},
+	template_item_codes = dict(
+		frappe.get_all(
+			"Item",
+			filters={"name": ("in", item_codes)},
+			fields=["name", "variant_of"],
+			as_list=True,
 		)
+	)
+
+	item_prices = {}
+	for d in frappe.get_all(
+		"Item Price",
+		fields=["item_code", "price_list_rate", "currency"],
+		filters={
+			"price_list": price_list,
+			"item_code": ("in", list({*item_codes, *filter(None, template_item_codes.values())})),
+		},
+		order_by="modified desc",
+	):
+		item_prices.setdefault(d.item_code, []).append(
+			frappe._dict({"price_list_rate": d.price_list_rate, "currency": d.currency})
+		)
+
+	uom_conversion_factors = {}
+	for item, conversion_factor in frappe.db.sql(
+		"""select	I.name, C.conversion_factor
+		from `tabUOM Conversion Detail` C
+		inner join `tabItem` I on C.parent = I.name and C.uom = I.sales_uom
+		where I.name in %s""",
+		[tuple(item_codes)],
+	):
+		uom_conversion_factors.setdefault(item, conversion_factor)
 
+	party = None
+	if item_prices:
+		party = get_party()
+
+	for item_code in item_codes:
+		template_item_code = template_item_codes.get(item_code)
+
+		price = item_prices.get(item_code)
 		if template_item_code and not price:
-			price = frappe.get_all(
-				"Item Price",
-				fields=["price_list_rate", "currency"],
-				filters={"price_list": price_list, "item_code": template_item_code},
-			)
+			price = item_prices.get(template_item_code)
 
 		if price:
-			party = get_party()
 			pricing_rule_dict = frappe._dict(
 				{
 					"item_code": item_code,
@@ -123,7 +162,7 @@ def get_price(item_code, price_list, customer_group, company, qty=1):
 					"company": company,
 					"conversion_rate": 1,
 					"for_shopping_cart": True,
-					"currency": frappe.db.get_value("Price List", price_list, "currency"),
+					"currency": frappe.db.get_value("Price List", price_list, "currency", cache=True),
 					"doctype": "Quotation",
 				}
 			)
@@ -132,7 +171,8 @@ def get_price(item_code, price_list, customer_group, company, qty=1):
 				pricing_rule_dict.update({"customer": party.name})
 
 			pricing_rule = get_pricing_rule_for_item(pricing_rule_dict)
-			price_obj = price[0]
+			# copy, the same template price is shared between variants
+			price_obj = frappe._dict(price[0])
 
 			if pricing_rule:
 				# price without any rules applied
@@ -169,15 +209,7 @@ def get_price(item_code, price_list, customer_group, company, qty=1):
 					or ""
 				)
 
-				uom_conversion_factor = frappe.db.sql(
-					"""select	C.conversion_factor
-					from `tabUOM Conversion Detail` C
-					inner join `tabItem` I on C.parent = I.name and C.uom = I.sales_uom
-					where I.name = %s""",
-					item_code,
-				)
-
-				uom_conversion_factor = uom_conversion_factor[0][0] if uom_conversion_factor else 1
+				uom_conversion_factor = uom_conversion_factors.get(item_code) or 1
 				price_obj["formatted_price_sales_uom"] = fmt_money(
 					price_obj["price_list_rate"] * uom_conversion_factor, currency=price_obj["currency"]
 				)
@@ -191,7 +223,9 @@ def get_price(item_code, price_list, customer_group, company, qty=1):
 				if not price_obj["formatted_price"]:
 					price_obj["formatted_price"], price_obj["formatted_mrp"] = "", ""
 
-			return price_obj
+			prices[item_code] = price_obj
+
+	return prices
 
 
 def get_non_stock_item_status(item_code, item_warehouse_field):